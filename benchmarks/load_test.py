@@ -0,0 +1,231 @@
+"""
+코드 실행/제출 경로 부하 테스트
+
+N명의 가상 학생이 워크로드 구성(--mix)에 따라 코드를 실행하거나 제출하며,
+지연 시간 분포(p50/p95/p99), 처리량(runs/sec), 오류율을 JSON으로 보고합니다.
+기준 결과(--baseline)를 주면 비교하여 성능 저하가 있으면 종료 코드 1을 반환합니다.
+
+사용 예:
+    # 코드 러너 직접 호출
+    python benchmarks/load_test.py --target runner --url http://localhost:8080
+
+    # Flask 제출 경로 (채점 포함) 측정 후 기준 결과로 저장
+    python benchmarks/load_test.py --target submit --url http://localhost:5000 \\
+        --concurrency 20 --duration 60 --output baseline.json
+
+    # 기준 결과와 비교
+    python benchmarks/load_test.py --target runner --baseline baseline.json
+"""
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+import requests
+
+from report import Sample, build_report, compare
+from workloads import DEFAULT_MIX, WORKLOADS, Workload, classify, expand_mix, parse_mix
+
+TARGETS = ('runner', 'execute', 'submit')
+
+# 제출 채점 결과를 기다릴 때의 폴링 간격과 최대 대기 시간 (초)
+SUBMIT_POLL_INTERVAL = 0.2
+SUBMIT_MAX_WAIT = 120
+
+# 요청 하나를 보내고 결과 분류(outcome)를 반환하는 함수
+Sender = Callable[[requests.Session, Workload, str], str]
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='코드 실행 경로 부하 테스트')
+    parser.add_argument('--target', choices=TARGETS, default='runner',
+                        help='runner: 코드 러너 /execute, execute: Flask 코드 실행, submit: Flask 제출 및 채점')
+    parser.add_argument('--url', default=None, help='대상 서비스 주소 (기본: runner는 :8080, 그 외 :5000)')
+    parser.add_argument('--concurrency', type=int, default=10, help='동시에 요청하는 가상 학생 수')
+    parser.add_argument('--duration', type=float, default=30, help='측정 시간 (초)')
+    parser.add_argument('--warmup', type=float, default=5, help='집계에서 제외할 시작 구간 (초)')
+    parser.add_argument('--mix', default=DEFAULT_MIX, help=f'워크로드 구성 (기본: {DEFAULT_MIX})')
+    parser.add_argument('--think-time', type=float, default=0, help='학생별 요청 사이 대기 시간 (초)')
+    parser.add_argument('--timeout', type=int, default=10, help='runner 대상의 기본 실행 타임아웃 (초)')
+    parser.add_argument('--seed', type=int, default=42, help='워크로드 선택 난수 시드')
+    parser.add_argument('--allow-cache', action='store_true',
+                        help='실행 결과 캐시 허용 (기본은 요청마다 코드를 달리해 캐시를 우회)')
+    parser.add_argument('--username', default='student1', help='Flask 대상 로그인 사용자')
+    parser.add_argument('--password', default='student123', help='Flask 대상 로그인 비밀번호')
+    parser.add_argument('--problem-id', type=int, default=1, help='submit 대상의 문제 ID')
+    parser.add_argument('--output', help='결과 JSON 저장 경로 (기본: 표준 출력)')
+    parser.add_argument('--baseline', help='비교할 기준 결과 JSON 경로')
+    parser.add_argument('--max-regression', type=float, default=0.2,
+                        help='성능 저하로 판단할 변화율 (기본 0.2 = 20%%)')
+    return parser.parse_args(argv)
+
+
+def login(url: str, username: str, password: str) -> str:
+    """Flask 앱에 로그인하여 액세스 토큰 발급"""
+    response = requests.post(f'{url}/api/auth/login',
+                             json={'username': username, 'password': password}, timeout=10)
+    response.raise_for_status()
+    return response.json()['data']['access_token']
+
+
+def make_sender(args: argparse.Namespace, url: str) -> Sender:
+    """대상별 요청 함수 생성"""
+    if args.target == 'runner':
+        def send_runner(session: requests.Session, workload: Workload, code: str) -> str:
+            timeout = workload.timeout or args.timeout
+            response = session.post(f'{url}/execute', timeout=timeout + 30, json={
+                'code': code,
+                'timeout': timeout,
+                'cache': args.allow_cache
+            })
+            if response.status_code != 200:
+                return 'http_error'
+            return classify(response.json())
+        return send_runner
+
+    headers = {'Authorization': f'Bearer {login(url, args.username, args.password)}'}
+
+    if args.target == 'execute':
+        def send_execute(session: requests.Session, workload: Workload, code: str) -> str:
+            response = session.post(f'{url}/api/submissions/execute', headers=headers,
+                                    json={'code': code}, timeout=120)
+            if response.status_code != 200:
+                return 'http_error'
+            return classify(response.json()['data'])
+        return send_execute
+
+    def send_submit(session: requests.Session, workload: Workload, code: str) -> str:
+        response = session.post(f'{url}/api/submissions', headers=headers,
+                                json={'code': code, 'problem_id': args.problem_id}, timeout=120)
+        if response.status_code not in (201, 202):
+            return 'http_error'
+
+        submission = response.json()['data']['submission']
+        deadline = time.monotonic() + SUBMIT_MAX_WAIT
+        while submission['status'] in ('queued', 'running'):
+            if time.monotonic() > deadline:
+                return 'timeout'
+            time.sleep(SUBMIT_POLL_INTERVAL)
+            detail = session.get(f'{url}/api/submissions/{submission["id"]}', headers=headers, timeout=30)
+            if detail.status_code != 200:
+                return 'http_error'
+            submission = detail.json()['data']
+
+        if '시간 초과' in (submission.get('error') or ''):
+            return 'timeout'
+        return 'success' if submission['status'] == 'success' else 'error'
+    return send_submit
+
+
+def run_student(sender: Sender, names: List[str], rng: random.Random, think_time: float,
+                allow_cache: bool, stop_at: float, samples: List[Tuple[float, Sample]],
+                lock: threading.Lock) -> None:
+    """가상 학생 한 명의 요청 루프 (브라우저처럼 keep-alive 세션 사용)"""
+    session = requests.Session()
+
+    while time.monotonic() < stop_at:
+        workload = WORKLOADS[rng.choice(names)]
+        # 학생마다 코드가 조금씩 다르므로 기본적으로 캐시를 우회
+        code = workload.code if allow_cache else f'{workload.code}\n# {uuid.uuid4().hex}'
+
+        started = time.monotonic()
+        try:
+            outcome = sender(session, workload, code)
+        except (requests.exceptions.RequestException, ValueError, KeyError):
+            outcome = 'transport_error'
+        latency = time.monotonic() - started
+
+        sample = Sample(workload.name, latency, outcome, ok=outcome == workload.expect)
+        with lock:
+            samples.append((started, sample))
+
+        if think_time:
+            time.sleep(think_time)
+
+
+def run_benchmark(args: argparse.Namespace) -> Dict:
+    """부하를 걸고 결과 보고서 생성"""
+    url = (args.url or ('http://localhost:8080' if args.target == 'runner' else 'http://localhost:5000')).rstrip('/')
+    names = expand_mix(parse_mix(args.mix))
+    sender = make_sender(args, url)
+
+    samples: List[Tuple[float, Sample]] = []
+    lock = threading.Lock()
+    started = time.monotonic()
+    measure_from = started + args.warmup
+    stop_at = measure_from + args.duration
+
+    threads = [
+        threading.Thread(
+            target=run_student,
+            args=(sender, names, random.Random(args.seed + i), args.think_time,
+                  args.allow_cache, stop_at, samples, lock),
+            daemon=True
+        )
+        for i in range(args.concurrency)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # 워밍업 구간에 시작한 요청은 제외
+    measured = [sample for start, sample in samples if start >= measure_from]
+    elapsed = max(time.monotonic(), stop_at) - measure_from
+
+    meta = {
+        'target': args.target,
+        'url': url,
+        'concurrency': args.concurrency,
+        'duration_seconds': args.duration,
+        'warmup_seconds': args.warmup,
+        'mix': args.mix,
+        'seed': args.seed,
+        'allow_cache': args.allow_cache,
+        'started_at': datetime.now().isoformat(timespec='seconds')
+    }
+    return build_report(measured, elapsed, meta)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+
+    try:
+        report = run_benchmark(args)
+    except ValueError as e:
+        print(f'설정 오류: {e}', file=sys.stderr)
+        return 2
+    except requests.exceptions.RequestException as e:
+        print(f'대상 서비스에 연결할 수 없습니다: {e}', file=sys.stderr)
+        return 2
+
+    exit_code = 0
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            report['comparison'] = compare(report, json.load(f), args.max_regression)
+        if not report['comparison']['passed']:
+            exit_code = 1
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+
+    if 'comparison' in report:
+        for warning in report['comparison']['warnings']:
+            print(f'경고: {warning}', file=sys.stderr)
+        for regression in report['comparison']['regressions']:
+            print(f"성능 저하: {regression['metric']} {regression['baseline']} -> {regression['current']}",
+                  file=sys.stderr)
+    return exit_code
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,130 @@
+"""
+부하 테스트 결과 집계 및 기준 결과(baseline) 비교
+"""
+import math
+import statistics
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import Dict, Any, List
+
+# 기준 결과와 같아야 비교가 의미 있는 실행 조건
+COMPARED_META = ('target', 'concurrency', 'mix', 'allow_cache')
+
+
+@dataclass
+class Sample:
+    """요청 하나의 측정 결과"""
+    workload: str
+    latency: float
+    # success / error / timeout / http_error / transport_error
+    outcome: str
+    ok: bool
+
+
+def percentile(sorted_values: List[float], ratio: float) -> float:
+    """정렬된 값에서 nearest-rank 방식의 백분위수"""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[max(0, math.ceil(ratio * len(sorted_values)) - 1)]
+
+
+def summarize(samples: List[Sample], elapsed: float) -> Dict[str, Any]:
+    """요청 수, 처리량, 오류율, 지연 시간 분포 계산"""
+    latencies = sorted(sample.latency * 1000 for sample in samples)
+    errors = sum(1 for sample in samples if not sample.ok)
+
+    return {
+        'requests': len(samples),
+        'ok': len(samples) - errors,
+        'errors': errors,
+        'error_rate': round(errors / len(samples), 4) if samples else 0.0,
+        'runs_per_sec': round(len(samples) / elapsed, 2) if elapsed > 0 else 0.0,
+        'latency_ms': {
+            'mean': round(statistics.mean(latencies), 2) if latencies else 0.0,
+            'p50': round(percentile(latencies, 0.50), 2),
+            'p95': round(percentile(latencies, 0.95), 2),
+            'p99': round(percentile(latencies, 0.99), 2),
+            'max': round(latencies[-1], 2) if latencies else 0.0
+        },
+        'outcomes': dict(Counter(sample.outcome for sample in samples))
+    }
+
+
+def build_report(samples: List[Sample], elapsed: float, meta: Dict[str, Any]) -> Dict[str, Any]:
+    """전체 및 워크로드별 결과 보고서"""
+    by_workload: Dict[str, List[Sample]] = defaultdict(list)
+    for sample in samples:
+        by_workload[sample.workload].append(sample)
+
+    return {
+        'meta': dict(meta, elapsed_seconds=round(elapsed, 2)),
+        'overall': summarize(samples, elapsed),
+        'workloads': {
+            name: summarize(group, elapsed) for name, group in sorted(by_workload.items())
+        }
+    }
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any],
+            max_regression: float) -> Dict[str, Any]:
+    """
+    기준 결과와 비교하여 성능 저하 항목 찾기
+
+    지연 시간(p50/p95/p99)이 max_regression 비율 이상 늘거나, 처리량이 그만큼
+    줄거나, 오류율이 1%p 이상 늘어난 항목을 성능 저하로 판단합니다.
+    """
+    # 조건이 다른 결과끼리의 비교는 의미가 없으므로 경고
+    warnings = [
+        f'{key} 설정이 기준 결과와 다릅니다: {baseline.get("meta", {}).get(key)} -> {report["meta"].get(key)}'
+        for key in COMPARED_META
+        if baseline.get('meta', {}).get(key) != report['meta'].get(key)
+    ]
+
+    regressions = []
+    sections = [('overall', report['overall'], baseline.get('overall'))]
+    sections += [
+        (f'workloads.{name}', stats, baseline.get('workloads', {}).get(name))
+        for name, stats in report['workloads'].items()
+    ]
+
+    for section, current, previous in sections:
+        if not previous:
+            continue
+
+        for key in ('p50', 'p95', 'p99'):
+            before = previous['latency_ms'][key]
+            after = current['latency_ms'][key]
+            if before > 0 and (after - before) / before > max_regression:
+                regressions.append({
+                    'metric': f'{section}.latency_ms.{key}',
+                    'baseline': before,
+                    'current': after,
+                    'change': round((after - before) / before, 4)
+                })
+
+        before = previous['runs_per_sec']
+        after = current['runs_per_sec']
+        if section == 'overall' and before > 0 and (before - after) / before > max_regression:
+            regressions.append({
+                'metric': f'{section}.runs_per_sec',
+                'baseline': before,
+                'current': after,
+                'change': round((after - before) / before, 4)
+            })
+
+        before = previous['error_rate']
+        after = current['error_rate']
+        if after - before > 0.01:
+            regressions.append({
+                'metric': f'{section}.error_rate',
+                'baseline': before,
+                'current': after,
+                'change': round(after - before, 4)
+            })
+
+    return {
+        'max_regression': max_regression,
+        'regressions': regressions,
+        'warnings': warnings,
+        'passed': not regressions
+    }
@@ -0,0 +1,90 @@
+"""
+부하 테스트 워크로드 정의
+
+각 워크로드는 학생이 실제로 제출할 법한 코드 유형 하나를 나타내며,
+기대 결과(expect)와 다르게 끝난 실행은 오류로 집계됩니다.
+"""
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+
+@dataclass(frozen=True)
+class Workload:
+    """벤치마크 워크로드"""
+    name: str
+    code: str
+    # 기대 결과: success(정상 종료), error(실행 오류), timeout(시간 초과)
+    expect: str
+    timeout: Optional[int] = None
+
+
+WORKLOADS: Dict[str, Workload] = {
+    workload.name: workload for workload in [
+        Workload(
+            name='hello',
+            code='print("Hello, World!")',
+            expect='success'
+        ),
+        Workload(
+            name='cpu',
+            code='total = 0\nfor i in range(3_000_000):\n    total += i * i\nprint(total)',
+            expect='success'
+        ),
+        Workload(
+            name='print',
+            code='for i in range(20000):\n    print(i, "반복 출력 테스트")',
+            expect='success'
+        ),
+        Workload(
+            name='timeout',
+            code='while True:\n    pass',
+            expect='timeout',
+            timeout=2
+        ),
+        Workload(
+            name='memory',
+            code='data = [0] * (10 ** 9)\nprint(len(data))',
+            expect='error'
+        ),
+    ]
+}
+
+# 기본 워크로드 구성 (이름=가중치)
+DEFAULT_MIX = 'hello=6,cpu=2,print=2,timeout=1,memory=1'
+
+
+def parse_mix(mix: str) -> Dict[str, int]:
+    """
+    'hello=5,cpu=2' 형태의 워크로드 구성 해석
+
+    Raises:
+        ValueError: 알 수 없는 워크로드거나 가중치가 잘못된 경우
+    """
+    weights = {}
+    for part in mix.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        name, _, weight = part.partition('=')
+        name = name.strip()
+        if name not in WORKLOADS:
+            raise ValueError(f'알 수 없는 워크로드입니다: {name} (사용 가능: {", ".join(WORKLOADS)})')
+        weights[name] = int(weight) if weight else 1
+        if weights[name] < 0:
+            raise ValueError(f'가중치는 0 이상이어야 합니다: {part}')
+
+    if not any(weights.values()):
+        raise ValueError('실행할 워크로드가 없습니다')
+    return weights
+
+
+def classify(result: Dict) -> str:
+    """실행 결과를 success / error / timeout 중 하나로 분류"""
+    if result.get('timed_out'):
+        return 'timeout'
+    return 'success' if result.get('success') else 'error'
+
+
+def expand_mix(weights: Dict[str, int]) -> List[str]:
+    """가중치만큼 워크로드 이름을 반복한 목록 (무작위 선택용)"""
+    return [name for name, weight in weights.items() for _ in range(weight)]
@@ -0,0 +1,105 @@
+"""
+코드 실행 동시성 제한 및 대기열 관리
+"""
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Dict, Any, Optional
+
+
+class ServerBusyError(Exception):
+    """대기열이 가득 차서 실행 요청을 받을 수 없음"""
+
+
+class AdmissionController:
+    """
+    세마포어 기반 동시 실행 제한
+
+    동시에 실행되는 프로세스 수를 max_concurrent로 제한하고, 슬롯을 기다리는
+    요청이 max_queued를 넘으면 대기하지 않고 즉시 ServerBusyError를 발생시킵니다.
+    대기열에 들어간 요청도 max_wait_seconds 안에 슬롯을 얻지 못하면
+    ServerBusyError로 끝나므로, 클라이언트가 이미 포기한 요청을 나중에 실행하지
+    않습니다 (0이면 무기한 대기).
+    """
+
+    def __init__(self, max_concurrent: int, max_queued: int, max_wait_seconds: float = 0):
+        self.max_concurrent = max_concurrent
+        self.max_queued = max_queued
+        self.max_wait_seconds = max_wait_seconds
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._active = 0
+        self._waiting = 0
+        self._admitted = 0
+        self._rejected = 0
+        self._timed_out = 0
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        # 실행 중인 이벤트 루프에 바인딩되도록 처음 사용할 때 생성
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+        return self._semaphore
+
+    def check_capacity(self, count: int = 1) -> None:
+        """
+        count개의 요청을 추가로 받을 수 있는지 확인
+
+        Raises:
+            ServerBusyError: 대기열 여유가 부족한 경우
+        """
+        free_slots = max(0, self.max_concurrent - self._active)
+        if self._waiting + count - free_slots > self.max_queued:
+            self._rejected += count
+            raise ServerBusyError('코드 실행 요청이 많아 잠시 후 다시 시도해주세요')
+
+    @asynccontextmanager
+    async def slot(self):
+        """
+        실행 슬롯 획득 (대기열이 가득 차면 ServerBusyError)
+        """
+        self.check_capacity()
+        await self._enter()
+        try:
+            yield
+        finally:
+            self._leave()
+
+    @asynccontextmanager
+    async def reserved_slot(self):
+        """check_capacity로 이미 수용이 확인된 요청의 실행 슬롯 획득"""
+        await self._enter()
+        try:
+            yield
+        finally:
+            self._leave()
+
+    async def _enter(self) -> None:
+        self._waiting += 1
+        try:
+            if self.max_wait_seconds > 0:
+                await asyncio.wait_for(self.semaphore.acquire(), self.max_wait_seconds)
+            else:
+                await self.semaphore.acquire()
+        except asyncio.TimeoutError:
+            self._timed_out += 1
+            raise ServerBusyError('코드 실행 대기 시간이 초과되었습니다. 잠시 후 다시 시도해주세요')
+        finally:
+            self._waiting -= 1
+        self._active += 1
+        self._admitted += 1
+
+    def _leave(self) -> None:
+        self._active -= 1
+        self.semaphore.release()
+
+    def stats(self) -> Dict[str, Any]:
+        """동시성 제한 상태"""
+        return {
+            'max_concurrent': self.max_concurrent,
+            'max_queued': self.max_queued,
+            'max_wait_seconds': self.max_wait_seconds,
+            'active': self._active,
+            'waiting': self._waiting,
+            'admitted': self._admitted,
+            'rejected': self._rejected,
+            'timed_out': self._timed_out
+        }
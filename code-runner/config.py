@@ -0,0 +1,97 @@
+"""
+코드 러너 설정
+"""
+import os
+
+
+def _env_int(name: str, default: int) -> int:
+    """정수형 환경 변수 조회"""
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    """실수형 환경 변수 조회"""
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def _parse_bytes(value: str) -> int:
+    """128m, 1g 같은 단위가 붙은 크기를 바이트로 변환"""
+    value = value.strip().lower()
+    units = {'k': 1024, 'm': 1024 ** 2, 'g': 1024 ** 3}
+    if value and value[-1] in units:
+        return int(float(value[:-1]) * units[value[-1]])
+    return int(value)
+
+
+def _env_bytes(name: str, default: str) -> int:
+    """바이트 크기 환경 변수 조회"""
+    try:
+        return _parse_bytes(os.environ.get(name, default))
+    except ValueError:
+        return _parse_bytes(default)
+
+
+def _env_list(name: str, default: str) -> list:
+    """쉼표로 구분된 환경 변수 조회"""
+    value = os.environ.get(name, default)
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+
+# 러너 버전 (실행 결과 캐시 키에 포함)
+RUNNER_VERSION = '1.0.0'
+
+# 실행 환경
+EXECUTION_DIR = os.environ.get('EXECUTION_DIR', '/tmp/execution')
+PYTHON_EXECUTABLE = os.environ.get('PYTHON_EXECUTABLE', 'python')
+EXECUTION_TIMEOUT = _env_int('EXECUTION_TIMEOUT', 30)
+
+# 실행별 자원 제한 (0이면 제한하지 않음)
+# - MAX_MEMORY: 주소 공간(RLIMIT_AS) 상한
+# - MAX_CPU: 실행 시간 동안 쓸 수 있는 평균 코어 수. CPU 시간 상한(RLIMIT_CPU)은
+#   타임아웃 x MAX_CPU 초로 정해지며, 넘으면 프로세스가 종료됩니다
+# - MAX_OPEN_FILES: 동시에 열 수 있는 파일 수(RLIMIT_NOFILE)
+# - MAX_PROCESSES: 러너 실행 사용자의 전체 프로세스/스레드 수(RLIMIT_NPROC).
+#   사용자 단위로 세므로 워커 풀 크기와 동시 실행 수보다 넉넉해야 합니다
+MAX_MEMORY = _env_bytes('MAX_MEMORY', '256m')
+MAX_CPU = _env_float('MAX_CPU', 1.0)
+MAX_OPEN_FILES = _env_int('MAX_OPEN_FILES', 64)
+MAX_PROCESSES = _env_int('MAX_PROCESSES', 256)
+
+# 실행 한 번의 stdout/stderr 합계 상한 (초과하면 잘라내고 프로세스 종료)
+MAX_OUTPUT_BYTES = _env_int('MAX_OUTPUT_BYTES', 1024 * 1024)
+
+# 워커 풀 설정 (미리 기동된 인터프리터)
+# - WORKER_HASH_SEED: 워커의 PYTHONHASHSEED. 고정해야 같은 코드의 set 출력 순서가
+#   워커마다 같아지며, 실행 결과 캐시 키에도 포함됩니다
+WORKER_POOL_SIZE = _env_int('WORKER_POOL_SIZE', 4)
+WORKER_MAX_IDLE_SECONDS = _env_int('WORKER_MAX_IDLE_SECONDS', 300)
+WORKER_HASH_SEED = str(_env_int('WORKER_HASH_SEED', 0))
+WORKER_PRELOAD_MODULES = _env_list(
+    'WORKER_PRELOAD_MODULES',
+    'math,random,collections,itertools,functools,re,json,string,datetime,heapq,bisect'
+)
+
+# 동시 실행 제한
+MAX_CONCURRENT_EXECUTIONS = _env_int('MAX_CONCURRENT_EXECUTIONS', (os.cpu_count() or 1) * 2)
+MAX_QUEUED_EXECUTIONS = _env_int('MAX_QUEUED_EXECUTIONS', 50)
+# 대기열에서 슬롯을 기다리는 최대 시간 (초과하면 503, 0이면 무기한 대기)
+MAX_QUEUE_WAIT_SECONDS = _env_float('MAX_QUEUE_WAIT_SECONDS', 10)
+BUSY_RETRY_AFTER = _env_int('BUSY_RETRY_AFTER', 2)
+
+# 배치 실행
+MAX_BATCH_SIZE = _env_int('MAX_BATCH_SIZE', 100)
+
+# 실행 결과 캐시 (크기나 TTL이 0이면 비활성화)
+RESULT_CACHE_SIZE = _env_int('RESULT_CACHE_SIZE', 1024)
+RESULT_CACHE_TTL = _env_int('RESULT_CACHE_TTL', 600)
+RESULT_CACHE_EXCLUDE_MODULES = _env_list(
+    'RESULT_CACHE_EXCLUDE_MODULES',
+    'random,time,datetime,secrets,uuid,os,threading,multiprocessing,subprocess,'
+    'socket,asyncio,signal,importlib,numpy'
+)
@@ -0,0 +1,258 @@
+"""
+워커 프로세스에서의 코드 실행
+
+자식 프로세스의 입출력과 종료를 모두 asyncio로 기다리므로, 오래 걸리는
+코드가 실행되는 동안에도 이벤트 루프는 다른 요청을 처리할 수 있습니다.
+"""
+import asyncio
+import secrets
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
+
+import config
+from admission import AdmissionController, ServerBusyError
+from output_buffer import OutputCallback
+from resource_limits import job_limits, limit_message
+from result_cache import ResultCache
+from schemas import BatchItem, BatchResult, CodeResponse
+from worker_job import JobOutcome, run_job
+from worker_pool import USAGE_KEYS, WarmWorkerPool
+
+# 여러 입력을 실행할 때 입력마다 더하는 여유 시간 (fork 및 정리)
+CASE_OVERHEAD_SECONDS = 1
+
+
+def _to_response(outcome: JobOutcome, limits: Dict[str, int], timeout: int) -> CodeResponse:
+    """워커 실행 결과를 CodeResponse로 변환"""
+    usage = {key: outcome.usage[key] for key in USAGE_KEYS if key in outcome.usage}
+    stdout, stderr = outcome.stdout, outcome.stderr
+
+    if outcome.timed_out:
+        return CodeResponse(
+            success=False,
+            output=stdout,
+            error=f"코드 실행이 시간 초과되었습니다 ({timeout}초)",
+            execution_time=timeout,
+            timed_out=True,
+            truncated=outcome.truncated,
+            **usage
+        )
+    elif outcome.truncated:
+        message = f"출력이 최대 크기({config.MAX_OUTPUT_BYTES}바이트)를 초과하여 실행을 중단했습니다"
+        return CodeResponse(
+            success=False,
+            output=stdout,
+            error=f"{stderr}\n{message}" if stderr else message,
+            execution_time=outcome.execution_time,
+            truncated=True,
+            **usage
+        )
+    elif outcome.returncode == 0:
+        return CodeResponse(
+            success=True,
+            output=stdout,
+            error=stderr if stderr else None,
+            execution_time=outcome.execution_time,
+            **usage
+        )
+    else:
+        message = limit_message(outcome.returncode, limits)
+        if message:
+            stderr = f"{stderr}\n{message}" if stderr else message
+        return CodeResponse(
+            success=False,
+            output=stdout,
+            error=stderr,
+            execution_time=outcome.execution_time,
+            **usage
+        )
+
+
+async def run_code(pool: WarmWorkerPool, code: str, timeout: int,
+                   stdin: Union[str, List[str], None] = None,
+                   on_output: Optional[OutputCallback] = None) -> CodeResponse:
+    """
+    미리 기동된 워커에서 코드를 실행
+
+    Args:
+        pool: 워커 풀
+        code: 실행할 Python 코드
+        timeout: 타임아웃 (초). 입력 목록이면 입력마다 적용
+        stdin: 프로그램에 전달할 표준 입력, 또는 입력 목록
+        on_output: 출력 조각을 받을 때마다 호출할 콜백 (stream, text)
+
+    Returns:
+        실행 결과 (입력 목록이면 입력별 결과가 cases에 담김)
+    """
+    if isinstance(stdin, list):
+        return await _run_multi(pool, code, timeout, stdin)
+
+    limits = job_limits(timeout)
+    outcome = await run_job(pool, {'code': code, 'limits': limits}, stdin, timeout, on_output)
+    return _to_response(outcome, limits, timeout)
+
+
+async def _run_multi(pool: WarmWorkerPool, code: str, timeout: int,
+                     stdins: List[str]) -> CodeResponse:
+    """
+    여러 입력을 워커 하나에서 실행
+
+    워커는 코드를 한 번만 컴파일하고 입력마다 fork한 자식에서 실행하므로
+    입력 간 상태는 분리되면서도 프로세스 기동 비용은 한 번만 듭니다.
+    입력별 출력은 실행마다 새로 만든 구분자로 나뉩니다.
+    """
+    limits = job_limits(timeout)
+    separator = f'\x00{secrets.token_hex(16)}\x00'
+    job = {
+        'code': code,
+        'limits': limits,
+        'stdins': stdins,
+        'case_timeout': timeout,
+        'separator': separator
+    }
+    outcome = await run_job(
+        pool, job, None,
+        timeout=(timeout + CASE_OVERHEAD_SECONDS) * len(stdins)
+    )
+
+    stdouts = outcome.stdout.split(separator)
+    stderrs = outcome.stderr.split(separator)
+    reports = {case['case']: case for case in outcome.usage.get('cases', [])}
+
+    cases = []
+    for index in range(len(stdins)):
+        report = reports.get(index)
+        if report is None:
+            # 전체 시간 초과나 출력 초과로 워커가 중단되어 실행하지 못한 입력
+            cases.append(CodeResponse(
+                success=False,
+                output=stdouts[index] if index < len(stdouts) else "",
+                error="실행이 중단되어 이 입력의 결과가 없습니다",
+                execution_time=0,
+                timed_out=outcome.timed_out,
+                truncated=outcome.truncated
+            ))
+            continue
+
+        case_outcome = JobOutcome(
+            returncode=report.get('exit_code'),
+            stdout=stdouts[index] if index < len(stdouts) else "",
+            stderr=stderrs[index] if index < len(stderrs) else "",
+            execution_time=report.get('wall_time', 0),
+            timed_out=report.get('timed_out', False),
+            usage=report
+        )
+        cases.append(_to_response(case_outcome, limits, timeout))
+
+    failed = sum(1 for case in cases if not case.success)
+    usage = {key: outcome.usage[key] for key in USAGE_KEYS if key in outcome.usage}
+    return CodeResponse(
+        success=failed == 0,
+        output="",
+        error=f"{len(cases)}개 입력 중 {failed}개의 실행에 실패했습니다" if failed else None,
+        execution_time=outcome.execution_time,
+        timed_out=any(case.timed_out for case in cases),
+        truncated=outcome.truncated,
+        cases=cases,
+        **usage
+    )
+
+
+async def stream_code(pool: WarmWorkerPool, admission: AdmissionController,
+                      code: str, timeout: int,
+                      stdin: Optional[str] = None) -> AsyncIterator[Dict[str, Any]]:
+    """
+    코드를 실행하며 출력 조각을 실시간 이벤트로 반환
+
+    실행 슬롯을 얻으면 start, 출력이 생길 때마다 stdout/stderr, 마지막으로
+    전체 결과를 담은 result 이벤트를 보냅니다. 실시간 출력은 결과 캐시를
+    거치지 않습니다.
+
+    Yields:
+        {"type": "start"}, {"type": "stdout"|"stderr", "data": ...},
+        {"type": "result", "result": CodeResponse}
+    """
+    events: asyncio.Queue = asyncio.Queue()
+
+    async def on_output(stream: str, text: str) -> None:
+        await events.put({'type': stream, 'data': text})
+
+    async def run() -> None:
+        try:
+            async with admission.slot():
+                await events.put({'type': 'start'})
+                result = await run_code(pool, code, timeout, stdin, on_output)
+        except ServerBusyError as e:
+            result = CodeResponse(success=False, output="", error=str(e), execution_time=0)
+        except Exception as e:
+            result = CodeResponse(
+                success=False,
+                output="",
+                error=f"코드 실행 중 오류가 발생했습니다: {str(e)}",
+                execution_time=0
+            )
+        await events.put({'type': 'result', 'result': result.model_dump()})
+
+    task = asyncio.create_task(run())
+    try:
+        while True:
+            event = await events.get()
+            yield event
+            if event['type'] == 'result':
+                break
+    finally:
+        # 클라이언트 연결이 끊기면 실행 취소
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+
+async def run_batch(pool: WarmWorkerPool, admission: AdmissionController,
+                    cache: ResultCache, items: List[BatchItem]) -> AsyncIterator[BatchResult]:
+    """
+    여러 코드를 병렬로 실행하고 끝나는 순서대로 결과를 반환
+
+    모든 항목은 단건 실행과 같은 동시성 예산(admission)을 공유하며,
+    한 배치가 동시에 점유하는 슬롯은 max_concurrent개를 넘지 않습니다.
+
+    Args:
+        pool: 워커 풀
+        admission: 동시성 제한기
+        cache: 실행 결과 캐시 (적중하면 슬롯을 점유하지 않음)
+        items: 실행할 항목 목록
+
+    Yields:
+        항목 인덱스와 실행 결과
+    """
+    batch_limit = asyncio.Semaphore(admission.max_concurrent)
+
+    async def run_uncached(item: BatchItem) -> CodeResponse:
+        async with batch_limit:
+            async with admission.reserved_slot():
+                return await run_code(pool, item.code, item.timeout, item.stdin)
+
+    async def run_item(index: int, item: BatchItem) -> BatchResult:
+        key = cache.make_key(item.code, item.stdin, item.timeout) if item.cache else None
+        try:
+            result = await cache.get_or_run(key, lambda: run_uncached(item))
+        except ServerBusyError as e:
+            # 학생 코드의 실행 결과가 아니므로 실행 오류와 구분하여 보고
+            result = CodeResponse(success=False, output="", error=str(e), execution_time=0)
+            return BatchResult(index=index, result=result, infra_error=True)
+        except Exception as e:
+            result = CodeResponse(
+                success=False,
+                output="",
+                error=f"코드 실행 중 오류가 발생했습니다: {str(e)}",
+                execution_time=0
+            )
+            return BatchResult(index=index, result=result, infra_error=True)
+        return BatchResult(index=index, result=result)
+
+    tasks = [asyncio.create_task(run_item(i, item)) for i, item in enumerate(items)]
+    try:
+        for finished in asyncio.as_completed(tasks):
+            yield await finished
+    finally:
+        # 클라이언트 연결이 끊기면 남은 실행 취소
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
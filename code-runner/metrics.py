@@ -0,0 +1,97 @@
+"""
+Prometheus 메트릭
+
+요청/실행 단위 측정값은 히스토그램과 카운터로 기록하고, 워커 풀이나
+동시성 제한기처럼 이미 통계를 가진 구성 요소는 수집 시점에 그 값을 읽습니다.
+"""
+from typing import Any, Dict, Iterator
+
+from prometheus_client import Counter, Gauge, Histogram
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from prometheus_client.registry import Collector
+
+MB = 1024 * 1024
+
+HTTP_REQUEST_DURATION = Histogram(
+    'runner_http_request_duration_seconds',
+    '코드 러너 HTTP 요청 처리 시간 (스트리밍 응답은 첫 응답까지)',
+    ['method', 'route', 'status']
+)
+
+EXECUTIONS = Counter(
+    'runner_executions_total',
+    '워커 프로세스 실행 수 (캐시 적중 제외)',
+    ['outcome']
+)
+
+EXECUTION_DURATION = Histogram(
+    'runner_execution_duration_seconds',
+    '워커 획득부터 종료까지의 실행 시간',
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+)
+
+EXECUTION_CPU = Histogram(
+    'runner_execution_cpu_seconds',
+    '실행 하나가 사용한 CPU 시간',
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30)
+)
+
+EXECUTION_PEAK_RSS = Histogram(
+    'runner_execution_peak_rss_bytes',
+    '실행 하나의 최대 메모리 사용량',
+    buckets=tuple(size * MB for size in (16, 32, 64, 128, 256, 512, 1024))
+)
+
+OUTPUT_BYTES = Histogram(
+    'runner_execution_output_bytes',
+    '실행 하나의 stdout/stderr 합계 크기',
+    buckets=(0, 100, 1000, 10_000, 100_000, 1_000_000, 10_000_000)
+)
+
+RUNNING_CHILDREN = Gauge(
+    'runner_running_children',
+    '코드를 실행 중인 워커 프로세스 수'
+)
+
+
+def observe_execution(outcome: str, duration: float, output_bytes: int,
+                      usage: Dict[str, Any]) -> None:
+    """워커 실행 하나의 결과 기록"""
+    EXECUTIONS.labels(outcome).inc()
+    EXECUTION_DURATION.observe(duration)
+    OUTPUT_BYTES.observe(output_bytes)
+    if usage.get('cpu_time') is not None:
+        EXECUTION_CPU.observe(usage['cpu_time'])
+    if usage.get('peak_rss_kb') is not None:
+        EXECUTION_PEAK_RSS.observe(usage['peak_rss_kb'] * 1024)
+
+
+class RunnerStatsCollector(Collector):
+    """워커 풀, 동시성 제한기, 결과 캐시의 통계를 수집 시점에 노출"""
+
+    def __init__(self, worker_pool, admission, result_cache):
+        self.worker_pool = worker_pool
+        self.admission = admission
+        self.result_cache = result_cache
+
+    def collect(self) -> Iterator:
+        admission = self.admission.stats()
+        yield GaugeMetricFamily('runner_admission_active', '실행 슬롯을 점유한 요청 수', admission['active'])
+        yield GaugeMetricFamily('runner_admission_queue_depth', '실행 슬롯을 기다리는 요청 수', admission['waiting'])
+        yield GaugeMetricFamily('runner_admission_max_concurrent', '최대 동시 실행 수', admission['max_concurrent'])
+        yield CounterMetricFamily('runner_admission_admitted', '실행 슬롯을 얻은 요청 수', admission['admitted'])
+        yield CounterMetricFamily('runner_admission_rejected', '대기열이 가득 차 거절된 요청 수', admission['rejected'])
+        yield CounterMetricFamily('runner_admission_timed_out', '대기 시간을 넘겨 거절된 요청 수', admission['timed_out'])
+
+        pool = self.worker_pool.stats()
+        yield GaugeMetricFamily('runner_pool_idle_workers', '대기 중인 워커 프로세스 수', pool['idle'])
+        yield CounterMetricFamily('runner_pool_spawned', '기동한 워커 프로세스 수', pool['spawned'])
+        yield CounterMetricFamily('runner_pool_recycled', '유휴 시간 초과 등으로 교체한 워커 수', pool['recycled'])
+        yield CounterMetricFamily('runner_pool_warm_hits', '미리 기동된 워커를 사용한 실행 수', pool['warm_hits'])
+        yield CounterMetricFamily('runner_pool_cold_starts', '워커를 새로 기동해야 했던 실행 수', pool['cold_starts'])
+
+        cache = self.result_cache.stats()
+        yield GaugeMetricFamily('runner_result_cache_entries', '캐시된 실행 결과 수', cache['entries'])
+        yield GaugeMetricFamily('runner_result_cache_hit_ratio', '실행 결과 캐시 적중률', cache['hit_rate'])
+        for key in ('hits', 'misses', 'coalesced', 'uncacheable', 'evictions'):
+            yield CounterMetricFamily(f'runner_result_cache_{key}', f'실행 결과 캐시 {key} 수', cache[key])
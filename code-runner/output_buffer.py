@@ -0,0 +1,59 @@
+"""
+실행 출력 버퍼
+
+워커의 stdout/stderr를 조각 단위로 읽어 모으며, 실행 한 번의 출력 크기를
+제한하고 필요하면 조각을 받는 즉시 호출자에게 전달합니다.
+"""
+import asyncio
+import codecs
+from typing import Awaitable, Callable, Dict, List, Optional
+
+# 출력 파이프에서 한 번에 읽는 크기
+READ_CHUNK_SIZE = 4096
+
+# 출력 조각을 받을 콜백 (stream 이름, 디코딩된 텍스트)
+OutputCallback = Callable[[str, str], Awaitable[None]]
+
+
+class OutputBuffer:
+    """
+    stdout/stderr를 조각 단위로 모으는 버퍼
+
+    두 스트림을 합친 크기가 max_bytes를 넘으면 초과분을 버리고 truncated를 표시합니다.
+    on_output이 주어지면 디코딩한 조각을 받는 즉시 전달합니다.
+    """
+
+    def __init__(self, max_bytes: int, on_output: Optional[OutputCallback] = None):
+        self.max_bytes = max_bytes
+        self.on_output = on_output
+        self.size = 0
+        self.truncated = False
+        self._chunks: Dict[str, List[str]] = {'stdout': [], 'stderr': []}
+
+    def text(self, stream: str) -> str:
+        return ''.join(self._chunks[stream])
+
+    async def pump(self, stream: str, reader: asyncio.StreamReader,
+                   kill: Callable[[], None]) -> None:
+        """스트림을 끝까지 읽으며 상한을 넘으면 프로세스 종료"""
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+
+        while True:
+            data = await reader.read(READ_CHUNK_SIZE)
+            final = not data
+
+            if self.truncated:
+                data = b''
+            elif len(data) > self.max_bytes - self.size:
+                data = data[:self.max_bytes - self.size]
+                self.truncated = True
+                kill()
+            self.size += len(data)
+
+            text = decoder.decode(data, final=final)
+            if text:
+                self._chunks[stream].append(text)
+                if self.on_output is not None:
+                    await self.on_output(stream, text)
+            if final:
+                return
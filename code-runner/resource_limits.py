@@ -0,0 +1,49 @@
+"""
+실행별 자원 제한과 사용량 측정
+
+제한 값은 작업 헤더로 워커에 전달되어 학생 코드 실행 직전에 rlimit으로
+적용됩니다 (worker_bootstrap 참고).
+"""
+import math
+import signal
+from typing import Any, Dict, Optional
+
+import psutil
+
+import config
+
+
+def job_limits(timeout: int) -> Dict[str, int]:
+    """실행 하나에 적용할 자원 제한 (0은 제한 없음)"""
+    return {
+        'cpu_seconds': max(1, math.ceil(timeout * config.MAX_CPU)) if config.MAX_CPU > 0 else 0,
+        'memory_bytes': config.MAX_MEMORY,
+        'open_files': config.MAX_OPEN_FILES,
+        'processes': config.MAX_PROCESSES,
+    }
+
+
+def limit_message(returncode: int, limits: Dict[str, int]) -> Optional[str]:
+    """자원 제한에 걸려 시그널로 종료된 경우의 안내 메시지"""
+    if returncode == -signal.SIGXCPU:
+        return f"CPU 시간 제한({limits['cpu_seconds']}초)을 초과하여 실행이 중단되었습니다"
+    if returncode == -signal.SIGKILL:
+        return "자원 제한을 초과하여 실행이 강제 종료되었습니다"
+    if returncode < 0:
+        return f"프로세스가 시그널 {-returncode}로 종료되었습니다"
+    return None
+
+
+def snapshot_usage(pid: int) -> Dict[str, Any]:
+    """강제 종료 직전의 CPU 시간과 메모리 사용량 (최대값 대신 현재값)"""
+    try:
+        process = psutil.Process(pid)
+        with process.oneshot():
+            times = process.cpu_times()
+            rss = process.memory_info().rss
+    except psutil.Error:
+        return {}
+    return {
+        'cpu_time': round(times.user + times.system, 6),
+        'peak_rss_kb': rss // 1024
+    }
@@ -0,0 +1,170 @@
+"""
+결정적(deterministic) 실행 결과 캐시
+
+같은 코드/입력/타임아웃/러너 버전의 실행 결과를 재사용하여 프로세스 생성
+자체를 건너뜁니다. 시간이나 난수처럼 실행마다 결과가 달라질 수 있는 모듈을
+사용하는 코드는 캐시하지 않습니다.
+"""
+import ast
+import asyncio
+import hashlib
+import json
+import sys
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Any, Optional, Tuple
+
+from schemas import CodeResponse
+
+# 모듈 임포트 외에 결과를 예측할 수 없게 만드는 내장 함수
+# (id는 메모리 주소, hash는 해시 시드에 따라 값이 달라짐)
+DYNAMIC_BUILTINS = frozenset({'__import__', 'eval', 'exec', 'compile', 'open', 'id', 'hash'})
+
+
+def find_nondeterminism(code: str, excluded_modules: frozenset) -> Optional[str]:
+    """
+    캐시하면 안 되는 코드인지 검사
+
+    Returns:
+        캐시 불가 사유 (캐시 가능하면 None)
+    """
+    try:
+        tree = ast.parse(code)
+    except SyntaxError:
+        # 문법 오류 결과는 항상 같으므로 캐시 가능
+        return None
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            names = [node.module or '']
+        elif isinstance(node, ast.Name) and node.id in DYNAMIC_BUILTINS:
+            return node.id
+        else:
+            continue
+
+        for name in names:
+            if name.split('.')[0] in excluded_modules:
+                return name
+    return None
+
+
+class ResultCache:
+    """TTL이 있는 LRU 실행 결과 캐시 (동시에 들어온 같은 요청은 한 번만 실행)"""
+
+    def __init__(self, max_entries: int, ttl_seconds: int,
+                 excluded_modules: list, version: str):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.excluded_modules = frozenset(excluded_modules)
+        self.version = f'{version}/{sys.version.split()[0]}'
+
+        self._entries: 'OrderedDict[str, Tuple[float, CodeResponse]]' = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+        self._uncacheable = 0
+        self._evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    def make_key(self, code: str, stdin: Optional[str], timeout: int) -> Optional[str]:
+        """
+        캐시 키 생성
+
+        Returns:
+            캐시 키 (캐시할 수 없는 코드면 None)
+        """
+        if not self.enabled:
+            return None
+        if find_nondeterminism(code, self.excluded_modules):
+            self._uncacheable += 1
+            return None
+
+        payload = json.dumps([self.version, code, stdin or '', timeout])
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    async def get_or_run(self, key: Optional[str],
+                         run: Callable[[], Awaitable[CodeResponse]]) -> CodeResponse:
+        """
+        캐시된 결과를 반환하거나, 없으면 실행 후 저장
+
+        같은 키가 이미 실행 중이면 그 결과를 함께 기다립니다.
+        """
+        if key is None:
+            return await run()
+
+        cached = self._get(key)
+        if cached is not None:
+            self._hits += 1
+            return cached
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self._coalesced += 1
+            try:
+                return (await asyncio.shield(inflight)).model_copy(update={'cached': True})
+            except Exception:
+                # 먼저 실행한 요청이 실패하면 직접 실행
+                return await run()
+
+        self._misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            response = await run()
+        except BaseException as e:
+            future.set_exception(RuntimeError(str(e) or type(e).__name__))
+            future.exception()  # 기다리는 요청이 없을 때의 경고 방지
+            raise
+        else:
+            future.set_result(response)
+            self._put(key, response)
+            return response
+        finally:
+            self._inflight.pop(key, None)
+
+    def _get(self, key: str) -> Optional[CodeResponse]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        stored_at, response = entry
+        if time.monotonic() - stored_at > self.ttl_seconds:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return response.model_copy(update={'cached': True})
+
+    def _put(self, key: str, response: CodeResponse) -> None:
+        # 시간 초과는 서버 부하에 따라 달라지므로 저장하지 않음
+        if response.timed_out:
+            return
+
+        self._entries[key] = (time.monotonic(), response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 상태 및 적중률"""
+        lookups = self._hits + self._misses + self._coalesced
+        return {
+            'enabled': self.enabled,
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'ttl_seconds': self.ttl_seconds,
+            'hits': self._hits,
+            'misses': self._misses,
+            'coalesced': self._coalesced,
+            'uncacheable': self._uncacheable,
+            'evictions': self._evictions,
+            'hit_rate': round((self._hits + self._coalesced) / lookups, 4) if lookups else 0.0
+        }
@@ -1,29 +1,94 @@
-import asyncio
-import subprocess
-import tempfile
+import json
 import os
 import time
-import signal
-from typing import Dict, Any
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import Response, StreamingResponse
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, generate_latest
 import uvicorn
 
+import config
+from admission import AdmissionController, ServerBusyError
+from metrics import HTTP_REQUEST_DURATION, RunnerStatsCollector
+from executor import run_batch, run_code, stream_code
+from result_cache import ResultCache
+from schemas import BatchRequest, CodeRequest, CodeResponse
+from worker_job import remove_stale_scratch_dirs
+from worker_pool import WarmWorkerPool
+
+# 미리 기동된 인터프리터 풀
+worker_pool = WarmWorkerPool(
+    size=config.WORKER_POOL_SIZE,
+    preload_modules=config.WORKER_PRELOAD_MODULES,
+    max_idle_seconds=config.WORKER_MAX_IDLE_SECONDS,
+    cwd=config.EXECUTION_DIR,
+    python=config.PYTHON_EXECUTABLE,
+    hash_seed=config.WORKER_HASH_SEED
+)
+
+# 동시 실행 수 제한 및 대기열
+admission = AdmissionController(
+    max_concurrent=config.MAX_CONCURRENT_EXECUTIONS,
+    max_queued=config.MAX_QUEUED_EXECUTIONS,
+    max_wait_seconds=config.MAX_QUEUE_WAIT_SECONDS
+)
+
+# 결정적 실행 결과 캐시
+result_cache = ResultCache(
+    max_entries=config.RESULT_CACHE_SIZE,
+    ttl_seconds=config.RESULT_CACHE_TTL,
+    excluded_modules=config.RESULT_CACHE_EXCLUDE_MODULES,
+    version=f'{config.RUNNER_VERSION}/hashseed={config.WORKER_HASH_SEED}'
+)
+
+# 워커 풀, 동시성 제한기, 캐시 통계를 /metrics로 노출
+REGISTRY.register(RunnerStatsCollector(worker_pool, admission, result_cache))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """워커 풀 시작 및 종료"""
+    os.makedirs(config.EXECUTION_DIR, exist_ok=True)
+    remove_stale_scratch_dirs()
+    worker_pool.start()
+    yield
+    await worker_pool.shutdown()
+
+
 app = FastAPI(
     title="Python Code Runner",
     description="안전한 파이썬 코드 실행 서비스",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
-class CodeRequest(BaseModel):
-    code: str
-    timeout: int = 30
+def validate_stdin_list(stdins: list) -> None:
+    """입력 목록 크기 검증"""
+    if not stdins:
+        raise HTTPException(status_code=400, detail="입력 목록이 비어 있습니다")
+    if len(stdins) > config.MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=400,
+            detail=f"입력은 한 번에 최대 {config.MAX_BATCH_SIZE}개까지 실행할 수 있습니다"
+        )
+
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    """경로별 요청 처리 시간 기록"""
+    started = time.perf_counter()
+    response = await call_next(request)
+    route = request.scope.get("route")
+    HTTP_REQUEST_DURATION.labels(
+        request.method,
+        route.path if route else "unmatched",
+        response.status_code
+    ).observe(time.perf_counter() - started)
+    return response
 
-class CodeResponse(BaseModel):
-    success: bool
-    output: str
-    error: str = None
-    execution_time: float
+@app.get("/metrics")
+async def metrics():
+    """Prometheus 형식 메트릭"""
+    return Response(generate_latest(REGISTRY), media_type=CONTENT_TYPE_LATEST)
 
 @app.get("/")
 async def root():
@@ -35,62 +100,46 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "service": "code-runner"}
+    return {
+        "status": "healthy",
+        "service": "code-runner",
+        "worker_pool": worker_pool.stats(),
+        "admission": admission.stats(),
+        "result_cache": result_cache.stats(),
+        "limits": {
+            "max_memory_bytes": config.MAX_MEMORY,
+            "max_cpu": config.MAX_CPU,
+            "max_open_files": config.MAX_OPEN_FILES,
+            "max_processes": config.MAX_PROCESSES,
+            "max_output_bytes": config.MAX_OUTPUT_BYTES
+        }
+    }
 
 @app.post("/execute", response_model=CodeResponse)
 async def execute_code(request: CodeRequest):
     """
     파이썬 코드를 안전하게 실행합니다.
+    
+    stdin이 목록이면 하나의 인터프리터에서 입력마다 격리하여 차례로 실행하고,
+    입력별 결과를 cases로 반환합니다.
     """
+    if isinstance(request.stdin, list):
+        validate_stdin_list(request.stdin)
+    
+    async def run_uncached() -> CodeResponse:
+        async with admission.slot():
+            return await run_code(worker_pool, request.code, request.timeout, request.stdin)
+    
     try:
-        start_time = time.time()
-        
-        # 임시 파일 생성
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-            f.write(request.code)
-            temp_file = f.name
-        
-        try:
-            # 코드 실행 (제한된 환경에서)
-            result = subprocess.run(
-                ['python', temp_file],
-                capture_output=True,
-                text=True,
-                timeout=request.timeout,
-                cwd='/tmp/execution'
-            )
-            
-            execution_time = time.time() - start_time
-            
-            if result.returncode == 0:
-                return CodeResponse(
-                    success=True,
-                    output=result.stdout,
-                    error=result.stderr if result.stderr else None,
-                    execution_time=execution_time
-                )
-            else:
-                return CodeResponse(
-                    success=False,
-                    output=result.stdout,
-                    error=result.stderr,
-                    execution_time=execution_time
-                )
-                
-        except subprocess.TimeoutExpired:
-            return CodeResponse(
-                success=False,
-                output="",
-                error=f"코드 실행이 시간 초과되었습니다 ({request.timeout}초)",
-                execution_time=request.timeout
-            )
-        
-        finally:
-            # 임시 파일 정리
-            try:
-                os.unlink(temp_file)
-            except:
-                pass
+        key = result_cache.make_key(request.code, request.stdin, request.timeout) if request.cache else None
+        return await result_cache.get_or_run(key, run_uncached)
+    
+    except ServerBusyError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=str(e),
+            headers={"Retry-After": str(config.BUSY_RETRY_AFTER)}
+        )
                 
     except Exception as e:
         return CodeResponse(
@@ -100,13 +149,74 @@ async def execute_code(request: CodeRequest):
             execution_time=0
         )
 
+@app.post("/execute/stream")
+async def execute_stream(request: CodeRequest):
+    """
+    파이썬 코드를 실행하며 출력을 실시간으로 스트리밍합니다.
+    
+    응답은 줄마다 {"type": "start" | "stdout" | "stderr", ...} 형태의 NDJSON이며,
+    마지막 줄은 {"type": "result", "result": CodeResponse}입니다.
+    """
+    if isinstance(request.stdin, list):
+        raise HTTPException(status_code=400, detail="실시간 실행은 입력 목록을 지원하지 않습니다")
+    
+    try:
+        admission.check_capacity()
+    except ServerBusyError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=str(e),
+            headers={"Retry-After": str(config.BUSY_RETRY_AFTER)}
+        )
+    
+    async def stream():
+        async for event in stream_code(worker_pool, admission, request.code, request.timeout, request.stdin):
+            yield json.dumps(event, ensure_ascii=False) + "\n"
+    
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+@app.post("/execute/batch")
+async def execute_batch(request: BatchRequest):
+    """
+    여러 코드를 병렬로 실행하고 끝나는 순서대로 결과를 스트리밍합니다.
+    
+    응답은 줄마다 {"index": ..., "result": CodeResponse} 형태의 NDJSON입니다.
+    """
+    if not request.items:
+        raise HTTPException(status_code=400, detail="실행할 항목이 없습니다")
+    
+    for item in request.items:
+        if isinstance(item.stdin, list):
+            validate_stdin_list(item.stdin)
+    
+    if len(request.items) > config.MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=400,
+            detail=f"한 번에 최대 {config.MAX_BATCH_SIZE}개까지 실행할 수 있습니다"
+        )
+    
+    try:
+        admission.check_capacity(min(len(request.items), admission.max_concurrent))
+    except ServerBusyError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=str(e),
+            headers={"Retry-After": str(config.BUSY_RETRY_AFTER)}
+        )
+    
+    async def stream():
+        async for item in run_batch(worker_pool, admission, result_cache, request.items):
+            yield item.model_dump_json() + "\n"
+    
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
 # 보안을 위한 제한된 실행 환경 설정
 def setup_restricted_environment():
     """
     코드 실행을 위한 제한된 환경을 설정합니다.
     """
     # 실행 디렉토리 확인 및 생성
-    exec_dir = '/tmp/execution'
+    exec_dir = config.EXECUTION_DIR
     if not os.path.exists(exec_dir):
         os.makedirs(exec_dir, mode=0o755)
     
@@ -0,0 +1,47 @@
+"""
+코드 러너 요청/응답 스키마
+"""
+from typing import List, Optional, Union
+from pydantic import BaseModel
+
+
+class CodeRequest(BaseModel):
+    code: str
+    # 표준 입력 하나, 또는 같은 인터프리터에서 차례로 실행할 입력 목록
+    stdin: Union[str, List[str], None] = None
+    timeout: int = 30
+    cache: bool = True
+
+
+class CodeResponse(BaseModel):
+    success: bool
+    output: str
+    error: Optional[str] = None
+    execution_time: float
+    timed_out: bool = False
+    truncated: bool = False
+    cached: bool = False
+    # 자원 사용량 (워커가 보고하지 못하고 종료된 경우 None)
+    cpu_time: Optional[float] = None
+    peak_rss_kb: Optional[int] = None
+    wall_time: Optional[float] = None
+    # stdin이 목록인 경우 입력별 실행 결과
+    cases: Optional[List['CodeResponse']] = None
+
+
+class BatchItem(BaseModel):
+    code: str
+    stdin: Union[str, List[str], None] = None
+    timeout: int = 30
+    cache: bool = True
+
+
+class BatchRequest(BaseModel):
+    items: List[BatchItem]
+
+
+class BatchResult(BaseModel):
+    index: int
+    result: CodeResponse
+    # 코드를 실행하지 못한 러너 쪽 실패 (대기 시간 초과 등, 다시 요청하면 성공할 수 있음)
+    infra_error: bool = False
@@ -0,0 +1,278 @@
+"""
+워커 인터프리터 부트스트랩
+
+미리 모듈을 임포트해 둔 뒤 준비 신호를 보내고, 표준 입력으로 받은
+작업 하나를 자원 제한 아래에서 실행한 후 종료합니다. 코드는 파일 없이
+작업 헤더로 전달되며, 실행이 끝나면 사용한 CPU 시간과 최대 메모리를
+보고용 파이프에 한 줄씩 JSON으로 기록합니다.
+
+작업 헤더에 stdins 목록이 있으면 입력마다 fork한 자식에서 코드를 실행하여
+하나의 인터프리터로 여러 입력을 처리합니다.
+
+사용법: worker_bootstrap.py <보고용 fd> [미리 임포트할 모듈...]
+"""
+import json
+import linecache
+import os
+import resource
+import signal
+import sys
+import time
+import traceback
+import types
+
+READY_SIGNAL = b'READY\n'
+
+# 트레이스백에 표시되는 학생 코드 파일 이름
+CODE_FILENAME = 'main.py'
+
+# 작업 헤더의 limits 키와 rlimit 매핑
+RLIMITS = {
+    'cpu_seconds': resource.RLIMIT_CPU,
+    'memory_bytes': resource.RLIMIT_AS,
+    'open_files': resource.RLIMIT_NOFILE,
+    'processes': resource.RLIMIT_NPROC,
+}
+
+
+def _preload(modules: list) -> None:
+    """자주 쓰이는 표준 라이브러리를 미리 임포트"""
+    for name in modules:
+        try:
+            __import__(name)
+        except ImportError:
+            pass
+
+
+def _apply_limits(limits: dict) -> None:
+    """자원 제한 적용 (soft/hard를 함께 낮춰 학생 코드가 되돌릴 수 없음)"""
+    for key, value in limits.items():
+        if key not in RLIMITS or not value:
+            continue
+        # CPU 시간은 soft 초과 시 SIGXCPU, 1초 뒤 hard 초과 시 SIGKILL
+        hard = value + 1 if key == 'cpu_seconds' else value
+        try:
+            resource.setrlimit(RLIMITS[key], (value, hard))
+        except (ValueError, OSError):
+            pass
+
+
+def _cpu_time() -> float:
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime + children.ru_utime + children.ru_stime
+
+
+def _report_usage(fd: int, owner_pid: int, cpu_before: float, started: float) -> None:
+    """
+    작업 실행에 사용한 자원을 보고용 파이프에 기록
+
+    학생 코드가 fork한 자식도 같은 finally 블록을 거치므로, 워커 프로세스
+    자신(owner_pid)일 때만 기록합니다.
+    """
+    if os.getpid() != owner_pid:
+        return
+    peak_rss_kb = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    )
+    report = {
+        'cpu_time': round(_cpu_time() - cpu_before, 6),
+        'peak_rss_kb': peak_rss_kb,
+        'wall_time': round(time.perf_counter() - started, 6)
+    }
+    _write_line(fd, report)
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    while data:
+        data = data[os.write(fd, data):]
+
+
+def _write_line(fd: int, report: dict) -> None:
+    """보고용 파이프에 JSON 한 줄 기록"""
+    try:
+        _write_all(fd, json.dumps(report).encode('utf-8') + b'\n')
+    except OSError:
+        pass
+
+
+def _enter_scratch_dir(path: str) -> None:
+    """실행별 작업 디렉토리를 현재 디렉토리와 임시 디렉토리로 지정"""
+    if not path:
+        return
+    os.chdir(path)
+    sys.path[0] = path
+    os.environ['TMPDIR'] = path
+    if 'tempfile' in sys.modules:
+        sys.modules['tempfile'].tempdir = None
+
+
+def _compile_source(code: str):
+    """학생 코드 컴파일 (파일이 없어도 트레이스백에 소스 줄이 표시되도록 등록)"""
+    linecache.cache[CODE_FILENAME] = (len(code), None, code.splitlines(True), CODE_FILENAME)
+    return compile(code, CODE_FILENAME, 'exec')
+
+
+def _exec_main(compiled) -> None:
+    """컴파일된 학생 코드를 새 __main__ 모듈로 실행"""
+    module = types.ModuleType('__main__')
+    module.__file__ = CODE_FILENAME
+    sys.modules['__main__'] = module
+    exec(compiled, module.__dict__)
+
+
+def _exit_status(exc: SystemExit) -> int:
+    """sys.exit() 인자를 인터프리터와 같은 방식으로 종료 코드로 변환"""
+    if exc.code is None:
+        return 0
+    if isinstance(exc.code, int):
+        return exc.code & 0xFF
+    print(exc.code, file=sys.stderr)
+    return 1
+
+
+def _stdin_file(data: bytes) -> int:
+    """입력 하나를 담은 메모리 파일 (memfd를 쓸 수 없으면 작업 디렉토리의 익명 파일)"""
+    if hasattr(os, 'memfd_create'):
+        fd = os.memfd_create('stdin')
+    else:
+        import tempfile
+        fd, path = tempfile.mkstemp()
+        os.unlink(path)
+    _write_all(fd, data)
+    os.lseek(fd, 0, os.SEEK_SET)
+    return fd
+
+
+def _run_case_child(compiled, syntax_error, stdin_fd: int, usage_fd: int) -> None:
+    """fork된 자식에서 입력 하나로 학생 코드 실행 (반환하지 않음)"""
+    exit_code = 1
+    try:
+        os.close(usage_fd)
+        os.dup2(stdin_fd, 0)
+        os.close(stdin_fd)
+        sys.stdin = open(0, 'r', encoding='utf-8', errors='replace', closefd=False)
+        signal.signal(signal.SIGALRM, signal.SIG_DFL)
+
+        exit_code = 0
+        try:
+            if syntax_error is not None:
+                raise syntax_error
+            _exec_main(compiled)
+        except SystemExit as e:
+            exit_code = _exit_status(e)
+        except BaseException as e:
+            _print_user_traceback(e, CODE_FILENAME)
+            exit_code = 1
+    finally:
+        for stream in (sys.stdout, sys.stderr):
+            try:
+                stream.flush()
+            except Exception:
+                pass
+        os._exit(exit_code)
+
+
+# 실행 중인 입력의 자식 프로세스 (입력별 시간 제한에 사용)
+_current_case = {'pid': 0, 'timed_out': False}
+
+
+def _kill_current_case(signum, frame) -> None:
+    if _current_case['pid']:
+        _current_case['timed_out'] = True
+        os.kill(_current_case['pid'], signal.SIGKILL)
+
+
+def _run_cases(job: dict, usage_fd: int) -> None:
+    """
+    여러 입력을 fork한 자식에서 하나씩 실행
+
+    미리 임포트한 모듈과 컴파일한 코드를 공유하면서도 입력마다 전역 상태가
+    분리됩니다. 입력별 출력 뒤에는 구분자를 쓰고, 종료 코드와 자원 사용량은
+    보고용 파이프에 기록합니다.
+    """
+    separator = job['separator'].encode('utf-8')
+    case_timeout = job.get('case_timeout') or 0
+    try:
+        compiled, syntax_error = _compile_source(job['code']), None
+    except SyntaxError as e:
+        compiled, syntax_error = None, e
+    signal.signal(signal.SIGALRM, _kill_current_case)
+
+    for index, data in enumerate(job['stdins']):
+        stdin_fd = _stdin_file(data.encode('utf-8'))
+        started = time.perf_counter()
+        pid = os.fork()
+        if pid == 0:
+            _run_case_child(compiled, syntax_error, stdin_fd, usage_fd)
+        os.close(stdin_fd)
+
+        _current_case.update(pid=pid, timed_out=False)
+        if case_timeout:
+            signal.setitimer(signal.ITIMER_REAL, case_timeout)
+        _, status, rusage = os.wait4(pid, 0)
+        _current_case['pid'] = 0
+        signal.setitimer(signal.ITIMER_REAL, 0)
+
+        _write_all(1, separator)
+        _write_all(2, separator)
+        _write_line(usage_fd, {
+            'case': index,
+            'exit_code': os.waitstatus_to_exitcode(status),
+            'timed_out': _current_case['timed_out'],
+            'cpu_time': round(rusage.ru_utime + rusage.ru_stime, 6),
+            'peak_rss_kb': rusage.ru_maxrss,
+            'wall_time': round(time.perf_counter() - started, 6)
+        })
+
+
+def _print_user_traceback(exc: BaseException, filename: str) -> None:
+    """부트스트랩 프레임을 제외하고 학생 코드의 트레이스백만 출력"""
+    tb = exc.__traceback__
+    while tb is not None and tb.tb_frame.f_code.co_filename != filename:
+        tb = tb.tb_next
+    traceback.print_exception(type(exc), exc, tb)
+
+
+def main() -> None:
+    usage_fd = int(sys.argv[1])
+    os.set_inheritable(usage_fd, False)
+    _preload(sys.argv[2:])
+
+    sys.stdout.buffer.write(READY_SIGNAL)
+    sys.stdout.flush()
+
+    header = sys.stdin.buffer.readline()
+    if not header:
+        return
+    job = json.loads(header)
+
+    sys.argv = [CODE_FILENAME]
+    _enter_scratch_dir(job.get('cwd', ''))
+
+    _apply_limits(job.get('limits', {}))
+    owner_pid = os.getpid()
+    cpu_before = _cpu_time()
+    started = time.perf_counter()
+
+    if 'stdins' in job:
+        try:
+            _run_cases(job, usage_fd)
+        finally:
+            _report_usage(usage_fd, owner_pid, cpu_before, started)
+        return
+
+    try:
+        _exec_main(_compile_source(job['code']))
+    except SystemExit:
+        raise
+    except BaseException as e:
+        _print_user_traceback(e, CODE_FILENAME)
+        sys.exit(1)
+    finally:
+        _report_usage(usage_fd, owner_pid, cpu_before, started)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,163 @@
+"""
+워커 프로세스 하나에 작업 하나를 맡기는 저수준 실행
+
+작업 헤더 전달, 출력 수집, 시간 초과 처리, 워커와 작업 디렉토리 정리를
+담당하며, 결과를 CodeResponse로 해석하는 일은 executor가 맡습니다.
+"""
+import asyncio
+import json
+import os
+import shutil
+import tempfile
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+import config
+from metrics import RUNNING_CHILDREN, observe_execution
+from output_buffer import OutputBuffer, OutputCallback
+from resource_limits import snapshot_usage
+from worker_pool import WarmWorkerPool
+
+# 실행별 작업 디렉토리 이름 접두어
+SCRATCH_PREFIX = 'run-'
+
+
+@dataclass
+class JobOutcome:
+    """워커 프로세스 실행 결과"""
+    returncode: Optional[int]
+    stdout: str
+    stderr: str
+    execution_time: float
+    timed_out: bool = False
+    truncated: bool = False
+    usage: Dict[str, Any] = field(default_factory=dict)
+
+
+def _outcome_label(outcome: JobOutcome) -> str:
+    """메트릭용 실행 결과 분류"""
+    if outcome.timed_out:
+        return 'timeout'
+    if outcome.truncated:
+        return 'truncated'
+    return 'success' if outcome.returncode == 0 else 'error'
+
+
+def _create_scratch_dir() -> str:
+    """실행 하나가 단독으로 쓰는 작업 디렉토리 생성"""
+    return tempfile.mkdtemp(prefix=SCRATCH_PREFIX, dir=config.EXECUTION_DIR)
+
+
+async def _remove_scratch_dir(path: str) -> None:
+    """작업 디렉토리 삭제 (대부분 비어 있으므로 rmdir을 먼저 시도)"""
+    try:
+        os.rmdir(path)
+    except FileNotFoundError:
+        pass
+    except OSError:
+        await asyncio.to_thread(shutil.rmtree, path, True)
+
+
+def remove_stale_scratch_dirs() -> int:
+    """
+    이전 프로세스가 비정상 종료하며 남긴 작업 디렉토리 정리 (시작 시 호출)
+
+    Returns:
+        삭제한 디렉토리 수
+    """
+    removed = 0
+    try:
+        entries = list(os.scandir(config.EXECUTION_DIR))
+    except OSError:
+        return 0
+    for entry in entries:
+        if entry.name.startswith(SCRATCH_PREFIX) and entry.is_dir(follow_symlinks=False):
+            shutil.rmtree(entry.path, ignore_errors=True)
+            removed += 1
+    return removed
+
+
+async def _feed_stdin(process: asyncio.subprocess.Process, payload: bytes) -> None:
+    """작업 헤더와 표준 입력을 전달하고 stdin을 닫음"""
+    try:
+        process.stdin.write(payload)
+        await process.stdin.drain()
+    except (BrokenPipeError, ConnectionResetError):
+        # 입력을 다 읽기 전에 프로그램이 종료된 경우
+        pass
+    finally:
+        process.stdin.close()
+
+
+async def run_job(pool: WarmWorkerPool, job: Dict[str, Any], stdin: Optional[str],
+                  timeout: float, on_output: Optional[OutputCallback] = None) -> JobOutcome:
+    """
+    워커를 하나 받아 작업을 실행하고 종료까지 기다림
+
+    코드는 파일 대신 작업 헤더(한 줄 JSON)에 담아 표준 입력으로 전달하며,
+    출력은 조각 단위로 읽으므로 MAX_OUTPUT_BYTES를 넘는 출력이 메모리에
+    쌓이지 않습니다. 시간 초과 시에도 그때까지의 출력을 돌려줍니다.
+
+    Args:
+        pool: 워커 풀
+        job: 작업 헤더 (code, limits 등. cwd는 여기서 채움)
+        stdin: 헤더 뒤에 이어 보낼 표준 입력
+        timeout: 전체 실행 제한 시간 (초)
+        on_output: 출력 조각을 받을 때마다 호출할 콜백 (stream, text)
+    """
+    start_time = time.time()
+
+    worker = await pool.acquire()
+    process = worker.process
+    try:
+        scratch_dir = _create_scratch_dir()
+    except OSError:
+        await worker.kill()
+        raise
+    header = json.dumps(dict(job, cwd=scratch_dir)) + '\n'
+    payload = (header + (stdin or '')).encode('utf-8')
+    output = OutputBuffer(config.MAX_OUTPUT_BYTES, on_output)
+
+    RUNNING_CHILDREN.inc()
+    try:
+        await asyncio.wait_for(
+            asyncio.gather(
+                _feed_stdin(process, payload),
+                output.pump('stdout', process.stdout, worker.terminate),
+                output.pump('stderr', process.stderr, worker.terminate),
+                process.wait()
+            ),
+            timeout=timeout
+        )
+        outcome = JobOutcome(
+            returncode=process.returncode,
+            stdout=output.text('stdout'),
+            stderr=output.text('stderr'),
+            execution_time=time.time() - start_time,
+            truncated=output.truncated,
+            usage=worker.read_usage()
+        )
+
+    except asyncio.TimeoutError:
+        # 워커가 보고하지 못하므로 종료 직전 사용량을 측정
+        usage = worker.read_usage()
+        usage.update(snapshot_usage(process.pid), wall_time=timeout)
+        outcome = JobOutcome(
+            returncode=None,
+            stdout=output.text('stdout'),
+            stderr=output.text('stderr'),
+            execution_time=timeout,
+            timed_out=True,
+            truncated=output.truncated,
+            usage=usage
+        )
+
+    finally:
+        RUNNING_CHILDREN.dec()
+        # 시간 초과나 요청 취소 시 남은 프로세스 정리
+        await worker.kill()
+        await _remove_scratch_dir(scratch_dir)
+
+    observe_execution(_outcome_label(outcome), outcome.execution_time, output.size, outcome.usage)
+    return outcome
@@ -0,0 +1,270 @@
+"""
+미리 기동된 파이썬 인터프리터 워커 풀
+
+각 워커는 정확히 하나의 작업만 실행하고 종료하며, 소비된 워커는
+백그라운드 태스크가 새로 기동하여 채워 넣습니다. 모든 프로세스 입출력은
+asyncio로 처리되어 이벤트 루프를 막지 않습니다.
+"""
+import asyncio
+import json
+import os
+import signal
+import statistics
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional
+
+from worker_bootstrap import READY_SIGNAL
+
+BOOTSTRAP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'worker_bootstrap.py')
+READY_TIMEOUT = 10
+
+# 워커가 보고하는 자원 사용량 항목
+USAGE_KEYS = ('cpu_time', 'peak_rss_kb', 'wall_time')
+CASE_KEYS = ('case', 'exit_code', 'timed_out') + USAGE_KEYS
+
+
+def _clean_report(report: Dict[str, Any], keys: tuple) -> Dict[str, Any]:
+    """학생 코드도 같은 프로세스에서 실행되므로 알려진 항목의 숫자/불리언 값만 사용"""
+    return {
+        key: report[key] for key in keys
+        if isinstance(report.get(key), (int, float)) and (key == 'timed_out') == isinstance(report[key], bool)
+    }
+
+
+@dataclass
+class Worker:
+    """준비 완료된 워커 프로세스"""
+    process: asyncio.subprocess.Process
+    startup_latency: float
+    usage_fd: int = -1
+    ready_at: float = field(default_factory=time.monotonic)
+
+    def is_alive(self) -> bool:
+        return self.process.returncode is None
+
+    def read_usage(self) -> Dict[str, Any]:
+        """
+        워커가 보고한 자원 사용량 (보고 없이 종료되었으면 빈 dict)
+
+        워커는 한 줄에 하나씩 JSON을 기록하며, 여러 입력을 실행한 경우
+        입력별 보고({"case": i, ...})가 'cases' 목록에 담깁니다.
+        """
+        if self.usage_fd < 0:
+            return {}
+        data = b''
+        try:
+            while True:
+                chunk = os.read(self.usage_fd, 65536)
+                if not chunk:
+                    break
+                data += chunk
+        except OSError:
+            pass
+
+        usage: Dict[str, Any] = {}
+        cases = []
+        for line in data.splitlines():
+            try:
+                report = json.loads(line)
+            except ValueError:
+                continue
+            if not isinstance(report, dict):
+                continue
+            if isinstance(report.get('case'), int):
+                cases.append(_clean_report(report, CASE_KEYS))
+            else:
+                usage.update(_clean_report(report, USAGE_KEYS))
+        if cases:
+            usage['cases'] = cases
+        return usage
+
+    def terminate(self) -> None:
+        """워커와 워커가 fork한 자식 프로세스를 모두 즉시 종료"""
+        # 종료된 워커의 pid는 재사용될 수 있으므로 살아 있을 때만 그룹에 시그널 전송
+        if not self.is_alive():
+            return
+        try:
+            os.killpg(self.process.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            try:
+                self.process.kill()
+            except ProcessLookupError:
+                pass
+
+    async def kill(self) -> None:
+        self.terminate()
+        await self.process.wait()
+
+        if self.usage_fd >= 0:
+            os.close(self.usage_fd)
+            self.usage_fd = -1
+
+
+class WarmWorkerPool:
+    """미리 모듈을 임포트한 워커 프로세스 풀"""
+
+    def __init__(self, size: int, preload_modules: List[str],
+                 max_idle_seconds: int, cwd: str, python: str = 'python',
+                 hash_seed: str = '0'):
+        self.size = size
+        self.preload_modules = preload_modules
+        self.max_idle_seconds = max_idle_seconds
+        self.cwd = cwd
+        self.python = python
+        # 워커마다 set/dict 순회 순서가 달라지지 않도록 해시 시드 고정
+        self.hash_seed = hash_seed
+
+        self._idle: deque = deque()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._closed = False
+        self._task: Optional[asyncio.Task] = None
+
+        self._latencies: deque = deque(maxlen=200)
+        self._spawned = 0
+        self._recycled = 0
+        self._warm_hits = 0
+        self._cold_starts = 0
+
+    def start(self) -> None:
+        """백그라운드 보충 태스크 시작 (실행 중인 이벤트 루프 안에서 호출)"""
+        self._wakeup = asyncio.Event()
+        if self.size <= 0 or self._task is not None:
+            return
+        self._task = asyncio.create_task(self._maintain())
+
+    async def shutdown(self) -> None:
+        """풀을 닫고 대기 중인 워커 종료"""
+        self._closed = True
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        workers = list(self._idle)
+        self._idle.clear()
+        for worker in workers:
+            await worker.kill()
+
+    async def acquire(self) -> Worker:
+        """
+        실행에 사용할 워커 획득
+
+        대기 중인 워커가 없으면 즉시 새로 기동합니다 (콜드 스타트).
+        """
+        worker = None
+        while self._idle:
+            candidate = self._idle.popleft()
+            if candidate.is_alive():
+                worker = candidate
+                break
+            self._recycled += 1
+
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+        if worker is not None:
+            self._warm_hits += 1
+            return worker
+
+        self._cold_starts += 1
+        return await self._spawn()
+
+    async def _spawn(self) -> Worker:
+        """워커 프로세스를 기동하고 준비 신호를 기다림"""
+        started = time.monotonic()
+
+        # 워커가 실행 후 자원 사용량을 보고할 파이프
+        usage_read, usage_write = os.pipe()
+        os.set_blocking(usage_read, False)
+        try:
+            process = await asyncio.create_subprocess_exec(
+                self.python, BOOTSTRAP_PATH, str(usage_write), *self.preload_modules,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=self.cwd,
+                env={**os.environ, 'PYTHONHASHSEED': self.hash_seed},
+                pass_fds=(usage_write,),
+                start_new_session=True  # 워커가 fork한 자식까지 한 번에 종료하기 위함
+            )
+        except OSError:
+            os.close(usage_read)
+            raise
+        finally:
+            os.close(usage_write)
+
+        worker = Worker(process=process, startup_latency=0.0, usage_fd=usage_read)
+        try:
+            signal_line = await asyncio.wait_for(process.stdout.readline(), READY_TIMEOUT)
+        except asyncio.TimeoutError:
+            signal_line = b''
+        if signal_line != READY_SIGNAL:
+            await worker.kill()
+            raise RuntimeError('워커 프로세스를 시작할 수 없습니다')
+
+        worker.startup_latency = time.monotonic() - started
+        worker.ready_at = time.monotonic()
+        self._latencies.append(worker.startup_latency)
+        self._spawned += 1
+        return worker
+
+    async def _recycle_expired(self) -> None:
+        """유휴 시간이 초과되었거나 종료된 워커 교체"""
+        now = time.monotonic()
+        expired = [
+            worker for worker in self._idle
+            if not worker.is_alive() or now - worker.ready_at > self.max_idle_seconds
+        ]
+        for worker in expired:
+            self._idle.remove(worker)
+            await worker.kill()
+            self._recycled += 1
+
+    async def _maintain(self) -> None:
+        """풀 크기를 유지하는 백그라운드 루프"""
+        while not self._closed:
+            self._wakeup.clear()
+            await self._recycle_expired()
+
+            while not self._closed and len(self._idle) < self.size:
+                try:
+                    worker = await self._spawn()
+                except (OSError, RuntimeError):
+                    await asyncio.sleep(1)
+                    break
+                self._idle.append(worker)
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=max(1, self.max_idle_seconds / 4))
+            except asyncio.TimeoutError:
+                pass
+
+    def stats(self) -> Dict[str, Any]:
+        """풀 상태 및 기동 지연 통계"""
+        latencies = sorted(self._latencies)
+        startup = {}
+        if latencies:
+            startup = {
+                'avg_ms': round(statistics.mean(latencies) * 1000, 2),
+                'p50_ms': round(latencies[len(latencies) // 2] * 1000, 2),
+                'p95_ms': round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] * 1000, 2),
+                'max_ms': round(latencies[-1] * 1000, 2),
+                'samples': len(latencies)
+            }
+
+        return {
+            'size': self.size,
+            'idle': len(self._idle),
+            'recycle_policy': {
+                'jobs_per_worker': 1,
+                'max_idle_seconds': self.max_idle_seconds
+            },
+            'spawned': self._spawned,
+            'recycled': self._recycled,
+            'warm_hits': self._warm_hits,
+            'cold_starts': self._cold_starts,
+            'startup_latency': startup
+        }
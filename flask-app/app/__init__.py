@@ -2,6 +2,7 @@
 Flask 애플리케이션 팩토리
 """
 from flask import Flask
+from sqlalchemy import inspect, text
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
 from flask_jwt_extended import JWTManager
@@ -13,6 +14,41 @@ migrate = Migrate()
 jwt = JWTManager()
 
 
+def _add_missing_columns():
+    """
+    기존 테이블에 나중에 추가된 컬럼 추가
+    
+    create_all은 이미 있는 테이블을 바꾸지 않기 때문에, 모델에 새로 정의한
+    컬럼은 여기서 ALTER TABLE로 추가합니다 (NULL을 허용하는 컬럼만 추가됨).
+    """
+    inspector = inspect(db.engine)
+    quote = db.engine.dialect.identifier_preparer.quote
+    with db.engine.begin() as conn:
+        for table in db.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {column['name'] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing or not column.nullable:
+                    continue
+                column_type = column.type.compile(dialect=db.engine.dialect)
+                conn.execute(text(
+                    f'ALTER TABLE {quote(table.name)} ADD COLUMN {quote(column.name)} {column_type}'
+                ))
+
+
+def _create_missing_indexes():
+    """
+    기존 테이블에 나중에 추가된 인덱스 생성
+    
+    create_all은 없는 테이블만 만들기 때문에, 이미 있는 테이블에 모델에서
+    새로 정의한 인덱스는 여기서 따로 만듭니다.
+    """
+    for table in db.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=db.engine, checkfirst=True)
+
+
 def create_app(config_name='default'):
     """
     Flask 애플리케이션 팩토리 함수
@@ -42,18 +78,67 @@ def create_app(config_name='default'):
     from app.routes.auth import auth_bp
     from app.routes.materials import materials_bp
     from app.routes.submissions import submissions_bp
+    from app.routes.stats import stats_bp
+    from app.routes.rankings import rankings_bp
     
     app.register_blueprint(auth_bp, url_prefix='/api/auth')
     app.register_blueprint(materials_bp, url_prefix='/api/materials')
     app.register_blueprint(submissions_bp, url_prefix='/api/submissions')
+    app.register_blueprint(stats_bp, url_prefix='/api/stats')
+    app.register_blueprint(rankings_bp, url_prefix='/api/rankings')
     
     # 정적 페이지 라우트
     from app.routes.pages import pages_bp
     app.register_blueprint(pages_bp)
     
+    # 메트릭 수집 및 /metrics 노출
+    from app.utils import metrics
+    from app.routes.metrics import metrics_bp
+    metrics.init_app(app)
+    app.register_blueprint(metrics_bp)
+    
+    # 요청 프로파일링 (PROFILING_ENABLED일 때만)
+    from app.utils import profiling
+    profiling.init_app(app)
+    
     # 데이터베이스 생성
     with app.app_context():
         db.create_all()
+        _add_missing_columns()
+        _create_missing_indexes()
+        
+        # 인라인으로 저장된 이전 제출의 코드/출력을 본문 저장소로 이전
+        from app.services.blob_service import BlobService
+        BlobService.migrate_inline_submissions()
+        
+        # 통계 도입 전 제출 기록이 있으면 통계 테이블 생성
+        from app.services.stats_service import StatsService
+        StatsService.ensure_stats()
+        
+        # 쉼표로 구분된 이전 형식의 태그를 태그 테이블로 이전
+        from app.services.tag_service import TagService
+        TagService.ensure_tag_keys()
+        TagService.migrate_legacy_tags()
+        
+        # 검색 색인이 없는 자료 색인 (색인 도입 전 자료 포함)
+        from app.services.material_search_service import MaterialSearchService
+        MaterialSearchService.ensure_index()
+    
+    # 인증 사용자 캐시
+    from app.services.user_cache import user_cache
+    user_cache.init_app(app)
+    
+    # 수업 자료 응답 캐시
+    from app.services.material_cache import material_cache
+    material_cache.init_app(app)
+    
+    # 문제별/전체 순위 색인
+    from app.services.leaderboard import leaderboard
+    leaderboard.init_app(app)
+    
+    # 제출 채점 큐 워커 시작
+    from app.services.submission_queue import submission_queue
+    submission_queue.init_app(app)
     
     return app
 
@@ -22,10 +22,55 @@ class Config:
     # CORS 설정
     CORS_ORIGINS = os.environ.get('CORS_ORIGINS', '*').split(',')
     
-    # 코드 러너 설정
+    # 코드 러너 설정 (쉼표로 여러 인스턴스를 지정하면 'round_robin' 또는 'least_busy'로 분산)
     CODE_RUNNER_URL = os.environ.get('CODE_RUNNER_URL') or 'http://localhost:8080'
+    CODE_RUNNER_BALANCE = os.environ.get('CODE_RUNNER_BALANCE', 'round_robin')
+    CODE_RUNNER_POOL_SIZE = int(os.environ.get('CODE_RUNNER_POOL_SIZE', '20'))
+    CODE_RUNNER_CONNECT_TIMEOUT = float(os.environ.get('CODE_RUNNER_CONNECT_TIMEOUT', '3'))
+    CODE_RUNNER_MAX_RETRIES = int(os.environ.get('CODE_RUNNER_MAX_RETRIES', '2'))
+    CODE_RUNNER_RETRY_BACKOFF = float(os.environ.get('CODE_RUNNER_RETRY_BACKOFF', '0.2'))
     CODE_EXECUTION_TIMEOUT = int(os.environ.get('CODE_EXECUTION_TIMEOUT', '30'))
     
+    # 채점 설정
+    # - JUDGE_FAIL_FAST: 첫 번째 실패한 테스트 케이스에서 나머지 케이스를 실행하지 않음
+    # - JUDGE_PARALLEL: 케이스마다 별도 프로세스로 병렬 실행 (끄면 차례로 실행)
+    JUDGE_FAIL_FAST = os.environ.get('JUDGE_FAIL_FAST', 'false').lower() == 'true'
+    JUDGE_PARALLEL = os.environ.get('JUDGE_PARALLEL', 'false').lower() == 'true'
+    
+    # 제출 채점 큐 (0이면 요청 안에서 바로 채점, AUTOSTART가 false면 서버가 fork한 뒤 시작)
+    SUBMISSION_WORKERS = int(os.environ.get('SUBMISSION_WORKERS', '4'))
+    SUBMISSION_QUEUE_AUTOSTART = os.environ.get('SUBMISSION_QUEUE_AUTOSTART', 'true').lower() == 'true'
+    SUBMISSION_POLL_INTERVAL = float(os.environ.get('SUBMISSION_POLL_INTERVAL', '1.0'))
+    SUBMISSION_MAX_ATTEMPTS = int(os.environ.get('SUBMISSION_MAX_ATTEMPTS', '3'))
+    SUBMISSION_RETRY_BACKOFF = float(os.environ.get('SUBMISSION_RETRY_BACKOFF', '5'))  # 재시도마다 두 배
+    SUBMISSION_HEARTBEAT_SECONDS = float(os.environ.get('SUBMISSION_HEARTBEAT_SECONDS', '30'))
+    SUBMISSION_STALE_SECONDS = int(os.environ.get('SUBMISSION_STALE_SECONDS', '300'))  # 하트비트가 끊긴 뒤 회수까지
+    SUBMISSION_STREAM_TIMEOUT = int(os.environ.get('SUBMISSION_STREAM_TIMEOUT', '120'))
+    
+    # 인증 사용자 캐시 (초, 0이면 요청마다 DB 조회)
+    USER_CACHE_TTL = float(os.environ.get('USER_CACHE_TTL', '30'))
+    USER_CACHE_MAX_ENTRIES = int(os.environ.get('USER_CACHE_MAX_ENTRIES', '10000'))
+    
+    # 수업 자료 응답 캐시 (초, 0이면 캐시하지 않음)
+    MATERIAL_CACHE_TTL = float(os.environ.get('MATERIAL_CACHE_TTL', '60'))
+    MATERIAL_CACHE_MAX_ENTRIES = int(os.environ.get('MATERIAL_CACHE_MAX_ENTRIES', '256'))
+    
+    # 제출 본문 저장소 (이 크기 이상의 코드/출력은 압축, 'none'이면 압축하지 않음)
+    BLOB_COMPRESSION = os.environ.get('BLOB_COMPRESSION', 'zlib')  # 'none', 'zlib', 'zstd'
+    BLOB_COMPRESSION_MIN_BYTES = int(os.environ.get('BLOB_COMPRESSION_MIN_BYTES', '1024'))
+    
+    # 순위표 (다른 프로세스의 채점 결과를 반영하기 위해 색인을 다시 만드는 주기, 초)
+    LEADERBOARD_REFRESH_SECONDS = float(os.environ.get('LEADERBOARD_REFRESH_SECONDS', '60'))
+    
+    # 요청 프로파일링 (X-Profile 헤더에 PROFILING_TOKEN을 보내거나 샘플링 비율로 켬,
+    # 느린 요청은 PROFILING_DIR에 최근 PROFILING_MAX_FILES개까지 저장)
+    PROFILING_ENABLED = os.environ.get('PROFILING_ENABLED', 'false').lower() == 'true'
+    PROFILING_TOKEN = os.environ.get('PROFILING_TOKEN', '')
+    PROFILING_SAMPLE_RATE = float(os.environ.get('PROFILING_SAMPLE_RATE', '0'))
+    PROFILING_SLOW_MS = float(os.environ.get('PROFILING_SLOW_MS', '500'))
+    PROFILING_DIR = os.environ.get('PROFILING_DIR', 'instance/profiles')
+    PROFILING_MAX_FILES = int(os.environ.get('PROFILING_MAX_FILES', '200'))
+    
     # 페이지네이션
     ITEMS_PER_PAGE = 20
     
@@ -59,6 +104,7 @@ class TestingConfig(Config):
     TESTING = True
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(minutes=5)
+    SUBMISSION_WORKERS = 0
 
 
 # 설정 딕셔너리
@@ -4,6 +4,15 @@
 from app.models.user import User
 from app.models.material import Material
 from app.models.submission import Submission
+from app.models.problem import Problem
+from app.models.submission_job import SubmissionJob
+from app.models.rendered_content import RenderedContent
+from app.models.content_blob import ContentBlob
+from app.models.material_search_term import MaterialSearchTerm
+from app.models.tag import Tag
+from app.models.user_problem_stat import UserProblemStat
+from app.models.problem_stat import ProblemStat
 
-__all__ = ['User', 'Material', 'Submission']
+__all__ = ['User', 'Material', 'Submission', 'Problem', 'SubmissionJob', 'RenderedContent',
+           'MaterialSearchTerm', 'Tag', 'ContentBlob', 'UserProblemStat', 'ProblemStat']
 
@@ -0,0 +1,38 @@
+"""
+제출 본문 저장소 모델
+"""
+from datetime import datetime
+from app import db
+from app.utils.compression import decompress
+
+
+class ContentBlob(db.Model):
+    """제출 코드/출력 본문 (내용 해시로 식별, 같은 내용은 한 번만 저장)"""
+    __tablename__ = 'content_blobs'
+    
+    # 원문(UTF-8)의 SHA-256
+    hash = db.Column(db.String(64), primary_key=True)
+    
+    # 본문 (작은 본문은 text에 그대로, 큰 본문은 압축해서 data에 저장)
+    text = db.Column(db.Text)
+    data = db.Column(db.LargeBinary)
+    compression = db.Column(db.String(10))  # None, 'zlib', 'zstd'
+    
+    # 압축하지 않고 읽을 수 있는 요약 (목록 조회용)
+    length = db.Column(db.Integer, nullable=False)  # 원문 글자 수
+    preview = db.Column(db.Text)  # 압축한 본문의 앞부분
+    
+    # 이 본문을 참조하는 제출 수 (0이 되면 정리 대상)
+    ref_count = db.Column(db.Integer, nullable=False, default=0)
+    
+    # 타임스탬프
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    
+    def decode(self) -> str:
+        """원문 복원"""
+        if self.compression is None:
+            return self.text
+        return decompress(self.data, self.compression).decode('utf-8')
+    
+    def __repr__(self):
+        return f'<ContentBlob {self.hash[:12]} refs={self.ref_count}>'
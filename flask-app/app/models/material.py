@@ -24,13 +24,18 @@ class Material(db.Model):
     
     # 메타데이터
     description = db.Column(db.String(500))
-    tags = db.Column(db.String(200))  # 쉼표로 구분된 태그
+    # 쉼표로 구분된 태그 (이전 형식, 시작 시 tags 관계로 옮긴 뒤 비움)
+    legacy_tags = db.Column('tags', db.String(200))
     
     # 타임스탬프
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, 
                           onupdate=datetime.utcnow, nullable=False)
     
+    # 관계
+    tags = db.relationship('Tag', secondary='material_tags', lazy='selectin',
+                           order_by='Tag.key')
+    
     def to_dict(self, include_content: bool = True) -> dict:
         """자료 정보를 딕셔너리로 변환"""
         data = {
@@ -39,7 +44,7 @@ class Material(db.Model):
             'category': self.category,
             'difficulty': self.difficulty,
             'description': self.description,
-            'tags': self.tags.split(',') if self.tags else [],
+            'tags': [tag.name for tag in self.tags],
             'order': self.order,
             'created_at': self.created_at.isoformat(),
             'updated_at': self.updated_at.isoformat()
@@ -0,0 +1,22 @@
+"""
+수업 자료 검색 색인 모델
+"""
+from app import db
+
+
+class MaterialSearchTerm(db.Model):
+    """역색인 항목 (토큰이 어느 자료의 어느 필드에 몇 번 나오는지)"""
+    __tablename__ = 'material_search_terms'
+    __table_args__ = (
+        db.Index('ix_material_search_terms_material_id', 'material_id'),
+    )
+    
+    # 토큰으로 먼저 찾으므로 기본 키의 첫 컬럼을 토큰으로 둠
+    term = db.Column(db.String(64), primary_key=True)
+    material_id = db.Column(db.Integer, db.ForeignKey('materials.id', ondelete='CASCADE'),
+                            primary_key=True)
+    field = db.Column(db.String(20), primary_key=True)  # 'title', 'tags', 'description', 'content'
+    frequency = db.Column(db.Integer, nullable=False)
+    
+    def __repr__(self):
+        return f'<MaterialSearchTerm {self.term} in Material {self.material_id}.{self.field}>'
@@ -0,0 +1,51 @@
+"""
+실습 문제 모델
+"""
+from datetime import datetime
+from app import db
+
+
+class Problem(db.Model):
+    """실습 문제 모델"""
+    __tablename__ = 'practice_problems'
+    
+    # 기본 필드
+    id = db.Column(db.Integer, primary_key=True)
+    title = db.Column(db.String(200), nullable=False)
+    description = db.Column(db.Text, nullable=False)
+    
+    # 코드
+    starter_code = db.Column(db.Text)
+    solution_code = db.Column(db.Text)
+    
+    # 채점 설정
+    test_cases = db.Column(db.JSON)  # [{"input": "...", "output": "..."}, ...]
+    compare_mode = db.Column(db.String(20), default='exact')  # 'exact', 'whitespace', 'float'
+    float_tolerance = db.Column(db.Float, default=1e-6)
+    points = db.Column(db.Integer, default=10)
+    
+    # 분류 및 상태
+    difficulty = db.Column(db.String(20), default='beginner')
+    is_active = db.Column(db.Boolean, default=True)
+    
+    # 타임스탬프
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, 
+                          onupdate=datetime.utcnow, nullable=False)
+    
+    def to_dict(self) -> dict:
+        """문제 정보를 딕셔너리로 변환 (정답 코드와 테스트 케이스 제외)"""
+        return {
+            'id': self.id,
+            'title': self.title,
+            'description': self.description,
+            'starter_code': self.starter_code,
+            'difficulty': self.difficulty,
+            'points': self.points,
+            'test_case_count': len(self.test_cases or []),
+            'created_at': self.created_at.isoformat(),
+            'updated_at': self.updated_at.isoformat()
+        }
+    
+    def __repr__(self):
+        return f'<Problem {self.title}>'
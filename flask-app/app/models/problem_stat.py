@@ -0,0 +1,33 @@
+"""
+문제별 풀이 통계 모델
+"""
+from app import db
+
+
+class ProblemStat(db.Model):
+    """문제 하나의 전체 제출 통계 (제출/채점 시 갱신)"""
+    __tablename__ = 'problem_stats'
+    
+    problem_id = db.Column(db.Integer, primary_key=True)
+    
+    # 제출 횟수와 사용자 수
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    attempted_users = db.Column(db.Integer, nullable=False, default=0)
+    solved_users = db.Column(db.Integer, nullable=False, default=0)
+    
+    # 최고 기록
+    best_execution_time = db.Column(db.Float)
+    
+    def to_dict(self) -> dict:
+        """통계 정보를 딕셔너리로 변환"""
+        return {
+            'problem_id': self.problem_id,
+            'attempts': self.attempts,
+            'attempted_users': self.attempted_users,
+            'solved_users': self.solved_users,
+            'solve_rate': round(self.solved_users / self.attempted_users, 4) if self.attempted_users else 0.0,
+            'best_execution_time': self.best_execution_time
+        }
+    
+    def __repr__(self):
+        return f'<ProblemStat Problem {self.problem_id}>'
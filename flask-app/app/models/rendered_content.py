@@ -0,0 +1,20 @@
+"""
+렌더링된 자료 본문 모델
+"""
+from datetime import datetime
+from app import db
+
+
+class RenderedContent(db.Model):
+    """Markdown 본문을 렌더링한 HTML (본문 해시로 식별)"""
+    __tablename__ = 'rendered_contents'
+    
+    # 렌더러 버전과 Markdown 본문의 SHA-256 (같은 본문은 한 번만 렌더링)
+    content_hash = db.Column(db.String(64), primary_key=True)
+    html = db.Column(db.Text, nullable=False)
+    
+    # 타임스탬프
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    
+    def __repr__(self):
+        return f'<RenderedContent {self.content_hash[:12]}>'
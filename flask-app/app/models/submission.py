@@ -2,24 +2,35 @@
 문제 풀이 제출 모델
 """
 from datetime import datetime
+from typing import Iterable, Optional
+from sqlalchemy import func, select
 from app import db
+from app.models.content_blob import ContentBlob
+
+# 목록에 보여줄 코드 앞부분 길이
+CODE_PREVIEW_LENGTH = 200
 
 
 class Submission(db.Model):
     """문제 풀이 제출 모델"""
     __tablename__ = 'submissions'
+    __table_args__ = (
+        # 내 제출 기록(최신순) 및 문제별 기록의 커서 페이지네이션용
+        db.Index('ix_submissions_user_submitted_id', 'user_id', 'submitted_at', 'id'),
+        db.Index('ix_submissions_user_problem_submitted', 'user_id', 'problem_id', 'submitted_at'),
+    )
     
     # 기본 필드
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False, index=True)
     problem_id = db.Column(db.Integer, nullable=False, index=True)
     
-    # 코드 및 결과
-    code = db.Column(db.Text, nullable=False)
+    # 코드 및 결과 (본문은 content_blobs에 내용 해시로 한 번만 저장)
+    code_hash = db.Column(db.String(64), db.ForeignKey('content_blobs.hash'), index=True)
     language = db.Column(db.String(20), default='python')
     
     # 실행 결과
-    output = db.Column(db.Text)
+    output_hash = db.Column(db.String(64), db.ForeignKey('content_blobs.hash'), index=True)
     error = db.Column(db.Text)
     status = db.Column(db.String(20), nullable=False)  # 'success', 'error', 'timeout'
     execution_time = db.Column(db.Float)  # 초 단위
@@ -31,22 +42,69 @@ class Submission(db.Model):
     # 타임스탬프
     submitted_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False, index=True)
     
-    def to_dict(self) -> dict:
-        """제출 정보를 딕셔너리로 변환"""
-        return {
-            'id': self.id,
-            'user_id': self.user_id,
-            'problem_id': self.problem_id,
-            'code': self.code,
-            'language': self.language,
-            'output': self.output,
-            'error': self.error,
-            'status': self.status,
-            'execution_time': self.execution_time,
-            'score': self.score,
-            'is_correct': self.is_correct,
-            'submitted_at': self.submitted_at.isoformat()
-        }
+    # 본문 저장소 도입 전 인라인 본문 (옮긴 뒤에는 비워 둠)
+    legacy_code = db.Column('code', db.Text, nullable=False, default='')
+    legacy_output = db.Column('output', db.Text)
+    
+    code_blob = db.relationship('ContentBlob', foreign_keys=[code_hash])
+    output_blob = db.relationship('ContentBlob', foreign_keys=[output_hash])
+    
+    # 목록용 코드 요약 (DB에서 계산하며, 목록 조회에서만 함께 읽음)
+    code_length = db.column_property(
+        func.coalesce(
+            select(ContentBlob.length).where(ContentBlob.hash == code_hash).scalar_subquery(),
+            func.length(legacy_code)
+        ),
+        deferred=True
+    )
+    code_preview = db.column_property(
+        func.coalesce(
+            select(func.coalesce(ContentBlob.preview, func.substr(ContentBlob.text, 1, CODE_PREVIEW_LENGTH)))
+            .where(ContentBlob.hash == code_hash).scalar_subquery(),
+            func.substr(legacy_code, 1, CODE_PREVIEW_LENGTH)
+        ),
+        deferred=True
+    )
+    
+    # 상세 조회 필드 (fields= 선택자로 고를 수 있음)
+    DETAIL_FIELDS = ('id', 'user_id', 'problem_id', 'code', 'language', 'output', 'error',
+                     'status', 'execution_time', 'score', 'is_correct', 'submitted_at')
+    
+    # 목록 조회 필드 (코드/출력 본문 대신 코드 길이와 앞부분)
+    SUMMARY_FIELDS = ('id', 'user_id', 'problem_id', 'language', 'status', 'execution_time',
+                      'score', 'is_correct', 'submitted_at', 'code_length', 'code_preview')
+    
+    # 본문 저장소를 거치는 필드와 실제로 읽어야 하는 컬럼
+    BLOB_FIELDS = {
+        'code': ('code_hash', 'legacy_code'),
+        'output': ('output_hash', 'legacy_output')
+    }
+    
+    @property
+    def code(self) -> str:
+        """제출 코드"""
+        return self.code_blob.decode() if self.code_blob else self.legacy_code
+    
+    @property
+    def output(self) -> Optional[str]:
+        """실행 출력"""
+        return self.output_blob.decode() if self.output_blob else self.legacy_output
+    
+    def to_dict(self, fields: Optional[Iterable[str]] = None) -> dict:
+        """
+        제출 정보를 딕셔너리로 변환
+        
+        fields를 주면 해당 필드만 읽으므로, 읽지 않은(deferred) 컬럼은 조회하지 않습니다.
+        """
+        data = {}
+        for field in fields or self.DETAIL_FIELDS:
+            value = getattr(self, field)
+            data[field] = value.isoformat() if isinstance(value, datetime) else value
+        return data
+    
+    def to_summary_dict(self) -> dict:
+        """목록용 요약 정보"""
+        return self.to_dict(self.SUMMARY_FIELDS)
     
     def __repr__(self):
         return f'<Submission {self.id} by User {self.user_id}>'
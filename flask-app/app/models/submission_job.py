@@ -0,0 +1,51 @@
+"""
+제출 채점 작업 큐 모델
+"""
+from datetime import datetime
+from app import db
+
+
+class SubmissionJob(db.Model):
+    """제출 채점 작업 (DB 기반 작업 큐)"""
+    __tablename__ = 'submission_jobs'
+    __table_args__ = (
+        db.Index('ix_submission_jobs_status_id', 'status', 'id'),
+    )
+    
+    # 기본 필드
+    id = db.Column(db.Integer, primary_key=True)
+    submission_id = db.Column(db.Integer, db.ForeignKey('submissions.id'),
+                              nullable=False, unique=True)
+    
+    # 작업 상태
+    status = db.Column(db.String(20), nullable=False, default='queued')  # 'queued', 'running', 'done', 'failed'
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    
+    # 결과
+    result = db.Column(db.JSON)  # 채점 결과 (테스트 케이스별 통과 여부 등)
+    error = db.Column(db.Text)
+    
+    # 타임스탬프
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, 
+                          onupdate=datetime.utcnow, nullable=False)
+    started_at = db.Column(db.DateTime)
+    heartbeat_at = db.Column(db.DateTime)  # 채점 중인 워커가 주기적으로 갱신
+    available_at = db.Column(db.DateTime)  # 재시도 대기 중이면 이 시각 이후에 점유
+    finished_at = db.Column(db.DateTime)
+    
+    def to_dict(self) -> dict:
+        """작업 정보를 딕셔너리로 변환"""
+        return {
+            'id': self.id,
+            'submission_id': self.submission_id,
+            'status': self.status,
+            'attempts': self.attempts,
+            'error': self.error,
+            'created_at': self.created_at.isoformat(),
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None
+        }
+    
+    def __repr__(self):
+        return f'<SubmissionJob {self.id} for Submission {self.submission_id}>'
@@ -0,0 +1,40 @@
+"""
+태그 모델
+"""
+from app import db
+
+# 자료-태그 연결 (태그로 자료를 찾는 조회를 위해 tag_id 선두 인덱스를 둠)
+material_tags = db.Table(
+    'material_tags',
+    db.Column('material_id', db.Integer, db.ForeignKey('materials.id', ondelete='CASCADE'),
+              primary_key=True),
+    db.Column('tag_id', db.Integer, db.ForeignKey('tags.id', ondelete='CASCADE'),
+              primary_key=True),
+    db.Index('ix_material_tags_tag_id_material_id', 'tag_id', 'material_id')
+)
+
+
+class Tag(db.Model):
+    """수업 자료 태그"""
+    __tablename__ = 'tags'
+    __table_args__ = (
+        db.Index('ix_tags_key', 'key', unique=True),
+    )
+    
+    # 기본 필드 (name은 처음 입력한 대소문자 그대로 표시, key는 대소문자를 구분하지 않는 비교용)
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(50), unique=True, nullable=False, index=True)
+    key = db.Column(db.String(50))
+    
+    # 공개된 자료 수 (자료 생성/수정 시 갱신)
+    material_count = db.Column(db.Integer, nullable=False, default=0)
+    
+    def to_dict(self) -> dict:
+        """태그 정보를 딕셔너리로 변환"""
+        return {
+            'name': self.name,
+            'count': self.material_count
+        }
+    
+    def __repr__(self):
+        return f'<Tag {self.name}>'
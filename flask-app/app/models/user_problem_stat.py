@@ -0,0 +1,42 @@
+"""
+사용자별 문제 풀이 통계 모델
+"""
+from app import db
+
+
+class UserProblemStat(db.Model):
+    """사용자 한 명의 문제별 제출 통계 (제출/채점 시 갱신)"""
+    __tablename__ = 'user_problem_stats'
+    __table_args__ = (
+        # 문제별 통계 재계산 및 순위 조회용
+        db.Index('ix_user_problem_stats_problem_user', 'problem_id', 'user_id'),
+    )
+    
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), primary_key=True)
+    problem_id = db.Column(db.Integer, primary_key=True)
+    
+    # 제출 횟수
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    
+    # 최고 기록
+    best_score = db.Column(db.Integer)
+    best_execution_time = db.Column(db.Float)  # 정상 실행된 제출 중 가장 빠른 시간 (초)
+    
+    # 타임스탬프
+    first_solved_at = db.Column(db.DateTime)  # 처음 정답을 맞힌 제출 시각
+    last_submitted_at = db.Column(db.DateTime)
+    
+    def to_dict(self) -> dict:
+        """통계 정보를 딕셔너리로 변환"""
+        return {
+            'problem_id': self.problem_id,
+            'attempts': self.attempts,
+            'best_score': self.best_score,
+            'best_execution_time': self.best_execution_time,
+            'solved': self.first_solved_at is not None,
+            'first_solved_at': self.first_solved_at.isoformat() if self.first_solved_at else None,
+            'last_submitted_at': self.last_submitted_at.isoformat() if self.last_submitted_at else None
+        }
+    
+    def __repr__(self):
+        return f'<UserProblemStat User {self.user_id} Problem {self.problem_id}>'
@@ -4,7 +4,7 @@
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import create_access_token, create_refresh_token, jwt_required, get_jwt_identity
 from app.services.auth_service import AuthService
-from app.utils.decorators import jwt_required_with_user
+from app.utils.decorators import jwt_required_with_user, admin_required
 
 auth_bp = Blueprint('auth', __name__)
 
@@ -119,6 +119,45 @@ def update_profile(current_user):
     }), 200
 
 
+@auth_bp.route('/users/<int:user_id>/status', methods=['PUT'])
+@admin_required
+def update_user_status(current_user, user_id):
+    """계정 활성화/비활성화 (관리자 전용)"""
+    data = request.get_json()
+    
+    if not data or not isinstance(data.get('is_active'), bool):
+        return jsonify({
+            'success': False,
+            'error': 'is_active 값(true/false)이 필요합니다'
+        }), 400
+    
+    if user_id == current_user.id and not data['is_active']:
+        return jsonify({
+            'success': False,
+            'error': '자기 자신은 비활성화할 수 없습니다'
+        }), 400
+    
+    user = AuthService.get_user_by_id(user_id)
+    if not user:
+        return jsonify({
+            'success': False,
+            'error': '사용자를 찾을 수 없습니다'
+        }), 404
+    
+    success, error = AuthService.set_user_active(user, data['is_active'])
+    
+    if not success:
+        return jsonify({
+            'success': False,
+            'error': error
+        }), 400
+    
+    return jsonify({
+        'success': True,
+        'data': user.to_dict(include_email=True)
+    }), 200
+
+
 @auth_bp.route('/refresh', methods=['POST'])
 @jwt_required(refresh=True)
 def refresh():
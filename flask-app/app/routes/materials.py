@@ -1,53 +1,155 @@
 """
 수업 자료 API 라우트
 """
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, current_app, request, jsonify
+from app.services.material_cache import CachedResponse, material_cache
+from app.services.material_search_service import MaterialSearchService
 from app.services.material_service import MaterialService
+from app.services.tag_service import TAG_MATCH_MODES, TagService
 from app.utils.decorators import admin_required
 
 materials_bp = Blueprint('materials', __name__)
 
+# 상세 조회 본문 형식 (markdown: 원문, html: 서버 렌더링 결과)
+CONTENT_FORMATS = ('markdown', 'html')
+
+# 검색어 최대 길이와 결과 수 제한
+MAX_SEARCH_QUERY_LENGTH = 100
+MAX_SEARCH_LIMIT = 50
+
+
+def _conditional_response(cached: CachedResponse):
+    """
+    캐시된 응답에 ETag/Last-Modified를 붙이고, 클라이언트가 가진 것과
+    같으면 본문 없이 304로 응답
+    """
+    response = current_app.response_class(cached.body, mimetype='application/json')
+    response.set_etag(cached.etag)
+    response.last_modified = cached.last_modified
+    # 브라우저가 매번 재검증하도록 하여 수정 사항이 바로 보이게 함
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
 
 @materials_bp.route('', methods=['GET'])
 def get_materials():
-    """수업 자료 목록 조회"""
+    """
+    수업 자료 목록 조회
+    
+    tags=a,b로 태그를 지정하면 match=any(기본)는 하나라도, match=all은 모두 가진 자료만 반환합니다.
+    """
     category = request.args.get('category')
     difficulty = request.args.get('difficulty')
+    tags = TagService.parse_tags(request.args.get('tags'))
+    tag_match = request.args.get('match', 'any')
     
-    materials = MaterialService.get_all_materials(category, difficulty)
+    if tag_match not in TAG_MATCH_MODES:
+        return jsonify({
+            'success': False,
+            'error': f'match는 {", ".join(TAG_MATCH_MODES)} 중 하나여야 합니다'
+        }), 400
+    
+    def build():
+        materials = MaterialService.get_all_materials(category, difficulty, tags, tag_match)
+        payload = {
+            'success': True,
+            'data': [material.to_dict(include_content=False) for material in materials]
+        }
+        return payload, max((material.updated_at for material in materials), default=None)
+    
+    cached = material_cache.get_or_build(
+        ('list', category, difficulty, tuple(tags), tag_match if tags else None), build
+    )
+    return _conditional_response(cached)
+
+
+@materials_bp.route('/search', methods=['GET'])
+def search_materials():
+    """수업 자료 검색 (제목, 태그, 설명, 본문)"""
+    query = (request.args.get('q') or '').strip()
+    limit = request.args.get('limit', 20, type=int)
+    
+    if not query:
+        return jsonify({
+            'success': False,
+            'error': '검색어를 입력해주세요'
+        }), 400
+    
+    if len(query) > MAX_SEARCH_QUERY_LENGTH:
+        return jsonify({
+            'success': False,
+            'error': f'검색어는 {MAX_SEARCH_QUERY_LENGTH}자 이하로 입력해주세요'
+        }), 400
+    
+    results = MaterialSearchService.search(query, max(1, min(limit, MAX_SEARCH_LIMIT)))
     
     return jsonify({
         'success': True,
-        'data': [material.to_dict(include_content=False) for material in materials]
+        'data': results
     }), 200
 
 
 @materials_bp.route('/<int:material_id>', methods=['GET'])
 def get_material(material_id):
-    """수업 자료 상세 조회"""
-    material = MaterialService.get_material_by_id(material_id)
+    """
+    수업 자료 상세 조회
+    
+    format=html이면 Markdown 본문(content) 대신 서버에서 렌더링한
+    HTML(content_html)을 반환합니다.
+    """
+    content_format = request.args.get('format', 'markdown')
+    if content_format not in CONTENT_FORMATS:
+        return jsonify({
+            'success': False,
+            'error': f'지원하지 않는 형식입니다: {content_format}'
+        }), 400
+    
+    def build():
+        material = MaterialService.get_material_by_id(material_id)
+        if not material:
+            return None
+        if content_format == 'html':
+            data = material.to_dict(include_content=False)
+            data['content_html'] = MaterialService.get_content_html(material)
+        else:
+            data = material.to_dict(include_content=True)
+        return {'success': True, 'data': data}, material.updated_at
+    
+    cached = material_cache.get_or_build(('detail', material_id, content_format), build)
     
-    if not material:
+    if not cached:
         return jsonify({
             'success': False,
             'error': '자료를 찾을 수 없습니다'
         }), 404
     
-    return jsonify({
-        'success': True,
-        'data': material.to_dict(include_content=True)
-    }), 200
+    return _conditional_response(cached)
 
 
 @materials_bp.route('/categories', methods=['GET'])
 def get_categories():
     """카테고리 목록 조회"""
-    categories = MaterialService.get_categories()
+    def build():
+        payload = {
+            'success': True,
+            'data': MaterialService.get_categories()
+        }
+        return payload, None
     
-    return jsonify({
-        'success': True,
-        'data': categories
-    }), 200
+    return _conditional_response(material_cache.get_or_build(('categories',), build))
+
+
+@materials_bp.route('/tags', methods=['GET'])
+def get_tags():
+    """태그 목록과 태그별 공개 자료 수 조회"""
+    def build():
+        payload = {
+            'success': True,
+            'data': [tag.to_dict() for tag in TagService.get_tags()]
+        }
+        return payload, None
+    
+    return _conditional_response(material_cache.get_or_build(('tags',), build))
 
 
 @materials_bp.route('', methods=['POST'])
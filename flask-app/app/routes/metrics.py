@@ -0,0 +1,14 @@
+"""
+Prometheus 메트릭 라우트
+"""
+from flask import Blueprint, Response
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+from app.utils.metrics import get_registry
+
+metrics_bp = Blueprint('metrics', __name__)
+
+
+@metrics_bp.route('/metrics')
+def metrics():
+    """Prometheus 형식 메트릭"""
+    return Response(generate_latest(get_registry()), content_type=CONTENT_TYPE_LATEST)
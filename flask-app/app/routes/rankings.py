@@ -0,0 +1,43 @@
+"""
+순위표 API 라우트
+"""
+from flask import Blueprint, request, jsonify
+from app.services.leaderboard import leaderboard
+from app.utils.decorators import jwt_required_with_user
+
+rankings_bp = Blueprint('rankings', __name__)
+
+# 한 번에 조회할 수 있는 최대 순위 수
+MAX_LIMIT = 100
+
+
+def _limit() -> int:
+    return max(1, min(request.args.get('limit', 10, type=int), MAX_LIMIT))
+
+
+@rankings_bp.route('', methods=['GET'])
+@jwt_required_with_user
+def get_overall_ranking(current_user):
+    """
+    전체 순위 (문제별 최고 점수 합 내림차순, 실행 시간 합 오름차순)
+    
+    상위 limit명(기본 10, 최대 100)과 내 순위(me)를 함께 반환합니다.
+    """
+    return jsonify({
+        'success': True,
+        'data': leaderboard.get_overall_ranking(current_user.id, _limit())
+    }), 200
+
+
+@rankings_bp.route('/problems/<int:problem_id>', methods=['GET'])
+@jwt_required_with_user
+def get_problem_ranking(current_user, problem_id):
+    """
+    문제별 순위 (최고 점수 내림차순, 최단 실행 시간 오름차순)
+    
+    상위 limit명(기본 10, 최대 100)과 내 순위(me)를 함께 반환합니다.
+    """
+    return jsonify({
+        'success': True,
+        'data': leaderboard.get_problem_ranking(problem_id, current_user.id, _limit())
+    }), 200
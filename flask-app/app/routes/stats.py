@@ -0,0 +1,84 @@
+"""
+제출 통계 API 라우트
+"""
+from flask import Blueprint, jsonify
+from app.services.auth_service import AuthService
+from app.services.leaderboard import leaderboard
+from app.services.stats_service import StatsService
+from app.utils.decorators import admin_required, jwt_required_with_user
+
+stats_bp = Blueprint('stats', __name__)
+
+
+@stats_bp.route('/me', methods=['GET'])
+@jwt_required_with_user
+def get_my_stats(current_user):
+    """내 문제별 풀이 통계 (시도/해결한 문제 수, 최고 점수, 최단 실행 시간)"""
+    return jsonify({
+        'success': True,
+        'data': StatsService.get_user_stats(current_user.id)
+    }), 200
+
+
+@stats_bp.route('/users/<int:user_id>', methods=['GET'])
+@admin_required
+def get_user_stats(current_user, user_id):
+    """사용자의 문제별 풀이 통계 (관리자 전용)"""
+    if not AuthService.get_user_by_id(user_id):
+        return jsonify({
+            'success': False,
+            'error': '사용자를 찾을 수 없습니다'
+        }), 404
+    
+    return jsonify({
+        'success': True,
+        'data': StatsService.get_user_stats(user_id)
+    }), 200
+
+
+@stats_bp.route('/problems', methods=['GET'])
+@jwt_required_with_user
+def get_problem_stats_list(current_user):
+    """제출이 있는 모든 문제의 통계 (제출 수, 시도/해결한 사용자 수)"""
+    return jsonify({
+        'success': True,
+        'data': [stat.to_dict() for stat in StatsService.get_all_problem_stats()]
+    }), 200
+
+
+@stats_bp.route('/problems/<int:problem_id>', methods=['GET'])
+@jwt_required_with_user
+def get_problem_stats(current_user, problem_id):
+    """문제 통계 조회"""
+    stat = StatsService.get_problem_stats(problem_id)
+    
+    if not stat:
+        return jsonify({
+            'success': False,
+            'error': '문제 통계를 찾을 수 없습니다'
+        }), 404
+    
+    return jsonify({
+        'success': True,
+        'data': stat.to_dict()
+    }), 200
+
+
+@stats_bp.route('/rebuild', methods=['POST'])
+@admin_required
+def rebuild_stats(current_user):
+    """제출 기록 전체로 통계 다시 계산 (관리자 전용)"""
+    success, counts, error = StatsService.rebuild()
+    
+    if not success:
+        return jsonify({
+            'success': False,
+            'error': error
+        }), 500
+    
+    leaderboard.rebuild()
+    
+    return jsonify({
+        'success': True,
+        'data': {'message': '통계를 다시 계산했습니다', **counts}
+    }), 200
@@ -1,15 +1,20 @@
 """
 문제 풀이 제출 API 라우트
 """
-from flask import Blueprint, request, jsonify
-from app import db
+import json
+from flask import Blueprint, Response, current_app, request, jsonify, stream_with_context, url_for
 from app.models.submission import Submission
-from app.services.code_runner_service import CodeRunnerService
+from app.services.code_runner_service import CodeRunnerError, CodeRunnerService
+from app.services.submission_queue import submission_queue
+from app.services.submission_service import SubmissionService
 from app.utils.decorators import jwt_required_with_user
 from app.utils.validators import validate_code
 
 submissions_bp = Blueprint('submissions', __name__)
 
+# 제출 기록 한 페이지의 최대 항목 수
+MAX_PER_PAGE = 100
+
 
 @submissions_bp.route('/execute', methods=['POST'])
 @jwt_required_with_user
@@ -48,6 +53,63 @@ def execute_code(current_user):
     }), 200
 
 
+@submissions_bp.route('/execute/stream', methods=['POST'])
+@jwt_required_with_user
+def execute_code_stream(current_user):
+    """
+    코드 실행 결과를 실시간으로 중계 (제출하지 않고 테스트)
+    
+    응답은 줄마다 {"type": "start" | "stdout" | "stderr" | "result" | "error", ...}
+    형태의 NDJSON입니다.
+    """
+    data = request.get_json()
+    
+    if not data:
+        return jsonify({
+            'success': False,
+            'error': '요청 데이터가 없습니다'
+        }), 400
+    
+    code = data.get('code')
+    
+    # 코드 검증
+    is_valid, error = validate_code(code)
+    if not is_valid:
+        return jsonify({
+            'success': False,
+            'error': error
+        }), 400
+    
+    # 실행이 받아들여졌는지(start 이벤트) 확인한 뒤 스트리밍 시작
+    events = CodeRunnerService.stream_code(code)
+    try:
+        first_event = next(events)
+    except StopIteration:
+        first_event = None
+    except CodeRunnerError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+    
+    def generate():
+        try:
+            if first_event is not None:
+                yield json.dumps(first_event, ensure_ascii=False) + '\n'
+            for event in events:
+                yield json.dumps(event, ensure_ascii=False) + '\n'
+        except CodeRunnerError as e:
+            yield json.dumps({'type': 'error', 'error': str(e)}, ensure_ascii=False) + '\n'
+        finally:
+            events.close()
+    
+    return Response(
+        stream_with_context(generate()),
+        mimetype='application/x-ndjson',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+
 @submissions_bp.route('', methods=['POST'])
 @jwt_required_with_user
 def submit_code(current_user):
@@ -77,35 +139,39 @@ def submit_code(current_user):
             'error': error
         }), 400
     
-    # 코드 실행
-    success, result, error = CodeRunnerService.execute_code(code)
-    
-    # 제출 기록 저장
-    submission = Submission(
-        user_id=current_user.id,
-        problem_id=problem_id,
-        code=code,
-        output=result.get('output') if success else None,
-        error=result.get('error') if success else error,
-        status='success' if success and result.get('success') else 'error',
-        execution_time=result.get('execution_time') if success else None
+    # 제출 기록 및 채점 작업 생성
+    success, submission, error = SubmissionService.create_submission(
+        current_user.id, problem_id, code
     )
     
-    try:
-        db.session.add(submission)
-        db.session.commit()
-    except Exception as e:
-        db.session.rollback()
+    if not success:
         return jsonify({
             'success': False,
-            'error': f'제출 저장 중 오류가 발생했습니다: {str(e)}'
+            'error': error
         }), 500
     
+    # 워커가 있으면 대기열에 넣고 바로 응답
+    if submission_queue.is_async:
+        submission_queue.notify()
+        return jsonify({
+            'success': True,
+            'data': {
+                'submission': submission.to_dict(),
+                'status_url': url_for('submissions.get_submission', submission_id=submission.id),
+                'events_url': url_for('submissions.stream_submission', submission_id=submission.id)
+            }
+        }), 202
+    
+    # 워커가 없으면 요청 안에서 바로 채점
+    submission_queue.process(submission.id)
+    detail = SubmissionService.get_submission_detail(submission)
+    
     return jsonify({
         'success': True,
         'data': {
             'submission': submission.to_dict(),
-            'execution_result': result if success else None
+            'execution_result': SubmissionService.get_execution_result(submission),
+            'judge_result': detail['judge_result']
         }
     }), 201
 
@@ -113,28 +179,34 @@ def submit_code(current_user):
 @submissions_bp.route('/my', methods=['GET'])
 @jwt_required_with_user
 def get_my_submissions(current_user):
-    """내 제출 기록 조회"""
-    problem_id = request.args.get('problem_id', type=int)
-    page = request.args.get('page', 1, type=int)
-    per_page = request.args.get('per_page', 20, type=int)
-    
-    query = Submission.query.filter_by(user_id=current_user.id)
+    """
+    내 제출 기록 조회 (최신순, 커서 페이지네이션)
     
-    if problem_id:
-        query = query.filter_by(problem_id=problem_id)
-    
-    query = query.order_by(Submission.submitted_at.desc())
+    다음 페이지는 응답의 next_cursor를 cursor로 넘겨 조회하며,
+    include_total=true일 때만 전체 개수(total)를 계산합니다.
+    """
+    problem_id = request.args.get('problem_id', type=int)
+    per_page = max(1, min(request.args.get('per_page', 20, type=int), MAX_PER_PAGE))
+    cursor = request.args.get('cursor')
+    include_total = request.args.get('include_total', 'false').lower() == 'true'
     
-    pagination = query.paginate(page=page, per_page=per_page, error_out=False)
+    try:
+        submissions, next_cursor, total = SubmissionService.list_user_submissions(
+            current_user.id, problem_id, per_page, cursor, include_total
+        )
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
     
     return jsonify({
         'success': True,
         'data': {
-            'submissions': [submission.to_dict() for submission in pagination.items],
-            'total': pagination.total,
-            'page': page,
+            'submissions': [submission.to_summary_dict() for submission in submissions],
             'per_page': per_page,
-            'pages': pagination.pages
+            'next_cursor': next_cursor,
+            'total': total
         }
     }), 200
 
@@ -142,7 +214,37 @@ def get_my_submissions(current_user):
 @submissions_bp.route('/<int:submission_id>', methods=['GET'])
 @jwt_required_with_user
 def get_submission(current_user, submission_id):
-    """제출 상세 조회"""
+    """
+    제출 상세 조회
+    
+    fields=status,score처럼 필요한 필드만 골라 받을 수 있습니다 (기본: 전체).
+    """
+    try:
+        fields = SubmissionService.parse_detail_fields(request.args.get('fields'))
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    
+    submission = SubmissionService.get_user_submission(current_user.id, submission_id, fields)
+    
+    if not submission:
+        return jsonify({
+            'success': False,
+            'error': '제출을 찾을 수 없습니다'
+        }), 404
+    
+    return jsonify({
+        'success': True,
+        'data': SubmissionService.get_submission_detail(submission, fields)
+    }), 200
+
+
+@submissions_bp.route('/<int:submission_id>/events', methods=['GET'])
+@jwt_required_with_user
+def stream_submission(current_user, submission_id):
+    """제출 채점 상태 스트리밍 (Server-Sent Events)"""
     submission = Submission.query.filter_by(
         id=submission_id,
         user_id=current_user.id
@@ -154,8 +256,15 @@ def get_submission(current_user, submission_id):
             'error': '제출을 찾을 수 없습니다'
         }), 404
     
-    return jsonify({
-        'success': True,
-        'data': submission.to_dict()
-    }), 200
+    events = SubmissionService.iter_events(
+        submission_id,
+        poll_interval=current_app.config['SUBMISSION_POLL_INTERVAL'],
+        timeout=current_app.config['SUBMISSION_STREAM_TIMEOUT']
+    )
+    
+    return Response(
+        stream_with_context(events),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
 
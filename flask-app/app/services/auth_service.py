@@ -4,6 +4,8 @@
 from typing import Tuple, Optional, Dict
 from app import db
 from app.models.user import User
+from app.services.leaderboard import leaderboard
+from app.services.user_cache import user_cache
 from app.utils.validators import validate_email, validate_username, validate_password
 
 
@@ -95,8 +97,32 @@ class AuthService:
                 user.bio = data['bio']
             
             db.session.commit()
+            user_cache.invalidate(user.id)
             return True, None
         except Exception as e:
             db.session.rollback()
             return False, f"프로필 업데이트 중 오류가 발생했습니다: {str(e)}"
-
+    
+    @staticmethod
+    def set_user_active(user: User, is_active: bool) -> Tuple[bool, Optional[str]]:
+        """
+        계정 활성화/비활성화 (관리자용)
+        
+        비활성화된 사용자는 캐시가 무효화되므로 다음 요청부터 바로 거부되며,
+        순위표에서도 바로 빠집니다.
+        
+        Returns:
+            (success, error_message)
+        """
+        try:
+            user.is_active = is_active
+            db.session.commit()
+            user_cache.invalidate(user.id)
+            if is_active:
+                leaderboard.rebuild()
+            else:
+                leaderboard.remove_user(user.id)
+            return True, None
+        except Exception as e:
+            db.session.rollback()
+            return False, f"계정 상태 변경 중 오류가 발생했습니다: {str(e)}"
@@ -0,0 +1,167 @@
+"""
+제출 본문 저장소 서비스
+
+제출 코드와 실행 출력을 원문의 SHA-256으로 식별해 content_blobs에 한 번만
+저장하고, 제출은 해시로 참조합니다. 학생이 거의 같은 코드를 여러 번 제출하거나
+같은 문제의 출력이 반 전체에서 같아도 본문은 한 벌만 남습니다.
+
+BLOB_COMPRESSION_MIN_BYTES보다 큰 본문은 BLOB_COMPRESSION 방식으로 압축하며,
+참조 수(ref_count)가 0이 된 본문은 cleanup_blobs.py로 정리합니다.
+"""
+import hashlib
+from typing import Optional
+from flask import current_app
+from sqlalchemy import delete, event, func, select, update
+from app import db
+from app.models.content_blob import ContentBlob
+from app.models.submission import CODE_PREVIEW_LENGTH, Submission
+from app.utils.compression import compress
+from app.utils.upsert import insert_ignore
+
+# 본문을 옮긴 뒤 이전 인라인 컬럼에 남기는 값 (code 컬럼은 NOT NULL)
+LEGACY_CLEARED = {'code': '', 'output': None}
+
+
+class BlobService:
+    """제출 본문 저장 및 정리 관련 비즈니스 로직"""
+    
+    @staticmethod
+    def encode(text: str) -> dict:
+        """본문을 저장할 컬럼 값으로 변환 (큰 본문은 압축)"""
+        raw = text.encode('utf-8')
+        values = {
+            'hash': hashlib.sha256(raw).hexdigest(),
+            'length': len(text),
+            'text': text,
+            'data': None,
+            'compression': None,
+            'preview': None
+        }
+        
+        config = current_app.config
+        if config['BLOB_COMPRESSION'] != 'none' and len(raw) >= config['BLOB_COMPRESSION_MIN_BYTES']:
+            method, data = compress(raw, config['BLOB_COMPRESSION'])
+            # 압축해도 줄지 않는 본문(이미 무작위에 가까운 출력 등)은 그대로 저장
+            if len(data) < len(raw):
+                values.update(text=None, data=data, compression=method,
+                              preview=text[:CODE_PREVIEW_LENGTH])
+        return values
+    
+    @staticmethod
+    def store(text: str) -> ContentBlob:
+        """
+        본문을 저장하고 참조 수를 1 늘림 (커밋은 호출자가 수행)
+        
+        Returns:
+            저장된(또는 이미 있던) 본문
+        """
+        values = BlobService.encode(text)
+        blob_hash = values['hash']
+        
+        # 정리 작업이 그 사이에 지운 경우를 대비해 한 번 더 시도
+        for _ in range(2):
+            insert_ignore(ContentBlob, values)
+            result = db.session.execute(
+                update(ContentBlob)
+                .where(ContentBlob.hash == blob_hash)
+                .values(ref_count=ContentBlob.ref_count + 1),
+                execution_options={'synchronize_session': False}
+            )
+            if result.rowcount:
+                break
+        
+        return db.session.get(ContentBlob, blob_hash)
+    
+    @staticmethod
+    def release(blob_hash: Optional[str]) -> None:
+        """본문 참조 수를 1 줄임 (0이 되어도 바로 지우지 않고 정리 작업에서 삭제)"""
+        if blob_hash is None:
+            return
+        db.session.execute(
+            update(ContentBlob)
+            .where(ContentBlob.hash == blob_hash)
+            .values(ref_count=ContentBlob.ref_count - 1),
+            execution_options={'synchronize_session': False}
+        )
+    
+    @staticmethod
+    def attach(submission: Submission, field: str, text: Optional[str]) -> None:
+        """
+        제출의 코드/출력 본문 설정 (이전 본문의 참조는 해제)
+        
+        Args:
+            submission: 제출 기록
+            field: 'code' 또는 'output'
+            text: 새 본문 (None이면 비움)
+        """
+        hash_column, legacy_column = Submission.BLOB_FIELDS[field]
+        previous = getattr(submission, hash_column)
+        
+        setattr(submission, f'{field}_blob', BlobService.store(text) if text is not None else None)
+        setattr(submission, legacy_column, LEGACY_CLEARED[field])
+        BlobService.release(previous)
+    
+    @staticmethod
+    def migrate_inline_submissions(batch_size: int = 500) -> int:
+        """
+        본문 저장소 도입 전 제출의 인라인 코드/출력을 content_blobs로 옮김
+        
+        옮긴 제출은 이전 컬럼을 비우므로 여러 번 실행해도 안전합니다.
+        
+        Returns:
+            옮긴 제출 수
+        """
+        migrated = 0
+        while True:
+            submissions = Submission.query.filter(Submission.code_hash.is_(None)) \
+                .order_by(Submission.id).limit(batch_size).all()
+            if not submissions:
+                return migrated
+            
+            for submission in submissions:
+                legacy_code, legacy_output = submission.legacy_code, submission.legacy_output
+                BlobService.attach(submission, 'code', legacy_code)
+                BlobService.attach(submission, 'output', legacy_output)
+            db.session.commit()
+            migrated += len(submissions)
+    
+    @staticmethod
+    def collect_garbage(recount: bool = False) -> int:
+        """
+        참조하는 제출이 없는 본문 삭제
+        
+        Args:
+            recount: 삭제 전에 submissions 테이블로 참조 수를 다시 계산할지 여부
+                     (프로세스 중단 등으로 참조 수가 어긋났을 때 사용)
+        
+        Returns:
+            삭제한 본문 수
+        """
+        if recount:
+            code_refs = select(func.count()).select_from(Submission) \
+                .where(Submission.code_hash == ContentBlob.hash).scalar_subquery()
+            output_refs = select(func.count()).select_from(Submission) \
+                .where(Submission.output_hash == ContentBlob.hash).scalar_subquery()
+            db.session.execute(
+                update(ContentBlob).values(ref_count=code_refs + output_refs),
+                execution_options={'synchronize_session': False}
+            )
+        
+        result = db.session.execute(
+            delete(ContentBlob).where(ContentBlob.ref_count <= 0),
+            execution_options={'synchronize_session': False}
+        )
+        db.session.commit()
+        return result.rowcount
+
+
+@event.listens_for(Submission, 'after_delete')
+def _release_deleted_submission(mapper, connection, target: Submission) -> None:
+    """ORM으로 제출을 삭제하면 어느 경로든 본문 참조를 해제"""
+    for blob_hash in (target.code_hash, target.output_hash):
+        if blob_hash is not None:
+            connection.execute(
+                update(ContentBlob)
+                .where(ContentBlob.hash == blob_hash)
+                .values(ref_count=ContentBlob.ref_count - 1)
+            )
@@ -1,22 +1,36 @@
 """
 코드 실행 서비스
 """
+import json
 import requests
-from typing import Dict, Tuple, Optional
+from typing import Dict, Iterator, List, Tuple, Optional, Union
 from flask import current_app
+from app.services.runner_client import get_runner_client
+from app.utils.profiling import profile_section
+
+
+class CodeRunnerError(Exception):
+    """코드 러너 호출 실패"""
+
+
+class RunnerUnavailableError(CodeRunnerError):
+    """코드 러너가 요청을 처리하지 못함 (과부하, 연결 실패, 응답 시간 초과 등, 다시 시도할 수 있음)"""
 
 
 class CodeRunnerService:
     """코드 실행 관련 비즈니스 로직"""
     
     @staticmethod
-    def execute_code(code: str, timeout: Optional[int] = None) -> Tuple[bool, Dict, Optional[str]]:
+    def execute_code(code: str, timeout: Optional[int] = None,
+                     stdin: Union[str, List[str], None] = None) -> Tuple[bool, Dict, Optional[str]]:
         """
         코드 실행 요청
         
         Args:
             code: 실행할 Python 코드
             timeout: 타임아웃 (초), None이면 설정값 사용
+            stdin: 표준 입력, 또는 한 프로세스에서 차례로 실행할 입력 목록
+                   (목록이면 입력별 결과가 result_data['cases']에 담김)
         
         Returns:
             (success, result_data, error_message)
@@ -24,22 +38,24 @@ class CodeRunnerService:
         if timeout is None:
             timeout = current_app.config['CODE_EXECUTION_TIMEOUT']
         
-        code_runner_url = current_app.config['CODE_RUNNER_URL']
+        # 입력 목록은 입력마다 타임아웃이 적용되므로 HTTP 타임아웃도 늘림
+        run_count = len(stdin) if isinstance(stdin, list) else 1
         
         try:
-            response = requests.post(
-                f'{code_runner_url}/execute',
-                json={'code': code, 'timeout': timeout},
-                timeout=timeout + 5  # 여유를 두고 HTTP 타임아웃 설정
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                return True, data, None
-            else:
-                return False, {}, f'코드 실행 서비스 오류: {response.status_code}'
-        
-        except requests.exceptions.Timeout:
+            with profile_section('code_runner'), get_runner_client().open(
+                'POST', '/execute',
+                json={'code': code, 'timeout': timeout, 'stdin': stdin},
+                read_timeout=(timeout + 1) * run_count + 5  # 여유를 두고 HTTP 타임아웃 설정
+            ) as response:
+                if response.status_code == 200:
+                    data = response.json()
+                    return True, data, None
+                elif response.status_code == 503:
+                    return False, {}, '코드 실행 요청이 많습니다. 잠시 후 다시 시도해주세요'
+                else:
+                    return False, {}, f'코드 실행 서비스 오류: {response.status_code}'
+        
+        except requests.exceptions.ReadTimeout:
             return False, {}, '코드 실행 시간이 초과되었습니다'
         
         except requests.exceptions.ConnectionError:
@@ -48,14 +64,131 @@ class CodeRunnerService:
         except Exception as e:
             return False, {}, f'코드 실행 중 오류가 발생했습니다: {str(e)}'
     
+    @staticmethod
+    def stream_code(code: str, timeout: Optional[int] = None) -> Iterator[Dict]:
+        """
+        코드를 실행하며 코드 러너의 출력 이벤트를 실시간으로 반환
+        
+        실행 슬롯을 얻으면 start 이벤트가 먼저 오므로, 첫 이벤트를 받는 시점에
+        요청이 받아들여졌는지 알 수 있습니다. 반복을 중간에 멈추면 연결이 닫히고
+        코드 러너가 실행을 취소합니다.
+        
+        Yields:
+            {"type": "start" | "stdout" | "stderr" | "result", ...}
+        
+        Raises:
+            CodeRunnerError: 코드 러너 호출에 실패한 경우
+        """
+        if timeout is None:
+            timeout = current_app.config['CODE_EXECUTION_TIMEOUT']
+        
+        try:
+            with profile_section('code_runner'), get_runner_client().open(
+                'POST', '/execute/stream',
+                json={'code': code, 'timeout': timeout},
+                stream=True,
+                read_timeout=timeout + 5  # 다음 이벤트를 기다리는 최대 시간
+            ) as response:
+                if response.status_code == 503:
+                    raise RunnerUnavailableError('코드 실행 요청이 많습니다. 잠시 후 다시 시도해주세요')
+                if response.status_code != 200:
+                    raise CodeRunnerError(f'코드 실행 서비스 오류: {response.status_code}')
+                
+                for line in response.iter_lines():
+                    if line:
+                        yield json.loads(line)
+        
+        except requests.exceptions.ReadTimeout:
+            raise RunnerUnavailableError('코드 실행 시간이 초과되었습니다')
+        
+        except requests.exceptions.ConnectionError:
+            raise RunnerUnavailableError('코드 실행 서비스에 연결할 수 없습니다')
+        
+        except (requests.exceptions.RequestException, ValueError) as e:
+            raise CodeRunnerError(f'코드 실행 중 오류가 발생했습니다: {str(e)}')
+    
+    @staticmethod
+    def execute_batch(items: List[Dict], timeout: Optional[int] = None) -> Tuple[bool, List[Dict], Optional[str]]:
+        """
+        여러 코드를 한 번의 요청으로 병렬 실행
+        
+        Args:
+            items: {'code': ..., 'stdin': ...} 형태의 실행 항목 목록
+            timeout: 항목별 타임아웃 (초), None이면 설정값 사용
+        
+        Returns:
+            (success, results, error_message) - results는 items와 같은 순서
+        """
+        results: List[Optional[Dict]] = [None] * len(items)
+        
+        try:
+            for index, result in CodeRunnerService.iter_batch(items, timeout):
+                results[index] = result
+        except CodeRunnerError as e:
+            return False, [], str(e)
+        
+        if any(result is None for result in results):
+            return False, [], '일부 코드의 실행 결과를 받지 못했습니다'
+        
+        return True, results, None
+    
+    @staticmethod
+    def iter_batch(items: List[Dict], timeout: Optional[int] = None) -> Iterator[Tuple[int, Dict]]:
+        """
+        배치 실행 결과를 끝나는 순서대로 반환
+        
+        반복을 중간에 멈추면 연결이 닫히고 코드 러너가 남은 실행을 취소합니다.
+        
+        Yields:
+            (index, result_data)
+        
+        Raises:
+            CodeRunnerError: 코드 러너 호출에 실패한 경우 (과부하, 연결 실패, 러너가
+                             항목을 실행하지 못한 경우는 RunnerUnavailableError)
+        """
+        if timeout is None:
+            timeout = current_app.config['CODE_EXECUTION_TIMEOUT']
+        
+        payload = [
+            {'code': item['code'], 'stdin': item.get('stdin'), 'timeout': timeout}
+            for item in items
+        ]
+        
+        try:
+            with profile_section('code_runner'), get_runner_client().open(
+                'POST', '/execute/batch',
+                json={'items': payload},
+                stream=True,
+                read_timeout=timeout + 5  # 결과 한 줄을 기다리는 최대 시간
+            ) as response:
+                if response.status_code == 503:
+                    raise RunnerUnavailableError('코드 실행 요청이 많습니다. 잠시 후 다시 시도해주세요')
+                if response.status_code != 200:
+                    raise CodeRunnerError(f'코드 실행 서비스 오류: {response.status_code}')
+                
+                for line in response.iter_lines():
+                    if line:
+                        item = json.loads(line)
+                        if item.get('infra_error'):
+                            raise RunnerUnavailableError(item['result'].get('error') or '코드를 실행하지 못했습니다')
+                        yield item['index'], item['result']
+        
+        except requests.exceptions.ReadTimeout:
+            raise RunnerUnavailableError('코드 실행 시간이 초과되었습니다')
+        
+        except requests.exceptions.ConnectionError:
+            raise RunnerUnavailableError('코드 실행 서비스에 연결할 수 없습니다')
+        
+        except (requests.exceptions.RequestException, ValueError) as e:
+            raise CodeRunnerError(f'코드 실행 중 오류가 발생했습니다: {str(e)}')
+    
     @staticmethod
     def check_service_health() -> bool:
         """코드 러너 서비스 상태 확인"""
-        code_runner_url = current_app.config['CODE_RUNNER_URL']
-        
         try:
-            response = requests.get(f'{code_runner_url}/health', timeout=5)
-            return response.status_code == 200
-        except:
+            with profile_section('code_runner'), \
+                    get_runner_client().open('GET', '/health', read_timeout=5) as response:
+                return response.status_code == 200
+        except requests.exceptions.RequestException:
             return False
 
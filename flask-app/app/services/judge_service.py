@@ -0,0 +1,143 @@
+"""
+채점 서비스
+"""
+from typing import Dict, Iterator, List, Optional, Tuple
+from flask import current_app
+from app.models.problem import Problem
+from app.services.code_runner_service import CodeRunnerService, CodeRunnerError
+from app.utils.output_compare import compare_output
+
+
+class JudgeService:
+    """테스트 케이스 기반 채점 로직"""
+    
+    @staticmethod
+    def judge(code: str, problem: Problem, fail_fast: Optional[bool] = None,
+              parallel: Optional[bool] = None) -> Tuple[bool, Optional[Dict], Optional[str]]:
+        """
+        제출 코드를 문제의 모든 테스트 케이스로 채점
+        
+        parallel이 꺼져 있으면 케이스를 차례로 실행하고, 켜져 있으면 배치 실행으로
+        케이스마다 별도 프로세스에서 병렬 실행합니다. fail_fast가 켜져 있으면
+        첫 번째 실패에서 멈추고 남은 케이스는 실행하지 않습니다 (병렬 실행이면
+        실행 중인 케이스를 취소).
+        
+        Args:
+            code: 제출 코드
+            problem: 채점할 문제
+            fail_fast: 첫 실패 시 중단 여부, None이면 설정값 사용
+            parallel: 케이스 병렬 실행 여부, None이면 설정값 사용
+        
+        Returns:
+            (success, judge_result, error_message)
+        """
+        if fail_fast is None:
+            fail_fast = current_app.config['JUDGE_FAIL_FAST']
+        if parallel is None:
+            parallel = current_app.config['JUDGE_PARALLEL']
+        
+        cases = problem.test_cases or []
+        if not cases:
+            return False, None, '채점할 테스트 케이스가 없습니다'
+        
+        case_results: List[Optional[Dict]] = [None] * len(cases)
+        run_results: List[Optional[Dict]] = [None] * len(cases)
+        
+        try:
+            stream = JudgeService._iter_case_results(code, cases, parallel, fail_fast)
+            for index, result in stream:
+                passed = bool(result.get('success')) and compare_output(
+                    cases[index].get('output', ''),
+                    result.get('output', ''),
+                    mode=problem.compare_mode or 'exact',
+                    tolerance=problem.float_tolerance or 1e-6
+                )
+                run_results[index] = result
+                case_results[index] = {
+                    'index': index,
+                    'status': 'passed' if passed else ('failed' if result.get('success') else 'error'),
+                    'execution_time': result.get('execution_time'),
+                    'cpu_time': result.get('cpu_time'),
+                    'peak_rss_kb': result.get('peak_rss_kb')
+                }
+                if fail_fast and not passed:
+                    stream.close()
+                    break
+        except CodeRunnerError as e:
+            return False, None, str(e)
+        
+        if all(result is None for result in run_results):
+            return False, None, '채점 결과를 받지 못했습니다'
+        
+        for index, case_result in enumerate(case_results):
+            if case_result is None:
+                case_results[index] = {
+                    'index': index, 'status': 'skipped',
+                    'execution_time': None, 'cpu_time': None, 'peak_rss_kb': None
+                }
+        
+        passed_count = sum(1 for case in case_results if case['status'] == 'passed')
+        total = len(cases)
+        points = problem.points or 0
+        
+        return True, {
+            'passed': passed_count,
+            'total': total,
+            'score': round(points * passed_count / total),
+            'is_correct': passed_count == total,
+            'fail_fast': fail_fast,
+            'parallel': parallel,
+            'cases': case_results,
+            'result': JudgeService._representative_result(case_results, run_results)
+        }, None
+    
+    @staticmethod
+    def _iter_case_results(code: str, cases: List[Dict], parallel: bool,
+                           fail_fast: bool) -> Iterator[Tuple[int, Dict]]:
+        """
+        테스트 케이스별 실행 결과 반환 (반복을 멈추면 남은 케이스는 실행하지 않음)
+        
+        - 병렬: 배치 실행으로 케이스마다 별도 프로세스에서 실행하며 끝나는 순서대로 반환
+        - 차례로, 첫 실패 시 중단: 케이스마다 한 번씩 요청하여 앞 케이스 결과를 본 뒤 다음 실행
+        - 차례로, 모두 실행: 모든 입력을 한 번의 요청으로 보내 하나의 인터프리터에서 실행
+        
+        Raises:
+            CodeRunnerError: 코드 러너 호출에 실패한 경우
+        """
+        stdins = [case.get('input', '') for case in cases]
+        
+        if parallel:
+            items = [{'code': code, 'stdin': stdin} for stdin in stdins]
+            yield from CodeRunnerService.iter_batch(items)
+            return
+        
+        if fail_fast:
+            for index, stdin in enumerate(stdins):
+                success, result, error = CodeRunnerService.execute_code(code, stdin=stdin)
+                if not success:
+                    raise CodeRunnerError(error)
+                yield index, result
+            return
+        
+        success, result, error = CodeRunnerService.execute_code(code, stdin=stdins)
+        if not success:
+            raise CodeRunnerError(error)
+        
+        case_runs = result.get('cases') or []
+        if len(case_runs) != len(cases):
+            raise CodeRunnerError('일부 테스트 케이스의 실행 결과를 받지 못했습니다')
+        yield from enumerate(case_runs)
+    
+    @staticmethod
+    def _representative_result(case_results: List[Dict], run_results: List[Optional[Dict]]) -> Dict:
+        """
+        제출 기록에 저장할 대표 실행 결과 선택
+        
+        첫 번째 실패 케이스의 결과(없으면 첫 번째 케이스)를 사용하고,
+        실행 시간은 실행된 모든 케이스의 합으로 기록합니다.
+        """
+        executed = [i for i, result in enumerate(run_results) if result is not None]
+        failed = [i for i in executed if case_results[i]['status'] != 'passed']
+        chosen = dict(run_results[(failed or executed)[0]])
+        chosen['execution_time'] = sum(run_results[i].get('execution_time') or 0 for i in executed)
+        return chosen
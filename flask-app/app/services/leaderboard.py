@@ -0,0 +1,143 @@
+"""
+실시간 순위표
+
+수업 중 경쟁에서 많은 학생이 몇 초마다 순위를 새로 고쳐도 submissions를
+정렬하지 않도록, 문제별 순위와 전체 순위를 프로세스 메모리의 정렬된 색인으로
+유지합니다. 순위는 user_problem_stats의 최고 점수(내림차순)와 최단 실행
+시간(오름차순)을 따르며, 전체 순위는 문제별 최고 점수의 합과 정상 실행된
+문제의 실행 시간 합을 씁니다. 실행 시간 기록이 없으면 같은 점수 중 마지막입니다.
+
+시작할 때 통계 테이블에서 색인을 만들고, 채점이 끝나면 해당 사용자만 갱신합니다.
+여러 프로세스로 실행하면 다른 프로세스의 채점 결과는 LEADERBOARD_REFRESH_SECONDS마다
+다시 만들 때 반영됩니다.
+"""
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional
+from flask import Flask
+from sqlalchemy import func
+from app import db
+from app.models.user import User
+from app.models.user_problem_stat import UserProblemStat
+from app.utils.rank_index import RankIndex
+
+
+class Leaderboard:
+    """문제별/전체 순위 색인"""
+
+    def __init__(self):
+        self.refresh_seconds = 0.0
+        self._problems: Dict[int, RankIndex] = {}
+        self._overall = RankIndex()
+        self._usernames: Dict[int, str] = {}
+        self._built_at = 0.0
+        self._lock = threading.Lock()
+
+    def init_app(self, app: Flask) -> None:
+        """설정 로드 및 통계 테이블에서 색인 생성"""
+        self.refresh_seconds = app.config['LEADERBOARD_REFRESH_SECONDS']
+        with app.app_context():
+            self.rebuild()
+
+    def rebuild(self) -> None:
+        """통계 테이블 전체로 색인을 다시 만듦"""
+        rows = db.session.query(UserProblemStat, User.username) \
+            .join(User, User.id == UserProblemStat.user_id) \
+            .filter(User.is_active.is_(True), UserProblemStat.best_score.isnot(None)) \
+            .all()
+
+        problems: Dict[int, RankIndex] = defaultdict(RankIndex)
+        totals: Dict[int, List[Optional[float]]] = defaultdict(lambda: [0, None])
+        usernames = {}
+        for stat, username in rows:
+            problems[stat.problem_id].update(stat.user_id, stat.best_score, stat.best_execution_time)
+            total = totals[stat.user_id]
+            total[0] += stat.best_score
+            if stat.best_execution_time is not None:
+                total[1] = (total[1] or 0.0) + stat.best_execution_time
+            usernames[stat.user_id] = username
+
+        overall = RankIndex()
+        for user_id, (score, elapsed) in totals.items():
+            overall.update(user_id, score, elapsed)
+
+        with self._lock:
+            self._problems = dict(problems)
+            self._overall = overall
+            self._usernames = usernames
+            self._built_at = time.monotonic()
+
+    def record(self, user_id: int, problem_id: int) -> None:
+        """채점 결과가 커밋된 뒤 사용자의 문제별/전체 기록 갱신"""
+        user = db.session.get(User, user_id)
+        if user is None or not user.is_active:
+            # 비활성화된 사용자는 순위에서 제외
+            self.remove_user(user_id)
+            return
+
+        stat = db.session.get(UserProblemStat, (user_id, problem_id))
+        if stat is None or stat.best_score is None:
+            return
+
+        # SUM은 NULL을 건너뛰므로 실행 시간 기록이 하나도 없으면 None
+        score, elapsed = db.session.query(
+            func.sum(UserProblemStat.best_score),
+            func.sum(UserProblemStat.best_execution_time)
+        ).filter(UserProblemStat.user_id == user_id, UserProblemStat.best_score.isnot(None)).one()
+
+        with self._lock:
+            self._usernames[user_id] = user.username
+            self._problems.setdefault(problem_id, RankIndex()) \
+                .update(user_id, stat.best_score, stat.best_execution_time)
+            self._overall.update(user_id, score, elapsed)
+
+    def remove_user(self, user_id: int) -> None:
+        """사용자를 모든 순위에서 제거"""
+        with self._lock:
+            self._overall.remove(user_id)
+            for index in self._problems.values():
+                index.remove(user_id)
+
+    def get_problem_ranking(self, problem_id: int, user_id: int, limit: int) -> Dict:
+        """문제별 상위 limit명과 내 순위"""
+        self._refresh_if_stale()
+        with self._lock:
+            return self._ranking(self._problems.get(problem_id, RankIndex()), user_id, limit)
+
+    def get_overall_ranking(self, user_id: int, limit: int) -> Dict:
+        """전체 상위 limit명과 내 순위"""
+        self._refresh_if_stale()
+        with self._lock:
+            return self._ranking(self._overall, user_id, limit)
+
+    def _ranking(self, index: RankIndex, user_id: int, limit: int) -> Dict:
+        me = index.get(user_id)
+        return {
+            'total': len(index),
+            'top': [self._entry_dict(entry) for entry in index.top(limit)],
+            'me': self._entry_dict(me) if me else None
+        }
+
+    def _entry_dict(self, entry) -> Dict:
+        rank, user_id, score, elapsed = entry
+        return {
+            'rank': rank,
+            'user_id': user_id,
+            'username': self._usernames.get(user_id),
+            'score': score,
+            'execution_time': elapsed
+        }
+
+    def _refresh_if_stale(self) -> None:
+        if self.refresh_seconds <= 0:
+            return
+        with self._lock:
+            if time.monotonic() - self._built_at < self.refresh_seconds:
+                return
+            # 다시 만드는 동안 다른 요청은 기존 색인으로 응답
+            self._built_at = time.monotonic()
+        self.rebuild()
+
+
+leaderboard = Leaderboard()
@@ -0,0 +1,152 @@
+"""
+수업 자료 응답 캐시
+
+자료는 관리자만 가끔 수정하므로 목록(카테고리/난이도별), 상세, 카테고리 응답을
+직렬화된 JSON 그대로 보관하고 ETag와 Last-Modified를 함께 계산해 둡니다.
+자료를 생성하거나 수정하면 전체를 비우며, 다른 프로세스의 변경은
+MATERIAL_CACHE_TTL이 지나면 반영됩니다.
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+from flask import Flask, current_app
+from sqlalchemy import event
+from app.models.material import Material
+from app.utils.metrics import CACHE_REQUESTS
+
+# 응답 본문과 Last-Modified 기준 시각을 만드는 함수 (없는 자료면 None)
+Builder = Callable[[], Optional[Tuple[Any, Optional[datetime]]]]
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """직렬화된 응답 본문과 검증자(validator)"""
+    body: bytes
+    etag: str
+    last_modified: Optional[datetime]
+
+
+class MaterialCache:
+    """직렬화된 자료 응답을 보관하는 TTL + LRU 캐시"""
+
+    def __init__(self):
+        self.ttl = 0.0
+        self.max_entries = 0
+        self._entries: 'OrderedDict[Hashable, Tuple[float, CachedResponse]]' = OrderedDict()
+        self._lock = threading.Lock()
+        # 수업 시작 때 몰리는 첫 요청들이 같은 응답을 중복으로 만들지 않도록
+        # 키별로 직렬화 ([잠금, 기다리는 요청 수])
+        self._build_locks: Dict[Hashable, List] = {}
+        # clear()마다 증가하며, 만드는 도중 무효화된 응답은 보관하지 않음
+        self._generation = 0
+
+    def init_app(self, app: Flask) -> None:
+        """설정 로드 (MATERIAL_CACHE_TTL이 0이면 매번 새로 만듦)"""
+        self.ttl = app.config['MATERIAL_CACHE_TTL']
+        self.max_entries = app.config['MATERIAL_CACHE_MAX_ENTRIES']
+        self.clear()
+
+    def get_or_build(self, key: Hashable, build: Builder) -> Optional[CachedResponse]:
+        """
+        캐시된 응답을 반환하거나 build로 만들어 보관
+
+        Returns:
+            캐시된 응답, build가 None을 반환하면 None (캐시하지 않음)
+        """
+        if self.ttl <= 0:
+            CACHE_REQUESTS.labels('material', 'miss').inc()
+            built = build()
+            return _serialize(*built) if built is not None else None
+
+        cached = self._lookup(key)
+        if cached is not None:
+            CACHE_REQUESTS.labels('material', 'hit').inc()
+            return cached
+
+        with self._building(key):
+            cached = self._lookup(key)
+            if cached is not None:
+                CACHE_REQUESTS.labels('material', 'hit').inc()
+                return cached
+
+            CACHE_REQUESTS.labels('material', 'miss').inc()
+            generation = self._generation
+            built = build()
+            if built is None:
+                return None
+
+            payload, last_modified = built
+            cached = _serialize(payload, last_modified)
+            self._store(key, cached, generation)
+            return cached
+
+    def clear(self) -> None:
+        """자료가 바뀌었을 때 전체 무효화"""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    @contextmanager
+    def _building(self, key: Hashable):
+        """같은 키의 응답을 만드는 요청만 직렬화 (다른 키는 동시에 만듦)"""
+        with self._lock:
+            entry = self._build_locks.setdefault(key, [threading.Lock(), 0])
+            entry[1] += 1
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with self._lock:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    del self._build_locks[key]
+
+    def _lookup(self, key: Hashable) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, cached = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return cached
+
+    def _store(self, key: Hashable, cached: CachedResponse, generation: int) -> None:
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[key] = (time.monotonic() + self.ttl, cached)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+def _serialize(payload: Any, last_modified: Optional[datetime]) -> CachedResponse:
+    """jsonify와 같은 형식으로 직렬화하고 본문 해시로 ETag 계산"""
+    body = f'{current_app.json.dumps(payload)}\n'.encode('utf-8')
+    if last_modified is not None:
+        # DB에는 UTC 기준 naive datetime으로 저장됨
+        last_modified = last_modified.replace(tzinfo=timezone.utc)
+    return CachedResponse(
+        body=body,
+        etag=hashlib.sha256(body).hexdigest()[:32],
+        last_modified=last_modified
+    )
+
+
+material_cache = MaterialCache()
+
+
+@event.listens_for(Material, 'after_insert')
+@event.listens_for(Material, 'after_update')
+@event.listens_for(Material, 'after_delete')
+def _invalidate_changed_material(mapper, connection, target: Material) -> None:
+    """ORM으로 자료를 바꾸면 어느 경로든 캐시를 비움"""
+    material_cache.clear()
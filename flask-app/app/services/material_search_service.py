@@ -0,0 +1,159 @@
+"""
+수업 자료 검색 서비스
+
+material_search_terms 테이블을 역색인으로 사용합니다. 자료를 생성/수정할 때
+해당 자료의 항목만 다시 만들고, 검색 시에는 질의 토큰의 항목만 읽어
+필드 가중치를 준 BM25 방식으로 점수를 매깁니다.
+"""
+import math
+import re
+from collections import defaultdict
+from html import escape
+from typing import Dict, List
+from sqlalchemy import insert, select
+from app import db
+from app.models.material import Material
+from app.models.material_search_term import MaterialSearchTerm
+from app.utils.search_tokens import normalize, term_frequencies, tokenize
+
+# 필드별 점수 가중치
+FIELD_WEIGHTS = {'title': 3.0, 'tags': 2.0, 'description': 1.5, 'content': 1.0}
+
+# BM25 등장 횟수 포화 계수
+BM25_K1 = 1.2
+
+# 결과로 인정할 최소 질의 토큰 포함 비율
+MIN_TERM_COVERAGE = 0.5
+
+# 스니펫에서 일치 위치 앞뒤로 보여줄 글자 수
+SNIPPET_RADIUS = 40
+
+
+class MaterialSearchService:
+    """수업 자료 검색 색인 및 질의"""
+    
+    @staticmethod
+    def _field_texts(material: Material) -> Dict[str, str]:
+        return {
+            'title': material.title,
+            'tags': ' '.join(tag.name for tag in material.tags),
+            'description': material.description or '',
+            'content': material.content
+        }
+    
+    @staticmethod
+    def index_material(material: Material) -> None:
+        """자료 하나의 색인 항목을 다시 만듦 (commit은 호출한 쪽에서)"""
+        MaterialSearchTerm.query.filter_by(material_id=material.id).delete()
+        
+        rows = [
+            {'term': term, 'material_id': material.id, 'field': field, 'frequency': count}
+            for field, text in MaterialSearchService._field_texts(material).items()
+            for term, count in term_frequencies(text).items()
+        ]
+        if rows:
+            db.session.execute(insert(MaterialSearchTerm), rows)
+    
+    @staticmethod
+    def ensure_index() -> int:
+        """
+        색인 항목이 없는 자료를 색인 (시작 시와 일괄 등록 후 호출)
+        
+        Returns:
+            새로 색인한 자료 수
+        """
+        indexed = select(MaterialSearchTerm.material_id).distinct()
+        materials = Material.query.filter(Material.id.not_in(indexed)).all()
+        for material in materials:
+            MaterialSearchService.index_material(material)
+        if materials:
+            db.session.commit()
+        return len(materials)
+    
+    @staticmethod
+    def search(query: str, limit: int = 20) -> List[Dict]:
+        """
+        질의 토큰을 충분히 포함하는 공개 자료를 점수순으로 검색
+        
+        Returns:
+            자료 정보에 score와 snippet(일치 부분을 <mark>로 감싼 HTML)을 더한 목록
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+        
+        postings = db.session.query(
+            MaterialSearchTerm.material_id, MaterialSearchTerm.term,
+            MaterialSearchTerm.field, MaterialSearchTerm.frequency
+        ).filter(MaterialSearchTerm.term.in_(terms)).all()
+        
+        documents_by_term = defaultdict(set)
+        for material_id, term, _, _ in postings:
+            documents_by_term[term].add(material_id)
+        
+        total = Material.query.count()
+        scores: Dict[int, float] = defaultdict(float)
+        for material_id, term, field, frequency in postings:
+            df = len(documents_by_term[term])
+            idf = math.log(1 + (total - df + 0.5) / (df + 0.5))
+            saturation = frequency * (BM25_K1 + 1) / (frequency + BM25_K1)
+            scores[material_id] += FIELD_WEIGHTS[field] * idf * saturation
+        
+        # 한국어 질의는 조사가 붙은 2-gram("수를")이 본문에 없을 수 있으므로
+        # 질의 토큰의 일정 비율 이상을 포함하면 결과로 보고, 포함 비율을 점수에 반영
+        matched_terms: Dict[int, int] = defaultdict(int)
+        for term in terms:
+            for material_id in documents_by_term[term]:
+                matched_terms[material_id] += 1
+        
+        candidates = set()
+        for material_id, count in matched_terms.items():
+            coverage = count / len(terms)
+            if coverage >= MIN_TERM_COVERAGE:
+                candidates.add(material_id)
+                scores[material_id] *= coverage
+        if not candidates:
+            return []
+        
+        materials = Material.query.filter(
+            Material.id.in_(candidates), Material.is_published.is_(True)
+        ).all()
+        materials.sort(key=lambda material: (-scores[material.id], material.id))
+        
+        words = normalize(query).split()
+        results = []
+        for material in materials[:limit]:
+            data = material.to_dict(include_content=False)
+            data['score'] = round(scores[material.id], 4)
+            data['snippet'] = _snippet(material, words)
+            results.append(data)
+        return results
+
+
+def _snippet(material: Material, words: List[str]) -> str:
+    """질의 단어가 처음 나오는 부분 주변의 본문 (HTML 이스케이프 후 <mark> 강조)"""
+    pattern = re.compile('|'.join(re.escape(word) for word in words), re.IGNORECASE)
+    
+    texts = [' '.join((text or '').split())
+             for text in (material.content, material.description, material.title)]
+    for text in texts:
+        match = pattern.search(text)
+        if match:
+            start = max(0, match.start() - SNIPPET_RADIUS)
+            end = min(len(text), match.end() + SNIPPET_RADIUS)
+            break
+    else:
+        # 음절 조각만 일치한 경우 본문 앞부분을 보여줌
+        text = texts[1] or texts[0]
+        start, end = 0, min(len(text), SNIPPET_RADIUS * 2)
+    
+    fragment = text[start:end]
+    parts = []
+    position = 0
+    for match in pattern.finditer(fragment):
+        parts.append(escape(fragment[position:match.start()]))
+        parts.append(f'<mark>{escape(match.group())}</mark>')
+        position = match.end()
+    parts.append(escape(fragment[position:]))
+    
+    return ('…' if start > 0 else '') + ''.join(parts) + ('…' if end < len(text) else '')
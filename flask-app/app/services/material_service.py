@@ -1,9 +1,15 @@
 """
 수업 자료 서비스
 """
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, Union
+from sqlalchemy.exc import IntegrityError
 from app import db
 from app.models.material import Material
+from app.models.rendered_content import RenderedContent
+from app.services.material_cache import material_cache
+from app.services.material_search_service import MaterialSearchService
+from app.services.tag_service import TagService
+from app.utils.markdown_renderer import content_hash, render_markdown
 
 
 class MaterialService:
@@ -11,9 +17,13 @@ class MaterialService:
     
     @staticmethod
     def get_all_materials(category: Optional[str] = None, 
-                         difficulty: Optional[str] = None) -> List[Material]:
+                         difficulty: Optional[str] = None,
+                         tags: Optional[List[str]] = None,
+                         tag_match: str = 'any') -> List[Material]:
         """
         수업 자료 목록 조회 (필터링 옵션 포함)
+        
+        tags를 주면 tag_match가 'any'일 때 하나라도, 'all'일 때 모두 가진 자료만 조회합니다.
         """
         query = Material.query.filter_by(is_published=True)
         
@@ -23,6 +33,9 @@ class MaterialService:
         if difficulty:
             query = query.filter_by(difficulty=difficulty)
         
+        if tags:
+            query = TagService.filter_by_tags(query, tags, tag_match)
+        
         return query.order_by(Material.order, Material.created_at.desc()).all()
     
     @staticmethod
@@ -34,10 +47,12 @@ class MaterialService:
     def create_material(title: str, content: str, category: str,
                        difficulty: Optional[str] = None,
                        description: Optional[str] = None,
-                       tags: Optional[str] = None) -> Tuple[bool, Optional[Material], Optional[str]]:
+                       tags: Union[str, List[str], None] = None) -> Tuple[bool, Optional[Material], Optional[str]]:
         """
         수업 자료 생성 (관리자용)
         
+        tags는 태그 이름 목록이나 쉼표로 구분된 문자열입니다.
+        
         Returns:
             (success, material, error_message)
         """
@@ -49,13 +64,16 @@ class MaterialService:
             content=content,
             category=category,
             difficulty=difficulty,
-            description=description,
-            tags=tags
+            description=description
         )
         
         try:
             db.session.add(material)
+            TagService.set_material_tags(material, TagService.parse_tags(tags))
+            MaterialSearchService.index_material(material)
             db.session.commit()
+            material_cache.clear()
+            MaterialService.get_content_html(material)
             return True, material, None
         except Exception as e:
             db.session.rollback()
@@ -73,17 +91,61 @@ class MaterialService:
         if not material:
             return False, "자료를 찾을 수 없습니다"
         
+        old_content = material.content
+        
         try:
             for key in ['title', 'content', 'category', 'difficulty', 
-                       'description', 'tags', 'order', 'is_published']:
+                       'description', 'order', 'is_published']:
                 if key in data:
                     setattr(material, key, data[key])
             
+            if 'tags' in data:
+                TagService.set_material_tags(material, TagService.parse_tags(data['tags']))
+            elif 'is_published' in data:
+                db.session.flush()
+                TagService.refresh_counts(tag.id for tag in material.tags)
+            
+            MaterialSearchService.index_material(material)
             db.session.commit()
-            return True, None
+            material_cache.clear()
         except Exception as e:
             db.session.rollback()
             return False, f"자료 업데이트 중 오류가 발생했습니다: {str(e)}"
+        
+        # 본문이 바뀐 경우에만 새로 렌더링하고 더 이상 쓰이지 않는 결과는 삭제
+        if material.content != old_content:
+            MaterialService.get_content_html(material)
+            MaterialService._delete_unused_render(old_content)
+        return True, None
+    
+    @staticmethod
+    def get_content_html(material: Material) -> str:
+        """자료 본문을 렌더링한 HTML (본문 해시로 저장해 두고 재사용)"""
+        key = content_hash(material.content)
+        rendered = db.session.get(RenderedContent, key)
+        if rendered:
+            return rendered.html
+        
+        html = render_markdown(material.content)
+        try:
+            db.session.add(RenderedContent(content_hash=key, html=html))
+            db.session.commit()
+        except IntegrityError:
+            # 다른 요청이 같은 본문을 먼저 저장한 경우
+            db.session.rollback()
+        return html
+    
+    @staticmethod
+    def _delete_unused_render(content: str) -> None:
+        """같은 본문을 쓰는 자료가 없으면 렌더링 결과 삭제"""
+        if Material.query.filter_by(content=content).first():
+            return
+        
+        try:
+            RenderedContent.query.filter_by(content_hash=content_hash(content)).delete()
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
     
     @staticmethod
     def get_categories() -> List[str]:
@@ -0,0 +1,175 @@
+"""
+코드 러너 HTTP 클라이언트
+
+프로세스마다 하나의 keep-alive 세션을 공유하여 제출마다 TCP 연결을 새로 맺지
+않으며, 여러 코드 러너 인스턴스로 요청을 분산합니다.
+"""
+import itertools
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, List, Optional
+import requests
+from requests.adapters import HTTPAdapter
+from flask import current_app
+from app.utils.metrics import RUNNER_REQUEST_DURATION, RUNNER_REQUEST_ERRORS
+
+BALANCE_STRATEGIES = ('round_robin', 'least_busy')
+
+# 연결에 실패한 인스턴스를 선택에서 제외하는 시간 (초)
+FAILURE_COOLDOWN = 10
+
+
+class RunnerClient:
+    """연결 풀과 재시도, 부하 분산을 갖춘 코드 러너 클라이언트"""
+
+    def __init__(self, urls: List[str], pool_size: int, connect_timeout: float,
+                 max_retries: int, retry_backoff: float, strategy: str = 'round_robin'):
+        if strategy not in BALANCE_STRATEGIES:
+            raise ValueError(f'지원하지 않는 부하 분산 방식입니다: {strategy}')
+
+        self.urls = [url.rstrip('/') for url in urls]
+        self.connect_timeout = connect_timeout
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.strategy = strategy
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=len(self.urls), pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        self._lock = threading.Lock()
+        self._cycle = itertools.cycle(range(len(self.urls)))
+        self._in_flight = [0] * len(self.urls)
+        self._requests = [0] * len(self.urls)
+        self._down_until = [0.0] * len(self.urls)
+        self._retries = 0
+
+    def _pick(self, exclude: set) -> int:
+        """부하 분산 방식에 따라 요청을 보낼 인스턴스 선택"""
+        now = time.monotonic()
+        with self._lock:
+            all_indexes = range(len(self.urls))
+            candidates = (
+                [i for i in all_indexes if i not in exclude and self._down_until[i] <= now]
+                or [i for i in all_indexes if i not in exclude]
+                or list(all_indexes)
+            )
+
+            if self.strategy == 'least_busy':
+                index = min(candidates, key=lambda i: (self._in_flight[i], self._requests[i]))
+            else:
+                index = next(self._cycle)
+                while index not in candidates:
+                    index = next(self._cycle)
+
+            self._in_flight[index] += 1
+            self._requests[index] += 1
+            return index
+
+    def _release(self, index: int, failed: bool = False) -> None:
+        with self._lock:
+            self._in_flight[index] -= 1
+            if failed:
+                self._down_until[index] = time.monotonic() + FAILURE_COOLDOWN
+
+    @contextmanager
+    def open(self, method: str, path: str, read_timeout: float,
+             **kwargs) -> Iterator[requests.Response]:
+        """
+        코드 러너에 요청을 보내고 응답을 반환 (블록을 벗어나면 응답을 닫음)
+
+        연결 오류가 나면 다른 인스턴스로 지수 백오프 재시도하며,
+        읽기 시간 초과는 실행이 이미 시작되었을 수 있으므로 재시도하지 않습니다.
+
+        Raises:
+            requests.exceptions.RequestException: 모든 재시도가 실패한 경우
+        """
+        tried: set = set()
+
+        for attempt in range(self.max_retries + 1):
+            index = self._pick(tried)
+            started = time.perf_counter()
+            try:
+                response = self.session.request(
+                    method,
+                    f'{self.urls[index]}{path}',
+                    timeout=(self.connect_timeout, read_timeout),
+                    **kwargs
+                )
+            except requests.exceptions.ConnectionError:
+                RUNNER_REQUEST_ERRORS.labels(path, 'connection').inc()
+                self._release(index, failed=True)
+                tried.add(index)
+                if attempt >= self.max_retries:
+                    raise
+                self._retries += 1
+                time.sleep(self.retry_backoff * (2 ** attempt))
+                continue
+            except Exception as e:
+                RUNNER_REQUEST_ERRORS.labels(path, type(e).__name__).inc()
+                self._release(index)
+                raise
+
+            try:
+                with response:
+                    yield response
+            finally:
+                self._release(index)
+                RUNNER_REQUEST_DURATION.labels(method, path, response.status_code) \
+                    .observe(time.perf_counter() - started)
+            return
+
+    def stats(self) -> Dict[str, Any]:
+        """인스턴스별 요청 수와 진행 중인 요청 수"""
+        with self._lock:
+            return {
+                'strategy': self.strategy,
+                'retries': self._retries,
+                'instances': [
+                    {
+                        'url': url,
+                        'in_flight': self._in_flight[i],
+                        'requests': self._requests[i],
+                        'available': self._down_until[i] <= time.monotonic()
+                    }
+                    for i, url in enumerate(self.urls)
+                ]
+            }
+
+
+_client: Optional[RunnerClient] = None
+_client_key: Optional[tuple] = None
+_client_lock = threading.Lock()
+
+
+def get_runner_client() -> RunnerClient:
+    """
+    현재 프로세스와 설정에 맞는 공유 클라이언트 반환
+
+    fork된 워커 프로세스는 부모의 소켓을 공유하지 않도록 새 클라이언트를 만듭니다.
+    """
+    global _client, _client_key
+
+    config = current_app.config
+    urls = [url.strip() for url in config['CODE_RUNNER_URL'].split(',') if url.strip()]
+    key = (
+        os.getpid(), tuple(urls), config['CODE_RUNNER_POOL_SIZE'],
+        config['CODE_RUNNER_CONNECT_TIMEOUT'], config['CODE_RUNNER_MAX_RETRIES'],
+        config['CODE_RUNNER_RETRY_BACKOFF'], config['CODE_RUNNER_BALANCE']
+    )
+
+    with _client_lock:
+        if _client is None or _client_key != key:
+            _client = RunnerClient(
+                urls=urls,
+                pool_size=config['CODE_RUNNER_POOL_SIZE'],
+                connect_timeout=config['CODE_RUNNER_CONNECT_TIMEOUT'],
+                max_retries=config['CODE_RUNNER_MAX_RETRIES'],
+                retry_backoff=config['CODE_RUNNER_RETRY_BACKOFF'],
+                strategy=config['CODE_RUNNER_BALANCE']
+            )
+            _client_key = key
+        return _client
@@ -0,0 +1,194 @@
+"""
+제출 통계 서비스
+
+사용자별 문제 통계(user_problem_stats)와 문제별 통계(problem_stats)를 제출 기록을
+만들 때와 채점 결과를 저장할 때 같은 트랜잭션 안에서 증분 갱신합니다.
+기록 화면이나 순위표가 매번 submissions 전체를 집계하지 않아도 되며,
+통계가 어긋났을 때는 rebuild로 제출 기록에서 한 번에 다시 만듭니다.
+"""
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import and_, case, delete, func, insert, or_, select, update
+from app import db
+from app.models.problem_stat import ProblemStat
+from app.models.submission import Submission
+from app.models.user_problem_stat import UserProblemStat
+from app.utils.upsert import insert_ignore
+
+
+def _better(column, value, higher: bool = True):
+    """value가 기존 값보다 좋으면 value, 아니면 기존 값 (기존 값이 NULL이면 value)"""
+    improved = column < value if higher else column > value
+    return case((or_(column.is_(None), improved), value), else_=column)
+
+
+def _is_accepted(submission: Submission) -> bool:
+    """실행 시간 기록에 넣을 제출인지 (정상 실행되었고 오답 판정이 아닌 제출)"""
+    return (submission.status == 'success' and submission.is_correct is not False
+            and submission.execution_time is not None)
+
+
+class StatsService:
+    """제출 통계 관련 비즈니스 로직"""
+    
+    @staticmethod
+    def record_attempt(submission: Submission) -> None:
+        """
+        제출 한 건을 통계에 반영 (제출 기록을 flush한 뒤 같은 트랜잭션에서 호출)
+        """
+        user_key = and_(UserProblemStat.user_id == submission.user_id,
+                        UserProblemStat.problem_id == submission.problem_id)
+        first_attempt = insert_ignore(UserProblemStat, {
+            'user_id': submission.user_id,
+            'problem_id': submission.problem_id
+        })
+        insert_ignore(ProblemStat, {'problem_id': submission.problem_id})
+        
+        db.session.execute(
+            update(UserProblemStat).where(user_key).values(
+                attempts=UserProblemStat.attempts + 1,
+                last_submitted_at=_better(UserProblemStat.last_submitted_at, submission.submitted_at)
+            ),
+            execution_options={'synchronize_session': False}
+        )
+        db.session.execute(
+            update(ProblemStat).where(ProblemStat.problem_id == submission.problem_id).values(
+                attempts=ProblemStat.attempts + 1,
+                attempted_users=ProblemStat.attempted_users + (1 if first_attempt else 0)
+            ),
+            execution_options={'synchronize_session': False}
+        )
+    
+    @staticmethod
+    def record_result(submission: Submission) -> None:
+        """
+        채점 결과를 통계에 반영 (채점 결과와 같은 트랜잭션에서 호출)
+        """
+        user_key = and_(UserProblemStat.user_id == submission.user_id,
+                        UserProblemStat.problem_id == submission.problem_id)
+        user_values = {}
+        problem_values = {}
+        
+        if submission.score is not None:
+            user_values['best_score'] = _better(UserProblemStat.best_score, submission.score)
+        if _is_accepted(submission):
+            user_values['best_execution_time'] = _better(
+                UserProblemStat.best_execution_time, submission.execution_time, higher=False
+            )
+            problem_values['best_execution_time'] = _better(
+                ProblemStat.best_execution_time, submission.execution_time, higher=False
+            )
+        
+        if user_values:
+            db.session.execute(
+                update(UserProblemStat).where(user_key).values(**user_values),
+                execution_options={'synchronize_session': False}
+            )
+        
+        if submission.is_correct:
+            # 처음 맞힌 경우에만 문제의 해결 사용자 수 증가
+            first_solve = db.session.execute(
+                update(UserProblemStat)
+                .where(user_key, UserProblemStat.first_solved_at.is_(None))
+                .values(first_solved_at=submission.submitted_at),
+                execution_options={'synchronize_session': False}
+            ).rowcount == 1
+            if first_solve:
+                problem_values['solved_users'] = ProblemStat.solved_users + 1
+            else:
+                # 여러 워커가 채점하면 나중 제출이 먼저 채점될 수 있음
+                db.session.execute(
+                    update(UserProblemStat)
+                    .where(user_key, UserProblemStat.first_solved_at > submission.submitted_at)
+                    .values(first_solved_at=submission.submitted_at),
+                    execution_options={'synchronize_session': False}
+                )
+        
+        if problem_values:
+            db.session.execute(
+                update(ProblemStat)
+                .where(ProblemStat.problem_id == submission.problem_id)
+                .values(**problem_values),
+                execution_options={'synchronize_session': False}
+            )
+    
+    @staticmethod
+    def get_user_stats(user_id: int) -> Dict:
+        """사용자의 문제별 통계와 전체 요약"""
+        stats = UserProblemStat.query.filter_by(user_id=user_id) \
+            .order_by(UserProblemStat.problem_id).all()
+        return {
+            'summary': {
+                'attempted_problems': len(stats),
+                'solved_problems': sum(1 for stat in stats if stat.first_solved_at is not None),
+                'total_attempts': sum(stat.attempts for stat in stats)
+            },
+            'problems': [stat.to_dict() for stat in stats]
+        }
+    
+    @staticmethod
+    def get_problem_stats(problem_id: int) -> Optional[ProblemStat]:
+        """문제 통계 조회 (제출이 없으면 None)"""
+        return db.session.get(ProblemStat, problem_id)
+    
+    @staticmethod
+    def get_all_problem_stats() -> List[ProblemStat]:
+        """제출이 있는 모든 문제의 통계"""
+        return ProblemStat.query.order_by(ProblemStat.problem_id).all()
+    
+    @staticmethod
+    def rebuild() -> Tuple[bool, Optional[Dict], Optional[str]]:
+        """
+        제출 기록 전체로 통계 테이블을 다시 만듦
+        
+        채점 중인 제출이 있으면 그 결과가 빠질 수 있으므로 한가한 시간에 실행합니다.
+        
+        Returns:
+            (success, 다시 만든 행 수, error_message)
+        """
+        accepted = and_(
+            Submission.status == 'success',
+            or_(Submission.is_correct.is_(None), Submission.is_correct.is_(True))
+        )
+        per_user = select(
+            Submission.user_id,
+            Submission.problem_id,
+            func.count(),
+            func.max(Submission.score),
+            func.min(case((accepted, Submission.execution_time))),
+            func.min(case((Submission.is_correct.is_(True), Submission.submitted_at))),
+            func.max(Submission.submitted_at)
+        ).group_by(Submission.user_id, Submission.problem_id)
+        
+        per_problem = select(
+            UserProblemStat.problem_id,
+            func.sum(UserProblemStat.attempts),
+            func.count(),
+            func.count(UserProblemStat.first_solved_at),
+            func.min(UserProblemStat.best_execution_time)
+        ).group_by(UserProblemStat.problem_id)
+        
+        try:
+            db.session.execute(delete(UserProblemStat))
+            db.session.execute(delete(ProblemStat))
+            users = db.session.execute(insert(UserProblemStat).from_select(
+                ['user_id', 'problem_id', 'attempts', 'best_score', 'best_execution_time',
+                 'first_solved_at', 'last_submitted_at'],
+                per_user
+            )).rowcount
+            problems = db.session.execute(insert(ProblemStat).from_select(
+                ['problem_id', 'attempts', 'attempted_users', 'solved_users', 'best_execution_time'],
+                per_problem
+            )).rowcount
+            db.session.commit()
+            return True, {'user_problem_stats': users, 'problem_stats': problems}, None
+        except Exception as e:
+            db.session.rollback()
+            return False, None, f'통계 재계산 중 오류가 발생했습니다: {str(e)}'
+    
+    @staticmethod
+    def ensure_stats() -> None:
+        """통계 도입 전 제출 기록이 있으면 통계 테이블을 처음 한 번 만듦"""
+        if db.session.query(UserProblemStat.user_id).first() is not None:
+            return
+        if db.session.query(Submission.id).first() is not None:
+            StatsService.rebuild()
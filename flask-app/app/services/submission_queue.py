@@ -0,0 +1,253 @@
+"""
+제출 채점 작업 큐
+
+submission_jobs 테이블을 작업 큐로 사용하며, 로컬 워커 스레드가 작업을
+하나씩 점유(claim)하여 채점합니다. 별도의 메시지 브로커가 필요 없고,
+점유는 조건부 UPDATE로 이루어지므로 여러 프로세스가 같은 DB를 써도 안전합니다.
+
+채점 중인 워커는 heartbeat_at을 주기적으로 갱신하며, 하트비트가 끊긴 작업은
+프로세스가 중단된 것으로 보고 다시 대기열에 넣거나 최대 시도 횟수를 넘으면
+실패로 처리합니다.
+"""
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import List, Optional
+from flask import Flask
+from sqlalchemy import func, or_, update
+from app import db
+from app.models.submission import Submission
+from app.models.submission_job import SubmissionJob
+from app.services.leaderboard import leaderboard
+from app.services.code_runner_service import RunnerUnavailableError
+from app.services.submission_service import SubmissionService
+
+logger = logging.getLogger(__name__)
+
+
+class SubmissionQueue:
+    """DB 기반 제출 채점 큐와 로컬 워커 풀"""
+
+    def __init__(self):
+        self._app: Optional[Flask] = None
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._last_requeue = 0.0
+
+    def init_app(self, app: Flask) -> None:
+        """
+        앱 등록 및 워커 스레드 시작 (SUBMISSION_WORKERS가 0이면 요청 안에서 바로 채점)
+
+        SUBMISSION_QUEUE_AUTOSTART가 꺼져 있으면 서버가 프로세스를 fork한 뒤
+        start()를 직접 호출합니다 (gunicorn.conf.py의 post_fork).
+        """
+        self._app = app
+        if app.config['SUBMISSION_QUEUE_AUTOSTART']:
+            self.start_configured()
+
+    def start_configured(self) -> None:
+        """설정된 수만큼 워커 스레드 시작"""
+        if self._app.config['SUBMISSION_WORKERS'] > 0 and not self._app.testing:
+            self.start(self._app.config['SUBMISSION_WORKERS'])
+
+    @property
+    def is_async(self) -> bool:
+        return bool(self._threads)
+
+    def start(self, workers: int) -> None:
+        """워커 스레드 시작"""
+        with self._lock:
+            if self._threads:
+                return
+            for i in range(workers):
+                thread = threading.Thread(
+                    target=self._worker_loop,
+                    name=f'submission-worker-{i}',
+                    daemon=True
+                )
+                thread.start()
+                self._threads.append(thread)
+
+    def stop(self, timeout: float) -> None:
+        """워커 스레드에 종료를 알리고 진행 중인 채점이 끝날 때까지 최대 timeout초 대기"""
+        with self._lock:
+            threads, self._threads = self._threads, []
+        self._stopping.set()
+        self._wakeup.set()
+
+        deadline = time.monotonic() + timeout
+        for thread in threads:
+            thread.join(max(0.0, deadline - time.monotonic()))
+
+    def notify(self) -> None:
+        """새 작업이 등록되었음을 워커에게 알림"""
+        self._wakeup.set()
+
+    def process(self, submission_id: int) -> bool:
+        """
+        특정 제출의 작업을 점유하여 채점 (동기 모드에서 사용)
+
+        Returns:
+            점유 및 처리 여부
+        """
+        job = SubmissionJob.query.filter_by(submission_id=submission_id, status='queued').first()
+        if not job or not self._claim(job.id):
+            return False
+        self._run(job.id)
+        return True
+
+    def _worker_loop(self) -> None:
+        """작업을 점유하여 처리하는 워커 루프"""
+        poll_interval = self._app.config['SUBMISSION_POLL_INTERVAL']
+
+        while not self._stopping.is_set():
+            try:
+                with self._app.app_context():
+                    self._requeue_stale()
+                    job_id = self._claim_next()
+                    if job_id is not None:
+                        self._run(job_id)
+                        continue
+            except Exception:
+                logger.exception('제출 채점 워커 오류')
+
+            self._wakeup.wait(timeout=poll_interval)
+            self._wakeup.clear()
+
+    def _claim(self, job_id: int) -> bool:
+        """대기 중인 작업을 조건부 UPDATE로 점유"""
+        result = db.session.execute(
+            update(SubmissionJob)
+            .where(SubmissionJob.id == job_id, SubmissionJob.status == 'queued')
+            .values(status='running', started_at=datetime.utcnow(), heartbeat_at=datetime.utcnow(),
+                    attempts=SubmissionJob.attempts + 1)
+        )
+        db.session.commit()
+        return result.rowcount == 1
+
+    def _claim_next(self) -> Optional[int]:
+        """가장 오래된 대기 작업 점유 (재시도 대기 시각이 지나지 않은 작업은 건너뜀)"""
+        for _ in range(5):
+            job_id = db.session.query(SubmissionJob.id).filter(
+                SubmissionJob.status == 'queued',
+                or_(SubmissionJob.available_at.is_(None), SubmissionJob.available_at <= datetime.utcnow())
+            ).order_by(SubmissionJob.id).limit(1).scalar()
+            if job_id is None:
+                return None
+            if self._claim(job_id):
+                return job_id
+        return None
+
+    def _requeue_stale(self) -> None:
+        """
+        하트비트가 끊긴 작업 회수 (1분에 한 번)
+
+        워커 프로세스가 강제 종료되어 남은 작업은 다시 대기 상태로 돌리고,
+        이미 SUBMISSION_MAX_ATTEMPTS번 점유된 작업은 실패로 처리합니다.
+        """
+        if time.monotonic() - self._last_requeue < 60:
+            return
+        self._last_requeue = time.monotonic()
+
+        stale_before = datetime.utcnow() - timedelta(seconds=self._app.config['SUBMISSION_STALE_SECONDS'])
+        # 하트비트 도입 전에 점유된 작업은 점유 시각 기준
+        last_beat = func.coalesce(SubmissionJob.heartbeat_at, SubmissionJob.started_at)
+        is_stale = (SubmissionJob.status == 'running', last_beat < stale_before)
+        stale_jobs = db.session.query(SubmissionJob.id, SubmissionJob.submission_id, SubmissionJob.attempts) \
+            .filter(*is_stale).all()
+
+        for job_id, submission_id, attempts in stale_jobs:
+            failed = attempts >= self._app.config['SUBMISSION_MAX_ATTEMPTS']
+            job_values = {'status': 'failed', 'finished_at': datetime.utcnow(),
+                          'error': '채점 워커가 응답하지 않습니다'} if failed else {'status': 'queued'}
+            # 조회 뒤 하트비트가 갱신되었거나 다른 워커가 먼저 회수했으면 건너뜀
+            result = db.session.execute(
+                update(SubmissionJob).where(SubmissionJob.id == job_id, *is_stale).values(**job_values)
+            )
+            if result.rowcount != 1:
+                continue
+
+            submission_values = {'status': 'error', 'error': '채점 중 오류가 발생했습니다'} \
+                if failed else {'status': 'queued'}
+            db.session.execute(
+                update(Submission).where(Submission.id == submission_id).values(**submission_values)
+            )
+            logger.warning('제출 %s 채점 작업 회수 (%s)', submission_id, 'failed' if failed else 'requeued')
+        db.session.commit()
+
+    @contextmanager
+    def _heartbeat(self, job_id: int):
+        """채점하는 동안 별도 스레드에서 작업의 heartbeat_at을 주기적으로 갱신"""
+        interval = self._app.config['SUBMISSION_HEARTBEAT_SECONDS']
+        done = threading.Event()
+
+        def beat():
+            while not done.wait(interval):
+                try:
+                    with self._app.app_context(), db.engine.begin() as conn:
+                        conn.execute(
+                            update(SubmissionJob)
+                            .where(SubmissionJob.id == job_id, SubmissionJob.status == 'running')
+                            .values(heartbeat_at=datetime.utcnow())
+                        )
+                except Exception:
+                    logger.exception('제출 채점 작업 %s 하트비트 갱신 실패', job_id)
+
+        thread = threading.Thread(target=beat, name=f'submission-heartbeat-{job_id}', daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            done.set()
+            thread.join()
+
+    def _run(self, job_id: int) -> None:
+        """
+        점유한 작업 채점 및 결과 저장
+
+        코드 러너 과부하 등으로 채점하지 못하면 SUBMISSION_RETRY_BACKOFF초부터 두 배씩
+        늘려 가며 다시 대기열에 넣고, SUBMISSION_MAX_ATTEMPTS번 실패하면 실패로 처리합니다.
+        워커 스레드가 없는 동기 모드는 다시 채점할 워커가 없으므로 바로 실패로 처리합니다.
+        """
+        job = db.session.get(SubmissionJob, job_id)
+        submission = db.session.get(Submission, job.submission_id)
+
+        try:
+            submission.status = 'running'
+            db.session.commit()
+
+            with self._heartbeat(job_id):
+                _, judge_result = SubmissionService.grade_submission(submission)
+            job.status = 'done'
+            job.result = judge_result
+            job.finished_at = datetime.utcnow()
+            db.session.commit()
+
+            leaderboard.record(submission.user_id, submission.problem_id)
+        except Exception as e:
+            db.session.rollback()
+            if isinstance(e, RunnerUnavailableError):
+                logger.warning('제출 %s 채점 실패 (코드 러너): %s', job.submission_id, e)
+            else:
+                logger.exception('제출 %s 채점 실패', job.submission_id)
+
+            job.error = str(e)
+            if not self.is_async or job.attempts >= self._app.config['SUBMISSION_MAX_ATTEMPTS']:
+                job.status = 'failed'
+                job.finished_at = datetime.utcnow()
+                submission.status = 'error'
+                submission.error = str(e) if isinstance(e, RunnerUnavailableError) \
+                    else '채점 중 오류가 발생했습니다'
+            else:
+                backoff = self._app.config['SUBMISSION_RETRY_BACKOFF'] * 2 ** (job.attempts - 1)
+                job.status = 'queued'
+                job.available_at = datetime.utcnow() + timedelta(seconds=backoff)
+                submission.status = 'queued'
+            db.session.commit()
+
+
+submission_queue = SubmissionQueue()
@@ -0,0 +1,237 @@
+"""
+제출 서비스
+"""
+import json
+import time
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import joinedload, load_only, undefer
+from app import db
+from app.models.problem import Problem
+from app.models.submission import Submission
+from app.models.submission_job import SubmissionJob
+from app.services.blob_service import BlobService
+from app.services.code_runner_service import CodeRunnerService, RunnerUnavailableError
+from app.services.judge_service import JudgeService
+from app.services.stats_service import StatsService
+from app.utils.pagination import decode_cursor, encode_cursor
+
+# 목록 조회 시 읽는 컬럼 (code_length/code_preview는 SQL로 계산)
+SUMMARY_COLUMNS = [field for field in Submission.SUMMARY_FIELDS
+                   if field not in ('code_length', 'code_preview')]
+
+# 상세 조회 fields= 선택자에 쓸 수 있는 필드
+DETAIL_FIELDS = Submission.DETAIL_FIELDS + ('judge_result',)
+
+# 채점이 끝나지 않은 제출 상태
+PENDING_STATUSES = ('queued', 'running')
+
+
+class SubmissionService:
+    """제출 및 채점 관련 비즈니스 로직"""
+    
+    @staticmethod
+    def create_submission(user_id: int, problem_id: int,
+                          code: str) -> Tuple[bool, Optional[Submission], Optional[str]]:
+        """
+        제출 기록과 채점 작업 생성
+        
+        Returns:
+            (success, submission, error_message)
+        """
+        submission = Submission(
+            user_id=user_id,
+            problem_id=problem_id,
+            status='queued'
+        )
+        
+        try:
+            db.session.add(submission)
+            BlobService.attach(submission, 'code', code)
+            db.session.flush()
+            db.session.add(SubmissionJob(submission_id=submission.id))
+            StatsService.record_attempt(submission)
+            db.session.commit()
+            return True, submission, None
+        except Exception as e:
+            db.session.rollback()
+            return False, None, f'제출 저장 중 오류가 발생했습니다: {str(e)}'
+    
+    @staticmethod
+    def grade_submission(submission: Submission) -> Tuple[Optional[Dict], Optional[Dict]]:
+        """
+        제출 코드를 실행/채점하고 결과를 제출 기록에 반영 (커밋은 호출자가 수행)
+        
+        테스트 케이스가 있는 문제는 채점하고, 없으면 단순 실행합니다.
+        코드 러너가 실행 결과를 돌려주지 못하면 제출 기록과 통계를 바꾸지 않고
+        예외를 발생시키므로, 호출자가 나중에 다시 채점할 수 있습니다.
+        
+        Returns:
+            (execution_result, judge_result)
+        
+        Raises:
+            RunnerUnavailableError: 코드 러너 호출에 실패한 경우
+        """
+        judge_result = None
+        problem = Problem.query.filter_by(id=submission.problem_id, is_active=True).first()
+        
+        if problem and problem.test_cases:
+            success, judge_result, error = JudgeService.judge(submission.code, problem)
+            result = judge_result.pop('result') if success else {}
+        else:
+            success, result, error = CodeRunnerService.execute_code(submission.code)
+        
+        if not success:
+            raise RunnerUnavailableError(error)
+        
+        BlobService.attach(submission, 'output', result.get('output'))
+        submission.error = result.get('error')
+        submission.status = 'success' if result.get('success') else 'error'
+        submission.execution_time = result.get('execution_time')
+        submission.score = judge_result['score'] if judge_result else None
+        submission.is_correct = judge_result['is_correct'] if judge_result else None
+        StatsService.record_result(submission)
+        
+        return result, judge_result
+    
+    @staticmethod
+    def list_user_submissions(user_id: int, problem_id: Optional[int] = None, limit: int = 20,
+                              cursor: Optional[str] = None,
+                              include_total: bool = False) -> Tuple[List[Submission], Optional[str], Optional[int]]:
+        """
+        사용자의 제출 기록을 최신순으로 커서 페이지네이션하여 조회
+        
+        (user_id, submitted_at, id) 인덱스를 따라 커서 다음 위치부터 읽으므로
+        뒤쪽 페이지도 앞쪽과 같은 비용이 듭니다. 전체 개수는 COUNT가 필요하므로
+        include_total일 때만 계산합니다.
+        
+        Returns:
+            (submissions, next_cursor, total) - 마지막 페이지면 next_cursor는 None
+        
+        Raises:
+            ValueError: 커서가 올바르지 않은 경우
+        """
+        query = Submission.query.filter_by(user_id=user_id)
+        if problem_id:
+            query = query.filter_by(problem_id=problem_id)
+        
+        total = query.count() if include_total else None
+        
+        # 목록에는 요약만 필요하므로 코드/출력 본문 컬럼은 읽지 않음
+        query = query.options(
+            load_only(*(getattr(Submission, field) for field in SUMMARY_COLUMNS)),
+            undefer(Submission.code_length),
+            undefer(Submission.code_preview)
+        )
+        
+        if cursor:
+            submitted_at, last_id = decode_cursor(cursor)
+            query = query.filter(or_(
+                Submission.submitted_at < submitted_at,
+                and_(Submission.submitted_at == submitted_at, Submission.id < last_id)
+            ))
+        
+        # 다음 페이지 여부를 알기 위해 하나 더 읽음
+        submissions = query.order_by(Submission.submitted_at.desc(), Submission.id.desc()) \
+            .limit(limit + 1).all()
+        
+        next_cursor = None
+        if len(submissions) > limit:
+            submissions = submissions[:limit]
+            last = submissions[-1]
+            next_cursor = encode_cursor(last.submitted_at, last.id)
+        
+        return submissions, next_cursor, total
+    
+    @staticmethod
+    def parse_detail_fields(value: Optional[str]) -> Optional[List[str]]:
+        """
+        fields= 선택자 해석 (쉼표로 구분, 없으면 None = 전체)
+        
+        Raises:
+            ValueError: 알 수 없는 필드가 있는 경우
+        """
+        if not value:
+            return None
+        
+        fields = list(dict.fromkeys(field.strip() for field in value.split(',') if field.strip()))
+        unknown = [field for field in fields if field not in DETAIL_FIELDS]
+        if unknown:
+            raise ValueError(f'알 수 없는 필드입니다: {", ".join(unknown)} '
+                             f'(사용 가능: {", ".join(DETAIL_FIELDS)})')
+        return fields or None
+    
+    @staticmethod
+    def get_user_submission(user_id: int, submission_id: int,
+                            fields: Optional[Sequence[str]] = None) -> Optional[Submission]:
+        """사용자의 제출 조회 (fields를 주면 해당 컬럼만 읽음)"""
+        query = Submission.query.filter_by(id=submission_id, user_id=user_id)
+        blob_fields = [field for field in Submission.BLOB_FIELDS if not fields or field in fields]
+        if fields:
+            columns = []
+            for field in fields:
+                if field in Submission.BLOB_FIELDS:
+                    columns.extend(Submission.BLOB_FIELDS[field])
+                elif field in Submission.DETAIL_FIELDS:
+                    columns.append(field)
+            query = query.options(load_only(*(getattr(Submission, column) for column in columns)))
+        
+        # 코드/출력 본문은 제출과 함께 한 번에 읽음
+        query = query.options(*(joinedload(getattr(Submission, f'{field}_blob')) for field in blob_fields))
+        return query.first()
+    
+    @staticmethod
+    def get_submission_detail(submission: Submission,
+                              fields: Optional[Sequence[str]] = None) -> Dict:
+        """제출 정보와 채점 작업 결과를 합친 상세 정보 (fields를 주면 해당 필드만)"""
+        data = submission.to_dict([field for field in fields if field != 'judge_result']
+                                  if fields else None)
+        if not fields or 'judge_result' in fields:
+            job = SubmissionJob.query.filter_by(submission_id=submission.id).first()
+            data['judge_result'] = job.result if job else None
+        return data
+
+    @staticmethod
+    def get_execution_result(submission: Submission) -> Dict:
+        """제출 기록을 코드 러너 실행 결과 형식으로 변환"""
+        return {
+            'success': submission.status == 'success',
+            'output': submission.output or '',
+            'error': submission.error,
+            'execution_time': submission.execution_time
+        }
+    
+    @staticmethod
+    def iter_events(submission_id: int, poll_interval: float, timeout: float) -> Iterator[str]:
+        """
+        제출 상태 변화를 Server-Sent Events 형식으로 반환
+        
+        상태가 바뀔 때마다 'status' 이벤트를, 채점이 끝나면 'result' 이벤트를
+        보내고 종료합니다. timeout 안에 끝나지 않으면 'timeout' 이벤트로 종료합니다.
+        """
+        last_status = None
+        deadline = time.monotonic() + timeout
+        
+        while time.monotonic() < deadline:
+            submission = db.session.get(Submission, submission_id)
+            if submission is None:
+                return
+            
+            if submission.status != last_status:
+                last_status = submission.status
+                if submission.status in PENDING_STATUSES:
+                    yield _sse('status', {'id': submission_id, 'status': submission.status})
+                else:
+                    yield _sse('result', SubmissionService.get_submission_detail(submission))
+                    return
+            
+            # 폴링 사이에 DB 연결을 반납
+            db.session.close()
+            time.sleep(poll_interval)
+        
+        yield _sse('timeout', {'id': submission_id, 'status': last_status})
+
+
+def _sse(event: str, data: Dict) -> str:
+    """Server-Sent Events 메시지 생성"""
+    return f'event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n'
@@ -0,0 +1,145 @@
+"""
+태그 서비스
+
+태그는 tags/material_tags 테이블로 관리하며, 태그별 공개 자료 수는
+자료를 생성/수정할 때 바뀐 태그만 다시 계산해 tags.material_count에 둡니다.
+태그는 대소문자를 구분하지 않고 같은 태그로 보며("Python"과 "python"),
+표시 이름은 처음 만들어질 때 입력한 그대로 유지합니다.
+"""
+from typing import Iterable, List, Union
+from sqlalchemy import func, select, update
+from app import db
+from app.models.material import Material
+from app.models.tag import Tag, material_tags
+
+TAG_MATCH_MODES = ('any', 'all')
+MAX_TAG_LENGTH = 50
+
+
+def tag_key(name: str) -> str:
+    """대소문자를 구분하지 않는 태그 비교 키"""
+    return name.casefold()
+
+
+class TagService:
+    """태그 관련 비즈니스 로직"""
+    
+    @staticmethod
+    def parse_tags(value: Union[str, List[str], None]) -> List[str]:
+        """
+        쉼표로 구분된 문자열이나 목록을 태그 이름 목록으로 변환
+        
+        앞뒤 공백을 없애고, 빈 이름과 대소문자만 다른 중복은 제외합니다
+        (먼저 나온 이름을 유지).
+        """
+        if not value:
+            return []
+        if isinstance(value, str):
+            value = value.split(',')
+        
+        names = (str(name).strip()[:MAX_TAG_LENGTH] for name in value)
+        unique = {}
+        for name in names:
+            if name:
+                unique.setdefault(tag_key(name), name)
+        return list(unique.values())
+    
+    @staticmethod
+    def set_material_tags(material: Material, names: List[str]) -> None:
+        """자료의 태그를 바꾸고 관련 태그 수 갱신 (commit은 호출한 쪽에서)"""
+        affected = {tag.id for tag in material.tags}
+        
+        keys = [tag_key(name) for name in names]
+        tags = Tag.query.filter(Tag.key.in_(keys)).all() if names else []
+        existing = {tag.key for tag in tags}
+        for name, key in zip(names, keys):
+            if key not in existing:
+                tag = Tag(name=name, key=key)
+                db.session.add(tag)
+                tags.append(tag)
+        
+        material.tags = tags
+        db.session.flush()
+        
+        affected.update(tag.id for tag in tags)
+        TagService.refresh_counts(affected)
+    
+    @staticmethod
+    def refresh_counts(tag_ids: Iterable[int]) -> None:
+        """태그별 공개 자료 수 다시 계산 (자료 변경 사항이 flush된 뒤 호출)"""
+        tag_ids = list(tag_ids)
+        if not tag_ids:
+            return
+        
+        published_count = (
+            select(func.count())
+            .select_from(material_tags.join(Material, Material.id == material_tags.c.material_id))
+            .where(material_tags.c.tag_id == Tag.id, Material.is_published.is_(True))
+            .scalar_subquery()
+        )
+        db.session.execute(
+            update(Tag).where(Tag.id.in_(tag_ids)).values(material_count=published_count),
+            execution_options={'synchronize_session': False}
+        )
+    
+    @staticmethod
+    def get_tags() -> List[Tag]:
+        """공개 자료가 있는 태그 목록 (자료가 많은 순)"""
+        return Tag.query.filter(Tag.material_count > 0) \
+            .order_by(Tag.material_count.desc(), Tag.key).all()
+    
+    @staticmethod
+    def filter_by_tags(query, names: List[str], match: str = 'any'):
+        """
+        자료 조회에 태그 조건 추가
+        
+        Args:
+            query: Material 조회
+            names: 태그 이름 목록
+            match: 'any'는 하나라도 가진 자료, 'all'은 모두 가진 자료
+        """
+        material_ids = select(material_tags.c.material_id) \
+            .join(Tag, Tag.id == material_tags.c.tag_id) \
+            .where(Tag.key.in_([tag_key(name) for name in names]))
+        if match == 'all':
+            material_ids = material_ids.group_by(material_tags.c.material_id) \
+                .having(func.count() == len(names))
+        return query.filter(Material.id.in_(material_ids))
+    
+    @staticmethod
+    def ensure_tag_keys() -> None:
+        """비교 키 도입 전에 만든 태그의 key 채우기"""
+        tags = Tag.query.filter(Tag.key.is_(None)).all()
+        for tag in tags:
+            tag.key = tag_key(tag.name)
+        if tags:
+            db.session.commit()
+    
+    @staticmethod
+    def migrate_legacy_tags() -> int:
+        """
+        쉼표로 구분된 이전 형식의 태그(materials.tags 컬럼)를 태그 테이블로 옮김
+        
+        옮긴 자료는 이전 컬럼을 비우므로 여러 번 실행해도 안전합니다.
+        
+        Returns:
+            옮긴 자료 수
+        """
+        materials = Material.query.filter(
+            Material.legacy_tags.isnot(None), Material.legacy_tags != ''
+        ).all()
+        
+        for material in materials:
+            names = [tag.name for tag in material.tags] + TagService.parse_tags(material.legacy_tags)
+            TagService.set_material_tags(material, TagService.parse_tags(names))
+        
+        if materials:
+            # 태그 이전은 자료 수정이 아니므로 updated_at(Last-Modified 기준)을 유지
+            db.session.execute(
+                update(Material)
+                .where(Material.id.in_([material.id for material in materials]))
+                .values(legacy_tags=None, updated_at=Material.updated_at),
+                execution_options={'synchronize_session': False}
+            )
+            db.session.commit()
+        return len(materials)
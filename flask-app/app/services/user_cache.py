@@ -0,0 +1,100 @@
+"""
+인증된 사용자 조회 캐시
+
+인증 데코레이터가 요청마다 사용자를 DB에서 읽지 않도록 사용자 컬럼 값을
+짧은 시간(USER_CACHE_TTL) 프로세스 메모리에 보관합니다. 캐시된 값은
+merge(load=False)로 요청 세션에 붙이므로 뷰는 평소처럼 ORM 객체를 다룰 수 있고,
+프로필 수정이나 계정 비활성화 시에는 즉시 무효화됩니다.
+
+여러 프로세스로 실행하면 다른 프로세스의 변경은 TTL이 지나야 반영됩니다.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+from flask import Flask
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import make_transient_to_detached
+from app import db
+from app.models.user import User
+from app.utils.metrics import CACHE_REQUESTS
+
+
+class UserCache:
+    """사용자 ID별 컬럼 값을 보관하는 TTL + LRU 캐시"""
+
+    def __init__(self):
+        self.ttl = 0.0
+        self.max_entries = 0
+        self._entries: 'OrderedDict[int, Tuple[float, Dict[str, Any]]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def init_app(self, app: Flask) -> None:
+        """설정 로드 (USER_CACHE_TTL이 0이면 캐시를 쓰지 않음)"""
+        self.ttl = app.config['USER_CACHE_TTL']
+        self.max_entries = app.config['USER_CACHE_MAX_ENTRIES']
+        self.clear()
+
+    def get(self, user_id) -> Optional[User]:
+        """
+        현재 요청 세션에 연결된 사용자 반환
+
+        Returns:
+            사용자 객체, 없으면 None
+        """
+        user_id = int(user_id)
+        if self.ttl <= 0:
+            return db.session.get(User, user_id)
+
+        values = self._lookup(user_id)
+        if values is not None:
+            CACHE_REQUESTS.labels('user', 'hit').inc()
+            cached = User(**values)
+            make_transient_to_detached(cached)
+            return db.session.merge(cached, load=False)
+
+        CACHE_REQUESTS.labels('user', 'miss').inc()
+        user = db.session.get(User, user_id)
+        if user is not None:
+            self._store(user_id, {
+                attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs
+            })
+        return user
+
+    def invalidate(self, user_id) -> None:
+        """사용자 정보가 바뀌었을 때 캐시에서 제거"""
+        with self._lock:
+            self._entries.pop(int(user_id), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _lookup(self, user_id: int) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            expires_at, values = entry
+            if expires_at <= time.monotonic():
+                del self._entries[user_id]
+                return None
+            self._entries.move_to_end(user_id)
+            return values
+
+    def _store(self, user_id: int, values: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[user_id] = (time.monotonic() + self.ttl, values)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+user_cache = UserCache()
+
+
+@event.listens_for(User, 'after_update')
+@event.listens_for(User, 'after_delete')
+def _invalidate_changed_user(mapper, connection, target: User) -> None:
+    """ORM으로 사용자를 수정하거나 삭제하면 어느 경로든 캐시에서 제거"""
+    user_cache.invalidate(target.id)
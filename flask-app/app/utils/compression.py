@@ -0,0 +1,41 @@
+"""
+본문 압축 유틸리티
+
+zlib은 표준 라이브러리로 항상 쓸 수 있고, zstd는 zstandard 패키지가
+설치되어 있을 때만 씁니다 (없으면 zlib으로 대신 압축).
+"""
+import zlib
+from typing import Tuple
+
+try:
+    import zstandard
+except ImportError:  # 선택 의존성
+    zstandard = None
+
+COMPRESSION_METHODS = ('none', 'zlib', 'zstd')
+
+ZLIB_LEVEL = 6
+ZSTD_LEVEL = 3
+
+
+def compress(raw: bytes, method: str) -> Tuple[str, bytes]:
+    """
+    raw를 method로 압축
+
+    Returns:
+        (실제 사용한 압축 방식, 압축된 데이터)
+    """
+    if method == 'zstd' and zstandard is not None:
+        return 'zstd', zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(raw)
+    return 'zlib', zlib.compress(raw, ZLIB_LEVEL)
+
+
+def decompress(data: bytes, method: str) -> bytes:
+    """compress로 압축한 데이터 복원"""
+    if method == 'zlib':
+        return zlib.decompress(data)
+    if method == 'zstd':
+        if zstandard is None:
+            raise RuntimeError('zstd로 압축된 데이터를 읽으려면 zstandard 패키지가 필요합니다')
+        return zstandard.ZstdDecompressor().decompress(data)
+    raise ValueError(f'알 수 없는 압축 방식입니다: {method}')
@@ -4,7 +4,7 @@
 from functools import wraps
 from flask import jsonify
 from flask_jwt_extended import verify_jwt_in_request, get_jwt_identity
-from app.models.user import User
+from app.services.user_cache import user_cache
 
 
 def jwt_required_with_user(fn):
@@ -12,13 +12,14 @@ def jwt_required_with_user(fn):
     JWT 인증 필수 데코레이터 (사용자 객체 자동 로드)
     
     데코레이팅된 함수는 첫 번째 인자로 current_user를 받습니다.
+    사용자는 USER_CACHE_TTL 동안 캐시되어 요청마다 DB를 조회하지 않습니다.
     """
     @wraps(fn)
     def wrapper(*args, **kwargs):
         verify_jwt_in_request()
         user_id = get_jwt_identity()
         
-        user = User.query.get(user_id)
+        user = user_cache.get(user_id)
         if not user or not user.is_active:
             return jsonify({
                 'success': False,
@@ -39,7 +40,7 @@ def admin_required(fn):
         verify_jwt_in_request()
         user_id = get_jwt_identity()
         
-        user = User.query.get(user_id)
+        user = user_cache.get(user_id)
         if not user or not user.is_active:
             return jsonify({
                 'success': False,
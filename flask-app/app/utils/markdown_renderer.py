@@ -0,0 +1,60 @@
+"""
+수업 자료 Markdown 렌더링 유틸리티
+
+코드 블록은 Pygments로 강조하고, 결과 HTML은 허용 목록 기반으로 정리하여
+자료 본문에 들어간 스크립트나 이벤트 속성이 브라우저에서 실행되지 않게 합니다.
+"""
+import hashlib
+
+import markdown
+import nh3
+
+# 확장이나 허용 목록을 바꾸면 올려서 기존 렌더링 결과를 다시 만들게 함
+RENDERER_VERSION = 1
+
+# Pygments 토큰 클래스 접두어 (static/css/highlight.css와 맞춰야 함)
+HIGHLIGHT_CSS_CLASS = 'highlight'
+
+MARKDOWN_EXTENSIONS = ['fenced_code', 'codehilite', 'tables', 'sane_lists']
+MARKDOWN_EXTENSION_CONFIGS = {
+    'codehilite': {
+        'css_class': HIGHLIGHT_CSS_CLASS,
+        'guess_lang': False
+    }
+}
+
+ALLOWED_TAGS = {
+    'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p', 'br', 'hr', 'blockquote',
+    'ul', 'ol', 'li', 'strong', 'em', 'del', 'code', 'pre', 'span', 'div',
+    'a', 'img', 'table', 'thead', 'tbody', 'tr', 'th', 'td'
+}
+ALLOWED_ATTRIBUTES = {
+    'a': {'href', 'title'},
+    'img': {'src', 'alt', 'title'},
+    'span': {'class'},
+    'div': {'class'},
+    'code': {'class'},
+    'th': {'align'},
+    'td': {'align'}
+}
+ALLOWED_URL_SCHEMES = {'http', 'https', 'mailto'}
+
+
+def content_hash(text: str) -> str:
+    """렌더링 결과를 식별하는 해시 (렌더러 버전 포함)"""
+    return hashlib.sha256(f'{RENDERER_VERSION}\n{text}'.encode('utf-8')).hexdigest()
+
+
+def render_markdown(text: str) -> str:
+    """Markdown을 코드 강조가 적용된 안전한 HTML로 변환"""
+    html = markdown.markdown(
+        text or '',
+        extensions=MARKDOWN_EXTENSIONS,
+        extension_configs=MARKDOWN_EXTENSION_CONFIGS
+    )
+    return nh3.clean(
+        html,
+        tags=ALLOWED_TAGS,
+        attributes=ALLOWED_ATTRIBUTES,
+        url_schemes=ALLOWED_URL_SCHEMES
+    )
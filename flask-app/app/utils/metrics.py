@@ -0,0 +1,168 @@
+"""
+Prometheus 메트릭
+
+요청 처리 시간, 요청별 DB 쿼리 수와 시간, 코드 러너 호출 시간을 기록하고
+채점 큐 깊이와 코드 러너 클라이언트 상태는 수집 시점에 읽어 /metrics로 노출합니다.
+
+gunicorn 등으로 여러 프로세스를 띄울 때는 PROMETHEUS_MULTIPROC_DIR을 지정하면
+모든 워커 프로세스의 값을 합쳐서 노출합니다 (prometheus_client를 임포트하기 전에 설정).
+"""
+import os
+import time
+from typing import Iterator
+
+from flask import Flask, g, has_app_context, has_request_context, request
+from prometheus_client import REGISTRY, CollectorRegistry, Counter, Histogram, multiprocess
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from prometheus_client.registry import Collector
+from sqlalchemy import event, func
+from sqlalchemy.engine import Engine
+
+HTTP_REQUEST_DURATION = Histogram(
+    'flask_http_request_duration_seconds',
+    'HTTP 요청 처리 시간 (스트리밍 응답은 첫 응답까지)',
+    ['method', 'route', 'blueprint', 'status']
+)
+
+DB_QUERIES_PER_REQUEST = Histogram(
+    'flask_db_queries_per_request',
+    '요청 하나가 실행한 DB 쿼리 수',
+    ['route'],
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100, 200)
+)
+
+DB_TIME_PER_REQUEST = Histogram(
+    'flask_db_query_seconds_per_request',
+    '요청 하나의 DB 쿼리 시간 합계',
+    ['route'],
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1)
+)
+
+DB_QUERIES = Counter(
+    'flask_db_queries',
+    '실행한 DB 쿼리 수 (채점 워커 등 요청 밖의 쿼리 포함)'
+)
+
+DB_QUERY_DURATION = Histogram(
+    'flask_db_query_duration_seconds',
+    'DB 쿼리 하나의 실행 시간',
+    buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1)
+)
+
+RUNNER_REQUEST_DURATION = Histogram(
+    'flask_runner_request_duration_seconds',
+    '코드 러너 호출 시간 (응답 본문을 다 읽을 때까지)',
+    ['method', 'path', 'status'],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+)
+
+RUNNER_REQUEST_ERRORS = Counter(
+    'flask_runner_request_errors',
+    '코드 러너 호출 실패 수 (재시도한 연결 오류 포함)',
+    ['path', 'kind']
+)
+
+CACHE_REQUESTS = Counter(
+    'flask_cache_requests',
+    '프로세스 내 캐시 조회 수 (적중률 = hit / (hit + miss))',
+    ['cache', 'result']
+)
+
+
+def _route_label() -> str:
+    """경로 변수가 그대로 남은 URL 규칙 (/api/materials/<int:material_id>)"""
+    return request.url_rule.rule if request.url_rule else 'unmatched'
+
+
+@event.listens_for(Engine, 'before_cursor_execute')
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('query_started', []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, 'after_cursor_execute')
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info['query_started'].pop()
+    DB_QUERIES.inc()
+    DB_QUERY_DURATION.observe(elapsed)
+
+    if has_request_context() and 'metrics_started' in g:
+        g.db_queries += 1
+        g.db_time += elapsed
+
+
+def _start_request() -> None:
+    g.metrics_started = time.perf_counter()
+    g.db_queries = 0
+    g.db_time = 0.0
+
+
+def _record_request(response):
+    if 'metrics_started' not in g:
+        return response
+
+    route = _route_label()
+    HTTP_REQUEST_DURATION.labels(
+        request.method, route, request.blueprint or '', response.status_code
+    ).observe(time.perf_counter() - g.metrics_started)
+    DB_QUERIES_PER_REQUEST.labels(route).observe(g.db_queries)
+    DB_TIME_PER_REQUEST.labels(route).observe(g.db_time)
+    return response
+
+
+class AppStatsCollector(Collector):
+    """채점 큐 깊이와 코드 러너 클라이언트 상태를 수집 시점에 노출"""
+
+    def collect(self) -> Iterator:
+        # /metrics 요청 안에서만 앱 설정과 DB에 접근할 수 있음
+        if not has_app_context():
+            return
+
+        from app import db
+        from app.models.submission_job import SubmissionJob
+        from app.services.runner_client import get_runner_client
+
+        jobs = GaugeMetricFamily('flask_submission_jobs', '상태별 채점 작업 수', labels=['status'])
+        counts = dict(
+            db.session.query(SubmissionJob.status, func.count(SubmissionJob.id))
+            .group_by(SubmissionJob.status).all()
+        )
+        for status in ('queued', 'running', 'done', 'failed'):
+            jobs.add_metric([status], counts.get(status, 0))
+        yield jobs
+
+        client = get_runner_client().stats()
+        in_flight = GaugeMetricFamily('flask_runner_in_flight', '코드 러너 인스턴스별 진행 중인 요청 수', labels=['url'])
+        available = GaugeMetricFamily('flask_runner_available', '코드 러너 인스턴스 선택 가능 여부', labels=['url'])
+        for instance in client['instances']:
+            in_flight.add_metric([instance['url']], instance['in_flight'])
+            available.add_metric([instance['url']], 1 if instance['available'] else 0)
+        yield in_flight
+        yield available
+        yield CounterMetricFamily('flask_runner_retries', '코드 러너 연결 재시도 수', client['retries'])
+
+
+APP_STATS_COLLECTOR = AppStatsCollector()
+REGISTRY.register(APP_STATS_COLLECTOR)
+
+
+def get_registry() -> CollectorRegistry:
+    """
+    /metrics로 노출할 레지스트리
+
+    멀티프로세스 모드에서는 요청마다 모든 프로세스의 값을 합친 레지스트리를 만듭니다.
+    채점 큐 깊이는 DB에서 읽으므로 전체 값이고, 코드 러너 클라이언트 상태는
+    응답한 워커 프로세스의 값입니다.
+    """
+    if 'PROMETHEUS_MULTIPROC_DIR' not in os.environ:
+        return REGISTRY
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    registry.register(APP_STATS_COLLECTOR)
+    return registry
+
+
+def init_app(app: Flask) -> None:
+    """요청 처리 시간과 요청별 DB 쿼리 기록 시작"""
+    app.before_request(_start_request)
+    app.after_request(_record_request)
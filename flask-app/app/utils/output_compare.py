@@ -0,0 +1,56 @@
+"""
+채점용 출력 비교 유틸리티
+"""
+import math
+from typing import List
+
+COMPARE_MODES = ('exact', 'whitespace', 'float')
+
+
+def _normalize_newlines(text: str) -> str:
+    """줄바꿈 문자 통일 및 끝의 빈 줄 제거"""
+    return (text or '').replace('\r\n', '\n').rstrip('\n')
+
+
+def _tokens(text: str) -> List[str]:
+    return (text or '').split()
+
+
+def _tokens_match_float(expected: str, actual: str, tolerance: float) -> bool:
+    """숫자 토큰은 허용 오차 내에서, 나머지는 문자열로 비교"""
+    try:
+        return math.isclose(float(expected), float(actual),
+                            rel_tol=tolerance, abs_tol=tolerance)
+    except ValueError:
+        return expected == actual
+
+
+def compare_output(expected: str, actual: str, mode: str = 'exact',
+                   tolerance: float = 1e-6) -> bool:
+    """
+    기대 출력과 실제 출력 비교
+    
+    Args:
+        expected: 기대 출력
+        actual: 실제 출력
+        mode: 'exact' (줄바꿈만 정규화), 'whitespace' (공백 무시),
+              'float' (공백 무시 + 실수 허용 오차)
+        tolerance: 'float' 모드의 상대/절대 허용 오차
+    
+    Returns:
+        일치 여부
+    """
+    if mode == 'whitespace':
+        return _tokens(expected) == _tokens(actual)
+    
+    if mode == 'float':
+        expected_tokens = _tokens(expected)
+        actual_tokens = _tokens(actual)
+        if len(expected_tokens) != len(actual_tokens):
+            return False
+        return all(
+            _tokens_match_float(e, a, tolerance)
+            for e, a in zip(expected_tokens, actual_tokens)
+        )
+    
+    return _normalize_newlines(expected) == _normalize_newlines(actual)
@@ -0,0 +1,32 @@
+"""
+커서(keyset) 페이지네이션 유틸리티
+
+커서는 마지막 항목의 (정렬 시각, id)를 담은 불투명한 토큰으로,
+OFFSET 없이 인덱스에서 바로 다음 위치를 찾을 수 있게 합니다.
+"""
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Tuple
+
+
+def encode_cursor(sort_value: datetime, item_id: int) -> str:
+    """마지막 항목의 정렬 키를 URL에 쓸 수 있는 토큰으로 변환"""
+    raw = json.dumps([sort_value.isoformat(), item_id], separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(token: str) -> Tuple[datetime, int]:
+    """
+    토큰을 (정렬 시각, id)로 복원
+    
+    Raises:
+        ValueError: 토큰 형식이 올바르지 않은 경우
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4))
+        sort_value, item_id = json.loads(raw)
+        return datetime.fromisoformat(sort_value), int(item_id)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+        raise ValueError('잘못된 커서입니다')
@@ -0,0 +1,190 @@
+"""
+요청 단위 프로파일링
+
+PROFILING_ENABLED일 때 X-Profile 헤더로 PROFILING_TOKEN을 보낸 요청이나
+PROFILING_SAMPLE_RATE 비율로 뽑힌 요청을 프로파일링합니다 (토큰이 없으면 헤더는
+무시). DB 쿼리 수와 시간, 코드 러너 호출 시간, JSON 직렬화 시간을 Server-Timing
+헤더로 돌려주고, PROFILING_SLOW_MS보다 느린 요청은 cProfile 결과(.prof)와
+요약(.json)을 PROFILING_DIR에 저장합니다. 저장된 프로파일이 PROFILING_MAX_FILES개를
+넘으면 오래된 것부터 지웁니다.
+
+.prof 파일은 `python -m pstats`로 보거나 snakeviz, flameprof 등으로
+플레임 그래프를 그릴 수 있습니다.
+"""
+import cProfile
+import json
+import logging
+import os
+import random
+import re
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Tuple
+
+from flask import Flask, current_app, g, has_request_context, request
+from flask.json.provider import DefaultJSONProvider
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = 'X-Profile'
+
+# 요약에 남길 느린 쿼리 수
+SLOW_QUERY_COUNT = 10
+
+
+class RequestProfile:
+    """프로파일링 중인 요청 하나의 측정값"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.profiler = cProfile.Profile()
+        self.queries: List[Tuple[float, str]] = []
+        self.sections: Dict[str, float] = {}
+
+    def add_section(self, name: str, elapsed: float) -> None:
+        self.sections[name] = self.sections.get(name, 0.0) + elapsed
+
+    def summary(self, total: float) -> Dict[str, Any]:
+        slowest = sorted(self.queries, reverse=True)[:SLOW_QUERY_COUNT]
+        return {
+            'method': request.method,
+            'path': request.full_path.rstrip('?'),
+            'endpoint': request.endpoint,
+            'total_ms': round(total * 1000, 2),
+            'db': {
+                'queries': len(self.queries),
+                'total_ms': round(sum(elapsed for elapsed, _ in self.queries) * 1000, 2),
+                'slowest': [
+                    {'ms': round(elapsed * 1000, 2), 'statement': statement}
+                    for elapsed, statement in slowest
+                ]
+            },
+            'sections_ms': {name: round(elapsed * 1000, 2) for name, elapsed in self.sections.items()}
+        }
+
+
+def _current_profile():
+    if has_request_context():
+        return g.get('profile')
+    return None
+
+
+@contextmanager
+def profile_section(name: str) -> Iterator[None]:
+    """프로파일링 중인 요청이면 블록 실행 시간을 name 구간에 더함"""
+    profile = _current_profile()
+    if profile is None:
+        yield
+        return
+
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.add_section(name, time.perf_counter() - started)
+
+
+class ProfilingJSONProvider(DefaultJSONProvider):
+    """jsonify 등의 JSON 직렬화 시간을 측정하는 JSON 공급자"""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        with profile_section('json'):
+            return super().dumps(obj, **kwargs)
+
+
+@event.listens_for(Engine, 'before_cursor_execute')
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_profile() is not None:
+        conn.info.setdefault('profile_started', []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, 'after_cursor_execute')
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    profile = _current_profile()
+    started = conn.info.get('profile_started')
+    if profile is not None and started:
+        profile.queries.append((time.perf_counter() - started.pop(), statement))
+
+
+def _should_profile() -> bool:
+    config = current_app.config
+    token = config['PROFILING_TOKEN']
+    # 토큰 없이 헤더만으로 켜면 누구나 부하를 주고 디스크를 채울 수 있으므로 무시
+    if token and request.headers.get(PROFILE_HEADER) == token:
+        return True
+    return random.random() < config['PROFILING_SAMPLE_RATE']
+
+
+def _start_profile() -> None:
+    if not _should_profile():
+        return
+    g.profile = RequestProfile()
+    g.profile.profiler.enable()
+
+
+def _server_timing(summary: Dict[str, Any]) -> str:
+    """브라우저 개발자 도구에서 볼 수 있는 Server-Timing 헤더 값"""
+    parts = [f'db;dur={summary["db"]["total_ms"]};desc="{summary["db"]["queries"]} queries"']
+    parts += [f'{name};dur={ms}' for name, ms in summary['sections_ms'].items()]
+    parts.append(f'total;dur={summary["total_ms"]}')
+    return ', '.join(parts)
+
+
+def _dump_profile(profile: RequestProfile, summary: Dict[str, Any]) -> str:
+    """cProfile 결과와 요약을 저장하고 .prof 경로 반환"""
+    directory = current_app.config['PROFILING_DIR']
+    os.makedirs(directory, exist_ok=True)
+
+    endpoint = re.sub(r'[^A-Za-z0-9_.-]', '_', request.endpoint or 'unmatched')
+    base = os.path.join(
+        directory,
+        f'{datetime.now():%Y%m%d-%H%M%S-%f}-{endpoint}-{int(summary["total_ms"])}ms'
+    )
+    profile.profiler.dump_stats(f'{base}.prof')
+    with open(f'{base}.json', 'w', encoding='utf-8') as f:
+        json.dump(summary, f, ensure_ascii=False, indent=2)
+    _prune_profiles(directory, current_app.config['PROFILING_MAX_FILES'])
+    return f'{base}.prof'
+
+
+def _prune_profiles(directory: str, keep: int) -> None:
+    """가장 최근 keep개의 프로파일만 남기고 삭제 (파일 이름이 저장 시각 순)"""
+    profiles = sorted(name[:-len('.prof')] for name in os.listdir(directory) if name.endswith('.prof'))
+    for base in profiles[:max(0, len(profiles) - keep)]:
+        for extension in ('.prof', '.json'):
+            try:
+                os.remove(os.path.join(directory, base + extension))
+            except FileNotFoundError:
+                pass
+
+
+def _finish_profile(response):
+    profile = g.pop('profile', None)
+    if profile is None:
+        return response
+
+    profile.profiler.disable()
+    summary = profile.summary(time.perf_counter() - profile.started)
+    response.headers['Server-Timing'] = _server_timing(summary)
+
+    if summary['total_ms'] >= current_app.config['PROFILING_SLOW_MS']:
+        try:
+            path = _dump_profile(profile, summary)
+            logger.warning('느린 요청 %s %s (%.0fms) 프로파일 저장: %s',
+                           summary['method'], summary['path'], summary['total_ms'], path)
+        except OSError:
+            logger.exception('프로파일 저장 실패')
+    return response
+
+
+def init_app(app: Flask) -> None:
+    """PROFILING_ENABLED일 때만 프로파일링 훅 등록"""
+    if not app.config['PROFILING_ENABLED']:
+        return
+
+    app.json = ProfilingJSONProvider(app)
+    app.before_request(_start_profile)
+    app.after_request(_finish_profile)
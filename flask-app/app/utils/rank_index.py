@@ -0,0 +1,75 @@
+"""
+정렬된 순위 색인
+
+점수 내림차순, 시간 오름차순으로 정렬된 키 목록을 유지하여 상위 K명은 앞에서
+바로 잘라 내고, 내 순위는 이진 탐색으로 찾습니다. 같은 점수와 시간은 같은
+순위(공동 순위)이며, 다음 순위는 그만큼 건너뜁니다 (1, 2, 2, 4).
+"""
+import math
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional, Tuple
+
+# (-점수, 시간, 사용자 ID)
+RankKey = Tuple[float, float, int]
+
+
+def _make_key(user_id: int, score: float, elapsed: Optional[float]) -> RankKey:
+    return (-score, elapsed if elapsed is not None else math.inf, user_id)
+
+
+class RankIndex:
+    """사용자별 (점수, 시간) 기록의 정렬된 색인"""
+
+    def __init__(self):
+        self._keys: List[RankKey] = []
+        self._user_keys: Dict[int, RankKey] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def update(self, user_id: int, score: float, elapsed: Optional[float]) -> None:
+        """사용자의 기록 추가 또는 교체"""
+        key = _make_key(user_id, score, elapsed)
+        previous = self._user_keys.get(user_id)
+        if previous == key:
+            return
+        if previous is not None:
+            del self._keys[bisect_left(self._keys, previous)]
+        insort(self._keys, key)
+        self._user_keys[user_id] = key
+
+    def remove(self, user_id: int) -> None:
+        """사용자의 기록 제거"""
+        previous = self._user_keys.pop(user_id, None)
+        if previous is not None:
+            del self._keys[bisect_left(self._keys, previous)]
+
+    def rank(self, user_id: int) -> Optional[int]:
+        """사용자의 순위 (기록이 없으면 None)"""
+        key = self._user_keys.get(user_id)
+        if key is None:
+            return None
+        return self._rank_of(key)
+
+    def top(self, limit: int) -> List[Tuple[int, int, float, Optional[float]]]:
+        """
+        상위 limit명
+
+        Returns:
+            [(순위, 사용자 ID, 점수, 시간), ...]
+        """
+        return [self._entry(key) for key in self._keys[:limit]]
+
+    def get(self, user_id: int) -> Optional[Tuple[int, int, float, Optional[float]]]:
+        """사용자의 (순위, 사용자 ID, 점수, 시간)"""
+        key = self._user_keys.get(user_id)
+        return self._entry(key) if key is not None else None
+
+    def _rank_of(self, key: RankKey) -> int:
+        # (점수, 시간)만으로 찾으면 같은 기록 중 첫 위치 = 더 좋은 기록의 수
+        return bisect_left(self._keys, key[:2]) + 1
+
+    def _entry(self, key: RankKey) -> Tuple[int, int, float, Optional[float]]:
+        negative_score, elapsed, user_id = key
+        return (self._rank_of(key), user_id, -negative_score,
+                None if elapsed == math.inf else elapsed)
@@ -0,0 +1,43 @@
+"""
+검색 색인용 토큰 분리 유틸리티
+
+한국어는 조사가 붙어 띄어쓰기 단위로는 찾기 어려우므로 음절 2-gram으로,
+영문/숫자는 단어 단위로 나눕니다. ("함수를 정의" -> 함수, 수를, 정의)
+"""
+import re
+import unicodedata
+from collections import Counter
+from typing import List
+
+_HANGUL_RUN = re.compile(r'[가-힣]+')
+_WORD = re.compile(r'[a-z0-9_]+')
+
+# 색인하는 영문/숫자 토큰 길이 범위 (최대값은 색인 테이블의 term 컬럼 길이)
+MIN_WORD_LENGTH = 2
+MAX_WORD_LENGTH = 64
+
+
+def normalize(text: str) -> str:
+    """전각 문자 등을 통일하고 소문자로 변환"""
+    return unicodedata.normalize('NFKC', text or '').lower()
+
+
+def tokenize(text: str) -> List[str]:
+    """텍스트를 색인 토큰 목록으로 분리 (중복 포함, 등장 순서 유지)"""
+    text = normalize(text)
+    tokens = []
+    for run in _HANGUL_RUN.findall(text):
+        if len(run) == 1:
+            tokens.append(run)
+        else:
+            tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+    tokens.extend(
+        word for word in _WORD.findall(text)
+        if MIN_WORD_LENGTH <= len(word) <= MAX_WORD_LENGTH
+    )
+    return tokens
+
+
+def term_frequencies(text: str) -> Counter:
+    """토큰별 등장 횟수"""
+    return Counter(tokenize(text))
@@ -0,0 +1,34 @@
+"""
+중복 행 무시 INSERT 유틸리티
+
+여러 워커가 같은 키의 행을 동시에 만들 수 있는 테이블(본문 저장소, 통계 등)에서
+먼저 조회하고 INSERT하는 대신, 이미 있으면 아무것도 하지 않는 INSERT 한 번으로
+행이 있음을 보장합니다.
+"""
+from sqlalchemy import inspect
+from app import db
+
+
+def insert_ignore(model, values: dict) -> bool:
+    """
+    기본 키가 같은 행이 없을 때만 INSERT (커밋은 호출자가 수행)
+    
+    Returns:
+        새로 추가했으면 True, 이미 있었으면 False
+    """
+    dialect = db.session.get_bind().dialect.name
+    if dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        # ON CONFLICT를 지원하지 않는 DB는 조회 후 추가
+        key = tuple(values[column.key] for column in inspect(model).primary_key)
+        if db.session.get(model, key) is not None:
+            return False
+        db.session.add(model(**values))
+        db.session.flush()
+        return True
+    
+    result = db.session.execute(insert(model).values(**values).on_conflict_do_nothing())
+    return result.rowcount == 1
@@ -0,0 +1,52 @@
+"""
+제출 본문 저장소 정리 스크립트
+
+참조하는 제출이 없는 본문(ref_count가 0 이하)을 삭제합니다.
+cron 등으로 주기적으로 실행하며, 채점 워커가 한가한 시간에 실행하는 것을 권장합니다.
+
+사용법:
+    python cleanup_blobs.py             # 참조 수가 0인 본문 삭제
+    python cleanup_blobs.py --recount   # 참조 수를 다시 계산한 뒤 삭제
+    python cleanup_blobs.py --vacuum    # 삭제 후 SQLite 파일 크기 줄이기
+"""
+import argparse
+import os
+import sys
+
+# 현재 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import text
+from app import create_app, db
+from app.services.blob_service import BlobService
+
+
+def cleanup_blobs(recount: bool, vacuum: bool):
+    """참조되지 않는 본문 삭제"""
+    app = create_app(os.environ.get('FLASK_ENV', 'development'))
+
+    with app.app_context():
+        if recount:
+            print("본문 참조 수 다시 계산 중...")
+        deleted = BlobService.collect_garbage(recount=recount)
+        print(f"참조되지 않는 본문 {deleted}개 삭제")
+
+        if vacuum:
+            if db.engine.dialect.name != 'sqlite':
+                print("VACUUM은 SQLite에서만 실행합니다 (PostgreSQL은 autovacuum이 공간을 회수)")
+                return
+            print("데이터베이스 파일 정리 중 (VACUUM)...")
+            with db.engine.connect().execution_options(isolation_level='AUTOCOMMIT') as conn:
+                conn.execute(text('VACUUM'))
+
+        print("완료!")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='제출 본문 저장소 정리')
+    parser.add_argument('--recount', action='store_true',
+                        help='삭제 전에 submissions 테이블로 참조 수를 다시 계산')
+    parser.add_argument('--vacuum', action='store_true',
+                        help='삭제 후 VACUUM으로 SQLite 파일 크기 줄이기')
+    args = parser.parse_args()
+    cleanup_blobs(args.recount, args.vacuum)
@@ -0,0 +1,96 @@
+"""
+gunicorn 설정 (프로덕션 실행)
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+여러 워커 프로세스가 각각 여러 스레드로 요청을 처리합니다(gthread). 요청 대부분은
+코드 러너 응답을 기다리는 시간이므로 프로세스보다 스레드 수를 늘리는 편이 효율적이며,
+SSE 스트림(/execute/stream, /<id>/events)은 연결이 끝날 때까지 스레드 하나를 점유합니다.
+
+모든 설정은 GUNICORN_* 환경 변수로 바꿀 수 있습니다.
+"""
+import multiprocessing
+import os
+import shutil
+
+# 서버 소켓
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:5000')
+
+# 워커 프로세스와 스레드
+workers = int(os.environ.get('GUNICORN_WORKERS', multiprocessing.cpu_count() + 1))
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', '8'))
+
+# 마스터에서 앱을 한 번 만들고 fork (메모리 공유, 시작 시 마이그레이션을 한 번만 실행)
+preload_app = os.environ.get('GUNICORN_PRELOAD', 'true').lower() == 'true'
+
+# 메모리 누수에 대비해 요청 N개를 처리한 워커를 새로 띄움 (동시에 재시작하지 않도록 jitter)
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', '1000'))
+max_requests_jitter = int(os.environ.get('GUNICORN_MAX_REQUESTS_JITTER', '100'))
+
+# 시간 제한 (초)
+# - timeout: 응답 없는 워커를 재시작하는 기준. gthread에서는 요청이 아니라 워커 상태 기준이지만
+#   동기 채점(SUBMISSION_WORKERS=0)에서는 CODE_EXECUTION_TIMEOUT x 테스트 케이스 수보다 크게 둠
+# - graceful_timeout: 재시작/종료 시 진행 중인 요청과 채점을 기다리는 시간
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', '120'))
+graceful_timeout = int(os.environ.get('GUNICORN_GRACEFUL_TIMEOUT', '60'))
+keepalive = int(os.environ.get('GUNICORN_KEEPALIVE', '5'))
+
+# 코드 변경 시 자동 재시작 (개발용, preload_app과 함께 쓰지 않음)
+reload = os.environ.get('GUNICORN_RELOAD', 'false').lower() == 'true'
+
+# 로그 (표준 출력)
+accesslog = os.environ.get('GUNICORN_ACCESS_LOG', '-')
+errorlog = '-'
+loglevel = os.environ.get('GUNICORN_LOG_LEVEL', 'info')
+
+# 채점 워커 스레드는 fork 뒤 각 워커 프로세스에서 시작 (스레드는 fork로 복제되지 않음)
+os.environ['SUBMISSION_QUEUE_AUTOSTART'] = 'false'
+
+# 여러 프로세스의 메트릭을 합쳐서 노출 (prometheus_client 임포트 전에 설정해야 함)
+os.environ.setdefault('PROMETHEUS_MULTIPROC_DIR', '/tmp/flask-metrics')
+
+
+def _reset_metrics_dir():
+    """
+    이전 실행에서 남은 메트릭 파일 정리
+
+    preload_app은 on_starting보다 먼저 앱을 불러오므로 설정을 읽을 때 정리하며,
+    HUP으로 설정을 다시 읽을 때는 실행 중인 워커의 파일을 지우지 않습니다.
+    """
+    if os.environ.get('FLASK_METRICS_DIR_OWNER') == str(os.getpid()):
+        return
+    os.environ['FLASK_METRICS_DIR_OWNER'] = str(os.getpid())
+
+    directory = os.environ['PROMETHEUS_MULTIPROC_DIR']
+    shutil.rmtree(directory, ignore_errors=True)
+    os.makedirs(directory, exist_ok=True)
+
+
+_reset_metrics_dir()
+
+
+def post_fork(server, worker):
+    """fork된 워커에서 DB 연결 풀을 새로 만들고 채점 워커 스레드 시작"""
+    from app import db
+    from app.services.submission_queue import submission_queue
+    from wsgi import app
+
+    with app.app_context():
+        # 마스터(preload)가 연 연결을 자식이 함께 쓰지 않도록 버림
+        db.engine.dispose(close=False)
+    submission_queue.start_configured()
+
+
+def worker_exit(server, worker):
+    """워커 종료 전 진행 중인 채점이 끝날 때까지 대기"""
+    from app.services.submission_queue import submission_queue
+
+    submission_queue.stop(timeout=graceful_timeout)
+
+
+def child_exit(server, worker):
+    """종료된 워커의 메트릭 파일 정리 (Gauge 값 등)"""
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
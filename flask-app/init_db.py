@@ -10,6 +10,9 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from app import create_app, db
 from app.models.user import User
 from app.models.material import Material
+from app.services.material_search_service import MaterialSearchService
+from app.services.tag_service import TagService
+from sample_problems import seed_problems, check_solutions
 
 def init_database():
     """데이터베이스 초기화 및 샘플 데이터 생성"""
@@ -223,12 +226,19 @@ print(square(5))  # 25
         
         for mat_data in materials_data:
             if not Material.query.filter_by(title=mat_data['title']).first():
+                tags = mat_data.pop('tags', None)
                 material = Material(**mat_data)
                 db.session.add(material)
+                TagService.set_material_tags(material, TagService.parse_tags(tags))
+        
+        # 샘플 실습 문제 생성
+        print("샘플 실습 문제 생성 중...")
+        seed_problems()
         
         # 변경사항 저장
         try:
             db.session.commit()
+            MaterialSearchService.ensure_index()
             print("✓ 데이터베이스 초기화 완료!")
             print("\n생성된 계정:")
             print("  관리자: admin / admin123")
@@ -237,6 +247,20 @@ print(square(5))  # 25
             db.session.rollback()
             print(f"✗ 오류 발생: {e}")
 
+
+def check_sample_solutions():
+    """샘플 문제의 정답 코드를 코드 러너로 채점하여 검증"""
+    app = create_app('development')
+    
+    with app.app_context():
+        print("정답 코드 검증 중...")
+        if not check_solutions():
+            sys.exit(1)
+
+
 if __name__ == '__main__':
     init_database()
+    
+    if '--check-solutions' in sys.argv:
+        check_sample_solutions()
 
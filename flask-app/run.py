@@ -1,5 +1,7 @@
 """
-Flask 애플리케이션 실행 스크립트
+Flask 애플리케이션 실행 스크립트 (개발 서버)
+
+프로덕션에서는 gunicorn -c gunicorn.conf.py wsgi:app 으로 실행합니다.
 """
 import os
 from app import create_app
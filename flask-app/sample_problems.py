@@ -0,0 +1,71 @@
+"""
+샘플 실습 문제 데이터 및 정답 코드 검증
+"""
+from app import db
+from app.models.problem import Problem
+from app.services.judge_service import JudgeService
+
+PROBLEMS_DATA = [
+    {
+        'id': 1,
+        'title': 'Hello World 출력하기',
+        'description': '"Hello, World!"를 출력하는 프로그램을 작성하세요.',
+        'starter_code': '# "Hello, World!"를 출력하세요\n',
+        'solution_code': 'print("Hello, World!")',
+        'test_cases': [
+            {'input': '', 'output': 'Hello, World!\n'}
+        ],
+        'compare_mode': 'exact',
+        'points': 5
+    },
+    {
+        'id': 2,
+        'title': '두 수의 합',
+        'description': '두 정수 a와 b를 표준 입력에서 한 줄에 하나씩 입력받아 합을 출력하세요.',
+        'starter_code': '# input()으로 두 정수를 한 줄씩 입력받아 합을 출력하세요\na = int(input())\n# 여기에 코드 작성',
+        'solution_code': 'a = int(input())\nb = int(input())\nprint(a + b)',
+        'test_cases': [
+            {'input': '3\n5\n', 'output': '8\n'},
+            {'input': '10\n-4\n', 'output': '6\n'},
+            {'input': '0\n0\n', 'output': '0\n'},
+            {'input': '123456789\n987654321\n', 'output': '1111111110\n'}
+        ],
+        'compare_mode': 'whitespace',
+        'points': 10
+    }
+]
+
+
+def seed_problems() -> None:
+    """샘플 문제 생성 (이미 있는 문제는 건너뜀)"""
+    for problem_data in PROBLEMS_DATA:
+        if not Problem.query.get(problem_data['id']):
+            db.session.add(Problem(**problem_data))
+
+
+def check_solutions() -> bool:
+    """
+    모든 문제의 정답 코드가 자신의 테스트 케이스를 통과하는지 확인
+    
+    Returns:
+        모든 정답 코드 통과 여부
+    """
+    all_passed = True
+    for problem in Problem.query.filter(Problem.solution_code.isnot(None)).all():
+        if not problem.test_cases:
+            continue
+        
+        success, judge_result, error = JudgeService.judge(
+            problem.solution_code, problem, fail_fast=False
+        )
+        if not success:
+            print(f"  ✗ [{problem.id}] {problem.title}: {error}")
+            all_passed = False
+        elif not judge_result['is_correct']:
+            print(f"  ✗ [{problem.id}] {problem.title}: "
+                  f"{judge_result['passed']}/{judge_result['total']} 통과")
+            all_passed = False
+        else:
+            print(f"  ✓ [{problem.id}] {problem.title}")
+    
+    return all_passed
@@ -0,0 +1,13 @@
+"""
+프로덕션 WSGI 진입점
+
+gunicorn -c gunicorn.conf.py wsgi:app
+"""
+import os
+from app import create_app
+
+# 환경 설정 (기본값은 프로덕션)
+config_name = os.environ.get('FLASK_ENV', 'production')
+
+# 앱 생성
+app = create_app(config_name)
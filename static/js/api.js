@@ -111,8 +111,9 @@ const MaterialsAPI = {
         return await apiRequest(url);
     },
     
-    async getById(id) {
-        return await apiRequest(`/materials/${id}`);
+    async getById(id, format = null) {
+        const query = format ? `?format=${encodeURIComponent(format)}` : '';
+        return await apiRequest(`/materials/${id}${query}`);
     },
     
     async getCategories() {
@@ -131,6 +132,70 @@ const SubmissionsAPI = {
         });
     },
     
+    /**
+     * 코드를 실행하며 출력 이벤트를 실시간으로 전달
+     * @param {string} code - 실행할 코드
+     * @param {Function} onEvent - {type: 'start'|'stdout'|'stderr'|'result'|'error', ...} 이벤트 콜백
+     * @returns {Promise<Object|null>} 마지막 실행 결과 (result 이벤트의 result)
+     */
+    async executeCodeStream(code, onEvent) {
+        const token = localStorage.getItem('access_token');
+        let response;
+        
+        try {
+            response = await fetch(`${API_BASE}/submissions/execute/stream`, {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json',
+                    ...(token && { 'Authorization': `Bearer ${token}` })
+                },
+                body: JSON.stringify({ code })
+            });
+        } catch (error) {
+            throw new Error('서버에 연결할 수 없습니다');
+        }
+        
+        // 스트리밍 전에 거절된 요청은 일반 JSON 오류 응답
+        if (!response.ok || !response.body) {
+            const data = await response.json().catch(() => ({}));
+            if (response.status === 401) {
+                localStorage.removeItem('access_token');
+                localStorage.removeItem('user');
+                window.location.href = '/login';
+            }
+            throw new Error(data.error || '요청 처리 중 오류가 발생했습니다');
+        }
+        
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = '';
+        let result = null;
+        
+        const handleLine = (line) => {
+            if (!line.trim()) return;
+            const event = JSON.parse(line);
+            if (event.type === 'result') {
+                result = event.result;
+            } else if (event.type === 'error') {
+                throw new Error(event.error);
+            }
+            onEvent(event);
+        };
+        
+        while (true) {
+            const { done, value } = await reader.read();
+            if (done) break;
+            
+            buffer += decoder.decode(value, { stream: true });
+            const lines = buffer.split('\n');
+            buffer = lines.pop();
+            lines.forEach(handleLine);
+        }
+        handleLine(buffer + decoder.decode());
+        
+        return result;
+    },
+    
     async submitCode(code, problemId) {
         return await apiRequest('/submissions', {
             method: 'POST',
@@ -138,17 +203,54 @@ const SubmissionsAPI = {
         });
     },
     
-    async getMySubmissions(problemId = null, page = 1, perPage = 20) {
-        let url = `/submissions/my?page=${page}&per_page=${perPage}`;
-        if (problemId) {
-            url += `&problem_id=${problemId}`;
-        }
+    async getMySubmissions(problemId = null, cursor = null, perPage = 20) {
+        const params = new URLSearchParams({ per_page: perPage });
+        if (problemId) params.append('problem_id', problemId);
+        if (cursor) params.append('cursor', cursor);
         
-        return await apiRequest(url);
+        return await apiRequest(`/submissions/my?${params.toString()}`);
+    },
+    
+    async getById(id, fields = null) {
+        const query = fields ? `?fields=${encodeURIComponent(fields.join(','))}` : '';
+        return await apiRequest(`/submissions/${id}${query}`);
     },
     
-    async getById(id) {
-        return await apiRequest(`/submissions/${id}`);
+    /**
+     * 채점이 끝날 때까지 제출 상태를 폴링
+     * 폴링은 상태만 조회하고, 채점이 끝나면 상세 정보를 한 번 조회합니다.
+     * @param {number} id - 제출 ID
+     * @param {number} intervalMs - 폴링 간격 (밀리초)
+     * @param {number} maxWaitMs - 최대 대기 시간 (밀리초)
+     * @param {Array<string>|null} fields - 채점이 끝난 뒤 조회할 필드 (null이면 전체)
+     * @returns {Promise<Object>} 채점이 끝난 제출 상세 응답
+     */
+    async waitForResult(id, intervalMs = 1000, maxWaitMs = 120000, fields = null) {
+        const deadline = Date.now() + maxWaitMs;
+        
+        while (Date.now() < deadline) {
+            const response = await this.getById(id, ['status', 'judge_result']);
+            const { status } = response.data;
+            if (status !== 'queued' && status !== 'running') {
+                return await this.getById(id, fields);
+            }
+            await new Promise(resolve => setTimeout(resolve, intervalMs));
+        }
+        
+        throw new Error('채점 결과를 기다리는 시간이 초과되었습니다');
     }
 };
 
+
+/**
+ * 제출 통계 API
+ */
+const StatsAPI = {
+    async getMine() {
+        return await apiRequest('/stats/me');
+    },
+    
+    async getProblem(problemId) {
+        return await apiRequest(`/stats/problems/${problemId}`);
+    }
+};
@@ -71,7 +71,8 @@ function getDifficultyText(difficulty) {
 async function loadMaterialDetail(materialId) {
     try {
         setLoading(true);
-        const response = await MaterialsAPI.getById(materialId);
+        // 본문은 서버에서 렌더링한 HTML로 받음
+        const response = await MaterialsAPI.getById(materialId, 'html');
         
         if (response.success) {
             renderMaterialDetail(response.data);
@@ -97,25 +98,9 @@ function renderMaterialDetail(material) {
                 ${material.difficulty ? `<span>📊 ${getDifficultyText(material.difficulty)}</span>` : ''}
                 <span>📅 ${formatDate(material.created_at)}</span>
             </div>
-            <div id="content-markdown">${escapeHtml(material.content)}</div>
+            <!-- content_html은 서버에서 허용 목록으로 정리한 HTML -->
+            <div id="content-markdown">${material.content_html}</div>
         </div>
     `;
-    
-    // Markdown 렌더링 (간단하게 pre 태그로 표시, 필요시 marked.js 등 사용)
-    const contentDiv = document.getElementById('content-markdown');
-    contentDiv.innerHTML = renderMarkdown(material.content);
-}
-
-/**
- * 간단한 Markdown 렌더링
- */
-function renderMarkdown(text) {
-    // 매우 간단한 Markdown 렌더링 (실제로는 marked.js 등 사용 권장)
-    return text
-        .replace(/```(\w+)?\n([\s\S]*?)```/g, '<pre><code>$2</code></pre>')
-        .replace(/`([^`]+)`/g, '<code>$1</code>')
-        .replace(/\*\*([^*]+)\*\*/g, '<strong>$1</strong>')
-        .replace(/\*([^*]+)\*/g, '<em>$1</em>')
-        .replace(/\n/g, '<br>');
 }
 
@@ -6,6 +6,7 @@ let currentProblemId = null;
 
 /**
  * 코드 실행 (제출하지 않음)
+ * 출력은 프로그램이 실행되는 동안 실시간으로 표시
  */
 async function executeCode() {
     const code = document.getElementById('code-editor').value;
@@ -15,12 +16,24 @@ async function executeCode() {
         return;
     }
     
+    const outputDiv = document.getElementById('output-content');
+    
     try {
         setLoading(true, 'run-btn');
-        const response = await SubmissionsAPI.executeCode(code);
         
-        if (response.success) {
-            displayOutput(response.data);
+        const result = await SubmissionsAPI.executeCodeStream(code, (event) => {
+            if (!outputDiv) return;
+            
+            if (event.type === 'start') {
+                outputDiv.className = 'output-content output-running';
+                outputDiv.textContent = '';
+            } else if (event.type === 'stdout' || event.type === 'stderr') {
+                appendOutput(outputDiv, event.data, event.type === 'stderr');
+            }
+        });
+        
+        if (result) {
+            displayOutput(result);
         }
     } catch (error) {
         showError(error.message);
@@ -30,6 +43,27 @@ async function executeCode() {
     }
 }
 
+/**
+ * 실행 중인 출력 뒤에 조각 추가
+ */
+function appendOutput(outputDiv, text, isError) {
+    const atBottom = outputDiv.scrollTop + outputDiv.clientHeight >= outputDiv.scrollHeight - 4;
+    
+    if (isError) {
+        const span = document.createElement('span');
+        span.className = 'output-error';
+        span.textContent = text;
+        outputDiv.appendChild(span);
+    } else {
+        outputDiv.appendChild(document.createTextNode(text));
+    }
+    
+    // 사용자가 위로 스크롤하지 않았다면 최신 출력을 따라감
+    if (atBottom) {
+        outputDiv.scrollTop = outputDiv.scrollHeight;
+    }
+}
+
 /**
  * 코드 제출
  */
@@ -54,10 +88,35 @@ async function submitCode() {
         setLoading(true, 'submit-btn');
         const response = await SubmissionsAPI.submitCode(code, currentProblemId);
         
-        if (response.success) {
+        if (!response.success) {
+            return;
+        }
+        
+        let { execution_result: executionResult, judge_result: judgeResult } = response.data;
+        
+        // 대기열에 들어간 제출은 채점이 끝날 때까지 기다림
+        if (!executionResult) {
+            showSuccess('제출되었습니다. 채점 중입니다...');
+            const detail = await SubmissionsAPI.waitForResult(
+                response.data.submission.id, 1000, 120000,
+                ['status', 'output', 'error', 'execution_time', 'judge_result']
+            );
+            const submission = detail.data;
+            executionResult = {
+                success: submission.status === 'success',
+                output: submission.output,
+                error: submission.error,
+                execution_time: submission.execution_time
+            };
+            judgeResult = submission.judge_result;
+        }
+        
+        if (judgeResult) {
+            showSuccess(`채점 완료: ${judgeResult.passed}/${judgeResult.total} 통과 (${judgeResult.score}점)`);
+        } else {
             showSuccess('제출이 완료되었습니다!');
-            displayOutput(response.data.execution_result);
         }
+        displayOutput(executionResult);
     } catch (error) {
         showError(error.message);
     } finally {
@@ -89,7 +148,9 @@ function displayOutput(result) {
         }
     } else {
         outputDiv.className = 'output-content output-error';
-        outputDiv.textContent = result.error || '실행 중 오류가 발생했습니다';
+        const error = result.error || '실행 중 오류가 발생했습니다';
+        // 중단되기 전까지의 출력도 함께 표시
+        outputDiv.textContent = result.output ? `${result.output}\n${error}` : error;
     }
     
     // 출력 섹션 스크롤
@@ -98,14 +159,17 @@ function displayOutput(result) {
 
 /**
  * 내 제출 기록 로드
+ * @param {number|null} problemId - 문제 ID (없으면 전체)
+ * @param {string|null} cursor - 이전 응답의 next_cursor (없으면 첫 페이지)
  */
-async function loadMySubmissions(problemId = null, page = 1) {
+async function loadMySubmissions(problemId = null, cursor = null) {
     try {
         setLoading(true);
-        const response = await SubmissionsAPI.getMySubmissions(problemId, page);
+        const response = await SubmissionsAPI.getMySubmissions(problemId, cursor);
         
         if (response.success) {
-            renderSubmissions(response.data);
+            renderSubmissions(response.data, Boolean(cursor));
+            renderLoadMore(problemId, response.data.next_cursor);
         }
     } catch (error) {
         showError(error.message);
@@ -116,21 +180,23 @@ async function loadMySubmissions(problemId = null, page = 1) {
 
 /**
  * 제출 기록 렌더링
+ * @param {Object} data - 제출 기록 응답 데이터
+ * @param {boolean} append - 기존 목록 뒤에 이어 붙일지 여부
  */
-function renderSubmissions(data) {
+function renderSubmissions(data, append = false) {
     const container = document.getElementById('submissions-list');
     
-    if (!data.submissions || data.submissions.length === 0) {
+    if (!append && (!data.submissions || data.submissions.length === 0)) {
         container.innerHTML = '<p class="text-center">제출 기록이 없습니다.</p>';
         return;
     }
     
-    container.innerHTML = data.submissions.map(submission => `
+    const html = data.submissions.map(submission => `
         <div class="submission-card" onclick="viewSubmission(${submission.id})">
             <div class="submission-header">
                 <div>
                     <span class="submission-status status-${submission.status}">
-                        ${submission.status === 'success' ? '✓ 성공' : '✗ 실패'}
+                        ${formatSubmissionStatus(submission.status)}
                     </span>
                     <span style="margin-left: 1rem;">문제 #${submission.problem_id}</span>
                 </div>
@@ -138,25 +204,54 @@ function renderSubmissions(data) {
             </div>
             <div class="submission-meta">
                 <span>⏱️ ${formatExecutionTime(submission.execution_time || 0)}</span>
-                <span>📝 ${submission.code.length}자</span>
+                <span>📝 ${submission.code_length}자</span>
             </div>
             <div class="submission-code">
-                <code>${escapeHtml(submission.code.substring(0, 200))}${submission.code.length > 200 ? '...' : ''}</code>
+                <code>${escapeHtml(submission.code_preview)}${submission.code_length > submission.code_preview.length ? '...' : ''}</code>
             </div>
         </div>
     `).join('');
     
-    // 페이지네이션 표시 (간단하게)
-    if (data.pages > 1) {
-        const pagination = document.getElementById('pagination');
-        if (pagination) {
-            pagination.innerHTML = `
-                <div style="text-align: center; margin-top: 2rem;">
-                    페이지 ${data.page} / ${data.pages}
-                </div>
-            `;
-        }
+    if (append) {
+        container.insertAdjacentHTML('beforeend', html);
+    } else {
+        container.innerHTML = html;
+    }
+}
+
+/**
+ * 다음 페이지가 있으면 "더 보기" 버튼 표시
+ * @param {number|null} problemId - 문제 ID
+ * @param {string|null} nextCursor - 다음 페이지 커서
+ */
+function renderLoadMore(problemId, nextCursor) {
+    const pagination = document.getElementById('pagination');
+    if (!pagination) return;
+    
+    pagination.innerHTML = '';
+    if (!nextCursor) return;
+    
+    const button = document.createElement('button');
+    button.className = 'btn btn-secondary';
+    button.textContent = '더 보기';
+    button.addEventListener('click', () => loadMySubmissions(problemId, nextCursor));
+    
+    const wrapper = document.createElement('div');
+    wrapper.style.cssText = 'text-align: center; margin-top: 2rem;';
+    wrapper.appendChild(button);
+    pagination.appendChild(wrapper);
+}
+
+/**
+ * 제출 상태 표시 문자열
+ * @param {string} status - 제출 상태
+ * @returns {string} 표시할 문자열
+ */
+function formatSubmissionStatus(status) {
+    if (status === 'queued' || status === 'running') {
+        return '⏳ 채점 중';
     }
+    return status === 'success' ? '✓ 성공' : '✗ 실패';
 }
 
 /**
@@ -0,0 +1,41 @@
+/**
+ * 내 풀이 통계 기능
+ */
+
+/**
+ * 내 풀이 통계 요약 로드 및 렌더링
+ */
+async function loadMyStats() {
+    const container = document.getElementById('stats-summary');
+    
+    try {
+        const response = await StatsAPI.getMine();
+        
+        if (response.success) {
+            renderStatsSummary(container, response.data.summary);
+        }
+    } catch (error) {
+        // 통계는 보조 정보이므로 실패해도 제출 기록은 그대로 표시
+        container.innerHTML = '';
+    }
+}
+
+/**
+ * 통계 요약 카드 렌더링
+ * @param {HTMLElement} container - 요약을 표시할 요소
+ * @param {Object} summary - 통계 요약 (시도/해결한 문제 수, 전체 제출 수)
+ */
+function renderStatsSummary(container, summary) {
+    const items = [
+        { label: '해결한 문제', value: summary.solved_problems },
+        { label: '시도한 문제', value: summary.attempted_problems },
+        { label: '전체 제출', value: summary.total_attempts }
+    ];
+    
+    container.innerHTML = items.map(item => `
+        <div class="stats-card">
+            <div class="stats-value">${item.value}</div>
+            <div class="stats-label">${item.label}</div>
+        </div>
+    `).join('');
+}